@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Per-instance memory of GitHubProject.
+
+Compares the slotted model (with and without the raw payload kept) against the
+previous dict-based model that stored every unused API field in
+``additional_data``. Run from the repository root:
+
+    python benchmarks/bench_github_project.py [count]
+"""
+
+import gc
+import json
+import sys
+import os
+import tracemalloc
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from models.github_project import GitHubProject
+
+
+def sample_payload(i):
+    """Build a repository payload shaped like GET /repos/{owner}/{repo}."""
+    owner = {
+        'login': f'owner{i}', 'id': 1000 + i, 'node_id': f'MDQ6VXNlcj{i}',
+        'avatar_url': f'https://avatars.githubusercontent.com/u/{1000 + i}?v=4',
+        'gravatar_id': '', 'url': f'https://api.github.com/users/owner{i}',
+        'html_url': f'https://github.com/owner{i}', 'type': 'User', 'site_admin': False,
+        **{f'{name}_url': f'https://api.github.com/users/owner{i}/{name}'
+           for name in ('followers', 'following', 'gists', 'starred', 'subscriptions',
+                        'organizations', 'repos', 'events', 'received_events')}
+    }
+    full_name = f'owner{i}/repo{i}'
+    api = f'https://api.github.com/repos/{full_name}'
+    payload = {
+        'id': 2000 + i, 'node_id': f'MDEwOlJlcG9zaXRvcnk{i}', 'name': f'repo{i}',
+        'full_name': full_name, 'private': False, 'owner': owner,
+        'html_url': f'https://github.com/{full_name}',
+        'description': f'Repository number {i} used for benchmarking the project model',
+        'fork': False, 'url': api,
+        'created_at': '2019-03-01T12:00:00Z', 'updated_at': '2024-05-06T15:04:05Z',
+        'pushed_at': '2024-05-06T15:04:05Z', 'git_url': f'git://github.com/{full_name}.git',
+        'ssh_url': f'git@github.com:{full_name}.git', 'clone_url': f'https://github.com/{full_name}.git',
+        'svn_url': f'https://github.com/{full_name}', 'homepage': f'https://repo{i}.example.com',
+        'size': 12345 + i, 'stargazers_count': 100 + i, 'watchers_count': 100 + i,
+        'language': 'Python', 'has_issues': True, 'has_projects': True, 'has_downloads': True,
+        'has_wiki': True, 'has_pages': False, 'has_discussions': False, 'forks_count': 10 + i,
+        'mirror_url': None, 'archived': False, 'disabled': False, 'open_issues_count': i % 50,
+        'license': {'key': 'mit', 'name': 'MIT License', 'spdx_id': 'MIT',
+                    'url': 'https://api.github.com/licenses/mit', 'node_id': 'MDc6TGljZW5zZTEz'},
+        'allow_forking': True, 'is_template': False, 'web_commit_signoff_required': False,
+        'topics': ['python', 'benchmark', 'github'], 'visibility': 'public', 'forks': 10 + i,
+        'open_issues': i % 50, 'watchers': 100 + i, 'default_branch': 'main',
+        'permissions': {'admin': False, 'maintain': False, 'push': False, 'triage': False, 'pull': True},
+        'network_count': 10 + i, 'subscribers_count': 5 + i, 'temp_clone_token': None
+    }
+    for name in ('forks', 'keys', 'collaborators', 'teams', 'hooks', 'issue_events', 'events',
+                 'assignees', 'branches', 'tags', 'blobs', 'git_tags', 'git_refs', 'trees',
+                 'statuses', 'languages', 'stargazers', 'contributors', 'subscribers',
+                 'subscription', 'commits', 'git_commits', 'comments', 'issue_comment',
+                 'contents', 'compare', 'merges', 'archive', 'downloads', 'issues', 'pulls',
+                 'milestones', 'notifications', 'labels', 'releases', 'deployments'):
+        payload[f'{name}_url'] = f'{api}/{name}'
+    return payload
+
+
+class LegacyGitHubProject:
+    """The previous model: a regular class keeping unused fields in additional_data."""
+
+    def __init__(self, name, full_name=None, html_url=None, description=None, language=None,
+                 stargazers_count=0, forks_count=0, open_issues_count=0, created_at=None,
+                 updated_at=None, **kwargs):
+        self.name = name
+        self.full_name = full_name or name
+        self.html_url = html_url
+        self.description = description or "No description available"
+        self.language = language
+        self.stargazers_count = stargazers_count
+        self.forks_count = forks_count
+        self.open_issues_count = open_issues_count
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.additional_data = kwargs
+
+
+def measure(label, build, payloads):
+    """Measure retained bytes per instance for objects built from the payloads."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(payload) for payload in payloads]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    per_instance = (after - before) / len(objects)
+    print(f"{label:<32} {per_instance:>10,.0f} bytes/instance")
+    del objects
+    return per_instance
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    # Each instance decodes its own response body, as it would from the API
+    payloads = [json.dumps(sample_payload(i)) for i in range(count)]
+    print(f"GitHubProject memory, {count:,} instances (response bodies excluded)")
+    print("-" * 56)
+
+    legacy = measure("legacy (additional_data)", lambda p: LegacyGitHubProject(**json.loads(p)), payloads)
+    slotted = measure("slotted", lambda p: GitHubProject.from_api_response(json.loads(p)), payloads)
+    raw = measure("slotted + keep_raw",
+                  lambda p: GitHubProject.from_api_response(json.loads(p), keep_raw=True), payloads)
+
+    print("-" * 56)
+    print(f"slotted uses {slotted / legacy:.1%} of legacy; with raw payload {raw / legacy:.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,19 +7,21 @@ with additional options and features.
 """
 
 import argparse
+import csv
 import sys
 import os
-import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
 from models.proposal import Proposal
-from models.github_project import GitHubProject
-from services.github_api import GitHubAPI, GitHubAPIError
+from services.github_api import GitHubAPIError, get_github_api
 from services.proposal_generator import ProposalGenerator
 from utils.validators import validate_and_sanitize_proposal, validate_github_repo_name
+from utils.json_backend import dumps, loads
 
 
 def create_parser():
@@ -34,6 +36,10 @@ Examples:
   python cli.py --interactive
   
   python cli.py microsoft/vscode "Add Feature" "Add new feature to improve user experience" "Implement feature X; Add tests; Update docs" --output proposal.md
+  
+  python cli.py --batch proposals.csv --workers 16 --output results.jsonl
+  
+  python cli.py --batch proposals.jsonl --output-dir proposals/
         """
     )
     
@@ -90,6 +96,26 @@ Examples:
         help='Only validate inputs without generating proposal'
     )
     
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help='Generate proposals for every row of a CSV or JSONL file '
+             '(columns: repository, title, description, conclusions)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of concurrent repository fetches in batch mode (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--output-dir',
+        help='Batch mode: write one Markdown file per proposal into this directory '
+             'instead of streaming JSONL'
+    )
+    
     return parser
 
 
@@ -115,9 +141,8 @@ def validate_inputs(repository, title, description, conclusions):
 def fetch_github_project(repository):
     """Fetch GitHub project data."""
     try:
-        github_api = GitHubAPI()
-        project_data = github_api.fetch_project_data(repository)
-        return GitHubProject.from_api_response(project_data)
+        github_api = get_github_api()
+        return github_api.get_project(repository)
     except GitHubAPIError as e:
         print(f"❌ GitHub API Error: {e}")
         sys.exit(1)
@@ -140,7 +165,7 @@ def save_to_file(content, output_path, is_json=False):
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
             if is_json:
-                json.dump({"proposal": content, "generated_at": datetime.now().isoformat()}, f, indent=2)
+                f.write(dumps({"proposal": content, "generated_at": datetime.now().isoformat()}, indent=2))
             else:
                 f.write(content)
         return output_path
@@ -149,11 +174,171 @@ def save_to_file(content, output_path, is_json=False):
         return None
 
 
+BATCH_FIELDS = ('repository', 'title', 'description', 'conclusions')
+
+
+def read_batch_rows(path):
+    """
+    Read batch input rows from a CSV or JSONL file.
+    
+    Files ending in .jsonl/.ndjson (or whose first character is '{') are read as
+    JSON Lines; anything else is read as CSV with a header row. A JSON line that
+    cannot be parsed into an object does not stop the batch: its row carries an
+    'error' key instead. A leading UTF-8 byte order mark, as written by Excel, is
+    ignored.
+    
+    Yields:
+        Dictionaries with repository, title, description and conclusions keys
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        first = f.read(1)
+        f.seek(0)
+        if path.lower().endswith(('.jsonl', '.ndjson')) or first == '{':
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = loads(line)
+                    if not isinstance(row, dict):
+                        raise ValueError('expected a JSON object')
+                except ValueError as e:
+                    yield dict({field: '' for field in BATCH_FIELDS}, error=f'Invalid JSON line: {e}')
+                    continue
+                yield {field: str(row.get(field) or '') for field in BATCH_FIELDS}
+        else:
+            for row in csv.DictReader(f):
+                yield {field: (row.get(field) or '') for field in BATCH_FIELDS}
+
+
+def generate_batch_row(index, row, github_project, proposal_generator):
+    """Validate one batch row and generate its proposal against a fetched project."""
+    try:
+        title, description, conclusions = validate_and_sanitize_proposal(
+            row['title'], row['description'], row['conclusions']
+        )
+    except ValueError as e:
+        return {'row': index, 'repository': row['repository'], 'error': f'Validation Error: {e}'}
+    
+    proposal = Proposal(title=title, description=description, conclusions=conclusions)
+    return {
+        'row': index,
+        'repository': github_project.full_name,
+        'title': title,
+        'proposal': proposal_generator.generate(proposal, github_project),
+        'generated_at': datetime.now().isoformat()
+    }
+
+
+def write_batch_result(result, stream, output_dir):
+    """Write one batch result as a JSONL line or a Markdown file."""
+    if not output_dir:
+        stream.write(dumps(result) + '\n')
+        stream.flush()
+    elif 'error' in result:
+        print(f"❌ Row {result['row']} ({result['repository']}): {result['error']}", file=sys.stderr)
+    else:
+        filename = f"{result['row']:05d}_{result['repository'].replace('/', '_')}.md"
+        with open(os.path.join(output_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(result['proposal'])
+
+
+def run_batch(args):
+    """Generate proposals for every row of a batch file."""
+    started = time.perf_counter()
+    
+    # Group rows by repository so each repository is fetched once
+    rows_by_repo = {}
+    errors = []
+    total_rows = 0
+    for index, row in enumerate(read_batch_rows(args.batch), 1):
+        total_rows += 1
+        repository = row['repository'].strip()
+        if 'error' in row:
+            errors.append({'row': index, 'repository': repository, 'error': row['error']})
+            continue
+        try:
+            validate_github_repo_name(repository)
+        except ValueError as e:
+            errors.append({'row': index, 'repository': repository, 'error': str(e)})
+            continue
+        rows_by_repo.setdefault(repository.lower(), []).append((index, row))
+    
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        stream = None
+    elif args.output and not args.no_save:
+        stream = open(args.output, 'w', encoding='utf-8')
+    else:
+        stream = sys.stdout
+    
+    succeeded = 0
+    failed = 0
+    try:
+        for result in errors:
+            write_batch_result(result, stream, args.output_dir)
+            failed += 1
+        
+        github_api = get_github_api()
+        proposal_generator = ProposalGenerator()
+        
+        # Warm the metadata cache with a few batched GraphQL queries when possible;
+        # anything not fetched here falls back to one REST call per repository
+        if github_api.is_authenticated and len(rows_by_repo) > 1:
+            try:
+                github_api.fetch_many_projects(rows[0][1]['repository'].strip() for rows in rows_by_repo.values())
+            except GitHubAPIError:
+                pass
+        
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = {
+                executor.submit(github_api.get_project, rows[0][1]['repository'].strip()): rows
+                for rows in rows_by_repo.values()
+            }
+            for future in as_completed(futures):
+                rows = futures[future]
+                try:
+                    github_project = future.result()
+                except GitHubAPIError as e:
+                    github_project = None
+                    error = f'GitHub API Error: {e}'
+                
+                for index, row in rows:
+                    if github_project is None:
+                        result = {'row': index, 'repository': row['repository'], 'error': error}
+                    else:
+                        result = generate_batch_row(index, row, github_project, proposal_generator)
+                    write_batch_result(result, stream, args.output_dir)
+                    if 'error' in result:
+                        failed += 1
+                    else:
+                        succeeded += 1
+    finally:
+        if stream is not None and stream is not sys.stdout:
+            stream.close()
+    
+    elapsed = time.perf_counter() - started
+    rate = succeeded / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{'✅' if failed == 0 else '⚠️'} Batch complete: {succeeded} generated, {failed} failed, "
+        f"{total_rows} rows, {len(rows_by_repo)} unique repositories "
+        f"in {elapsed:.2f}s ({rate:.1f} proposals/s)",
+        file=sys.stderr
+    )
+    return failed == 0
+
+
 def main():
     """Main CLI function."""
     parser = create_parser()
     args = parser.parse_args()
     
+    # Batch mode
+    if args.batch:
+        if not run_batch(args):
+            sys.exit(1)
+        return
+    
     # Interactive mode
     if args.interactive or (not args.repository and not args.title):
         interactive_mode()
@@ -188,7 +373,7 @@ def main():
     if args.no_save:
         if args.json:
             output = {"proposal": proposal_content, "generated_at": datetime.now().isoformat()}
-            print(json.dumps(output, indent=2))
+            print(dumps(output, indent=2))
         else:
             print(proposal_content)
     else:
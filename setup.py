@@ -22,8 +22,11 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/github-proposal-generator",
-    packages=find_packages(where="src"),
+    # Proposal templates live in src/templates, next to the config package that
+    # locates them (see PROPOSAL_TEMPLATE_DIR)
+    packages=find_packages(where="src") + ["templates"],
     package_dir={"": "src"},
+    package_data={"templates": ["*.md"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -39,6 +42,19 @@ setup(
     python_requires=">=3.7",
     install_requires=requirements,
     extras_require={
+        "analytics": [
+            "numpy>=1.20",
+        ],
+        "fast-json": [
+            "orjson>=3.6",
+        ],
+        "compression": [
+            "brotli>=1.0",
+        ],
+        "production": [
+            "gunicorn>=20.1; platform_system != 'Windows'",
+            "waitress>=2.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
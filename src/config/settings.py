@@ -31,3 +31,111 @@ NETWORK_ERROR_MESSAGE = "Network connection error. Please check your internet co
 OUTPUT_FORMAT = 'markdown'
 INCLUDE_TIMESTAMPS = True
 INCLUDE_PROJECT_STATS = True
+
+# HTTP Connection Pool Configuration
+GITHUB_POOL_CONNECTIONS = int(os.getenv('GITHUB_POOL_CONNECTIONS', '4'))
+GITHUB_POOL_MAXSIZE = int(os.getenv('GITHUB_POOL_MAXSIZE', '20'))
+GITHUB_POOL_BLOCK = os.getenv('GITHUB_POOL_BLOCK', 'false').lower() == 'true'
+GITHUB_REQUEST_TIMEOUT = float(os.getenv('GITHUB_REQUEST_TIMEOUT', '30'))
+GITHUB_CONNECT_TIMEOUT = float(os.getenv('GITHUB_CONNECT_TIMEOUT', '5'))
+
+# Conditional Request (ETag) Cache Configuration
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv('HTTP_CACHE_MAX_ENTRIES', '512'))
+
+# Repository Metadata Cache Configuration
+REPO_CACHE_ENABLED = os.getenv('REPO_CACHE_ENABLED', 'true').lower() == 'true'
+REPO_CACHE_MAX_ENTRIES = int(os.getenv('REPO_CACHE_MAX_ENTRIES', '256'))
+REPO_CACHE_TTL = float(os.getenv('REPO_CACHE_TTL', '300'))
+REPO_CACHE_STALE_TTL = float(os.getenv('REPO_CACHE_STALE_TTL', '600'))
+
+# Persistent Response Cache Configuration
+PERSISTENT_CACHE_ENABLED = os.getenv('PERSISTENT_CACHE_ENABLED', 'false').lower() == 'true'
+CACHE_DIR = os.getenv('CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'github-proposal-generator'))
+PERSISTENT_CACHE_MAX_AGE = float(os.getenv('PERSISTENT_CACHE_MAX_AGE', str(7 * 24 * 3600)))
+PERSISTENT_CACHE_MAX_BYTES = int(os.getenv('PERSISTENT_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+PERSISTENT_CACHE_FRESH_TTL = float(os.getenv('PERSISTENT_CACHE_FRESH_TTL', '60'))
+
+# Async Client Configuration
+ASYNC_MAX_CONCURRENCY = int(os.getenv('ASYNC_MAX_CONCURRENCY', '10'))
+
+# GraphQL Configuration
+GITHUB_GRAPHQL_URL = os.getenv('GITHUB_GRAPHQL_URL', '')
+# Repositories per batched query (halved when README text is requested)
+GRAPHQL_BATCH_SIZE = int(os.getenv('GRAPHQL_BATCH_SIZE', '50'))
+
+# Rate Limit Scheduler Configuration
+RATE_LIMIT_MAX_WAIT = float(os.getenv('RATE_LIMIT_MAX_WAIT', '10'))
+RATE_LIMIT_PACE_BELOW = float(os.getenv('RATE_LIMIT_PACE_BELOW', '0.1'))
+
+# Retry and Circuit Breaker Configuration
+GITHUB_MAX_RETRIES = int(os.getenv('GITHUB_MAX_RETRIES', '2'))
+GITHUB_RETRY_BASE_DELAY = float(os.getenv('GITHUB_RETRY_BASE_DELAY', '0.5'))
+GITHUB_RETRY_MAX_DELAY = float(os.getenv('GITHUB_RETRY_MAX_DELAY', '8'))
+GITHUB_RETRY_BUDGET_RATIO = float(os.getenv('GITHUB_RETRY_BUDGET_RATIO', '0.2'))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv('CIRCUIT_RESET_TIMEOUT', '30'))
+
+# Proposal Template Configuration
+PROPOSAL_TEMPLATE_DIR = os.getenv(
+    'PROPOSAL_TEMPLATE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+)
+DEFAULT_PROPOSAL_TEMPLATE = os.getenv('DEFAULT_PROPOSAL_TEMPLATE', 'comprehensive')
+TEMPLATE_AUTO_RELOAD = os.getenv('TEMPLATE_AUTO_RELOAD', 'true').lower() == 'true'
+
+# Proposal History Configuration
+PROPOSAL_HISTORY_LIMIT = int(os.getenv('PROPOSAL_HISTORY_LIMIT', '100'))
+PROPOSAL_HISTORY_COMPACT = os.getenv('PROPOSAL_HISTORY_COMPACT', 'false').lower() == 'true'
+PROPOSAL_HISTORY_SPILL_DIR = os.getenv('PROPOSAL_HISTORY_SPILL_DIR', '')
+
+# JSON Backend Configuration ('auto' picks orjson, then ujson, then the stdlib)
+JSON_BACKEND = os.getenv('JSON_BACKEND', 'auto').lower()
+
+# Repository Search Configuration
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '128'))
+SEARCH_CACHE_TTL = float(os.getenv('SEARCH_CACHE_TTL', '300'))
+SEARCH_MIN_STARS = int(os.getenv('SEARCH_MIN_STARS', '10'))
+SEARCH_MIN_FORKS = int(os.getenv('SEARCH_MIN_FORKS', '2'))
+
+# HTTP Response Configuration
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_LEVEL = int(os.getenv('COMPRESSION_LEVEL', '6'))
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', '5'))
+STATIC_MAX_AGE = int(os.getenv('STATIC_MAX_AGE', str(365 * 24 * 3600)))
+VALIDATE_REPO_MAX_AGE = int(os.getenv('VALIDATE_REPO_MAX_AGE', '60'))
+
+# Repository Prefetch Configuration
+PREFETCH_ENABLED = os.getenv('PREFETCH_ENABLED', 'true').lower() == 'true'
+PREFETCH_WORKERS = int(os.getenv('PREFETCH_WORKERS', '2'))
+PREFETCH_MAX_PENDING = int(os.getenv('PREFETCH_MAX_PENDING', '16'))
+PREFETCH_TTL = float(os.getenv('PREFETCH_TTL', '120'))
+
+# Background Job Configuration ('sqlite' lets every web worker answer status polls)
+JOB_STORE = os.getenv('JOB_STORE', 'sqlite').lower()
+JOB_DB_PATH = os.getenv('JOB_DB_PATH', '')
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '4'))
+JOB_MAX_QUEUED = int(os.getenv('JOB_MAX_QUEUED', '32'))
+JOB_RESULT_TTL = float(os.getenv('JOB_RESULT_TTL', '600'))
+JOB_TIMEOUT = float(os.getenv('JOB_TIMEOUT', '600'))
+
+# Rendered Proposal Cache Configuration
+RENDER_CACHE_ENABLED = os.getenv('RENDER_CACHE_ENABLED', 'true').lower() == 'true'
+RENDER_CACHE_MAX_ENTRIES = int(os.getenv('RENDER_CACHE_MAX_ENTRIES', '256'))
+RENDER_CACHE_TTL = float(os.getenv('RENDER_CACHE_TTL', '3600'))
+
+# Local Repository Index Configuration
+REPO_INDEX_ENABLED = os.getenv('REPO_INDEX_ENABLED', 'true').lower() == 'true'
+REPO_INDEX_MAX_DOCUMENTS = int(os.getenv('REPO_INDEX_MAX_DOCUMENTS', '5000'))
+REPO_INDEX_MIN_RESULTS = int(os.getenv('REPO_INDEX_MIN_RESULTS', '10'))
+REPO_INDEX_PATH = os.getenv('REPO_INDEX_PATH', '')
+
+# Web Server Configuration (WEB_WORKERS=0 derives the worker count from the CPU count)
+WEB_HOST = os.getenv('WEB_HOST', '0.0.0.0')
+WEB_PORT = int(os.getenv('WEB_PORT', '5000'))
+WEB_SERVER = os.getenv('WEB_SERVER', 'auto').lower()
+WEB_WORKERS = int(os.getenv('WEB_WORKERS', '0'))
+WEB_THREADS = int(os.getenv('WEB_THREADS', '4'))
+WEB_TIMEOUT = int(os.getenv('WEB_TIMEOUT', '60'))
+WEB_GRACEFUL_TIMEOUT = int(os.getenv('WEB_GRACEFUL_TIMEOUT', '30'))
@@ -7,7 +7,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from models.proposal import Proposal
 from models.github_project import GitHubProject
-from services.github_api import GitHubAPI, GitHubAPIError
+from services.github_api import GitHubAPIError, get_github_api
 from services.proposal_generator import ProposalGenerator
 from utils.validators import validate_and_sanitize_proposal, validate_github_repo_name
 from config.settings import PROJECT_NAME
@@ -78,9 +78,8 @@ def get_github_project() -> Optional[GitHubProject]:
     print(f"\n🌐 Fetching project data for '{project_name}'...")
     
     try:
-        github_api = GitHubAPI()
-        project_data = github_api.fetch_project_data(project_name)
-        github_project = GitHubProject.from_api_response(project_data)
+        github_api = get_github_api()
+        github_project = github_api.get_project(project_name)
         
         print("✅ Project data fetched successfully!")
         print(f"\nProject: {github_project.full_name}")
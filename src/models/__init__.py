@@ -6,5 +6,6 @@ This package contains data models for proposals and GitHub projects.
 
 from .proposal import Proposal
 from .github_project import GitHubProject
+from .project_table import ProjectTable
 
-__all__ = ['Proposal', 'GitHubProject']
+__all__ = ['Proposal', 'GitHubProject', 'ProjectTable']
@@ -1,13 +1,32 @@
-from typing import Optional, Dict, Any
+import json
+from typing import Optional, Dict, Any, Iterable
 from datetime import datetime
 
 
 class GitHubProject:
+    """
+    Repository model holding only the fields the application uses.
+    
+    Instances are slotted, so the ~80 other fields of a GitHub API payload are
+    not kept. Pass ``keep_raw=True`` to ``from_api_response`` to retain the full
+    payload as compact JSON bytes, decoded only when ``raw`` or
+    ``additional_data`` is accessed.
+    """
+
+    __slots__ = (
+        'name', 'full_name', 'html_url', 'description', 'language',
+        'stargazers_count', 'forks_count', 'open_issues_count',
+        'created_at', 'updated_at', 'topics', '_raw'
+    )
+
+    FIELDS = __slots__[:-1]
+
     def __init__(self, name: str, full_name: str = None, html_url: str = None, 
                  description: str = None, language: str = None, 
                  stargazers_count: int = 0, forks_count: int = 0,
                  open_issues_count: int = 0, created_at: str = None,
-                 updated_at: str = None, **kwargs):
+                 updated_at: str = None, topics: Iterable[str] = None,
+                 raw: Optional[bytes] = None, **kwargs):
         self.name = name
         self.full_name = full_name or name
         self.html_url = html_url
@@ -18,14 +37,50 @@ class GitHubProject:
         self.open_issues_count = open_issues_count
         self.created_at = created_at
         self.updated_at = updated_at
+        self.topics = tuple(topics) if topics else ()
         
-        # Store any additional data
-        self.additional_data = kwargs
+        # Any other API fields are dropped unless the raw payload is kept
+        self._raw = raw
 
     @classmethod
-    def from_api_response(cls, api_data: Dict[str, Any]) -> 'GitHubProject':
-        """Create GitHubProject instance from GitHub API response."""
-        return cls(**api_data)
+    def from_api_response(cls, api_data: Dict[str, Any], keep_raw: bool = False) -> 'GitHubProject':
+        """
+        Create GitHubProject instance from GitHub API response.
+        
+        Args:
+            api_data: Repository payload from the REST API
+            keep_raw: Whether to retain the full payload (see ``raw``)
+        """
+        raw = json.dumps(api_data, separators=(',', ':')).encode('utf-8') if keep_raw else None
+        return cls(
+            name=api_data.get('name'),
+            full_name=api_data.get('full_name'),
+            html_url=api_data.get('html_url'),
+            description=api_data.get('description'),
+            language=api_data.get('language'),
+            stargazers_count=api_data.get('stargazers_count', 0),
+            forks_count=api_data.get('forks_count', 0),
+            open_issues_count=api_data.get('open_issues_count', 0),
+            created_at=api_data.get('created_at'),
+            updated_at=api_data.get('updated_at'),
+            topics=api_data.get('topics'),
+            raw=raw
+        )
+
+    @property
+    def raw(self) -> Optional[Dict[str, Any]]:
+        """The full API payload, decoded on access, or None if it was not kept."""
+        if self._raw is None:
+            return None
+        return json.loads(self._raw)
+
+    @property
+    def additional_data(self) -> Dict[str, Any]:
+        """API fields beyond the model's own, available when the raw payload was kept."""
+        raw = self.raw
+        if raw is None:
+            return {}
+        return {key: value for key, value in raw.items() if key not in self.FIELDS}
 
     def get_project_stats(self) -> str:
         """Get formatted project statistics."""
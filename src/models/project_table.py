@@ -0,0 +1,270 @@
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Union
+from .github_project import GitHubProject
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
+
+
+NUMERIC_COLUMNS = ('stargazers_count', 'forks_count', 'open_issues_count')
+DATE_COLUMNS = ('created_at', 'updated_at')
+TEXT_COLUMNS = ('name', 'full_name', 'html_url', 'description', 'language')
+COLUMNS = TEXT_COLUMNS + NUMERIC_COLUMNS + DATE_COLUMNS
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "ProjectTable requires NumPy. Install it with "
+            "'pip install github-proposal-generator[analytics]' or 'pip install numpy'."
+        )
+
+
+def _to_datetime64(value: Optional[str]):
+    """Parse a GitHub ISO 8601 timestamp ('2024-05-06T15:04:05Z') to datetime64[s]."""
+    if not value:
+        return np.datetime64('NaT', 's')
+    if value.endswith('Z'):
+        value = value[:-1]
+    try:
+        return np.datetime64(value, 's')
+    except ValueError:
+        return np.datetime64('NaT', 's')
+
+
+def _from_datetime64(value) -> Optional[str]:
+    """Format a datetime64 back to GitHub's timestamp form, or None for NaT."""
+    if np.isnat(value):
+        return None
+    return f"{np.datetime_as_string(value, unit='s')}Z"
+
+
+class ProjectTable:
+    """
+    Columnar collection of repositories backed by NumPy arrays.
+
+    Stars, forks and open issues are stored as int64 arrays and the created/
+    updated timestamps as datetime64[s] (NaT when missing), so filtering,
+    sorting, top-k and aggregates run vectorized instead of looping over
+    ``GitHubProject`` objects. Rows are materialized as ``GitHubProject``
+    instances only when indexed or iterated.
+
+    Requires the optional ``numpy`` dependency.
+
+    Args:
+        columns: Mapping of column name to a 1-D array, one entry per repository
+    """
+
+    def __init__(self, columns: Dict[str, Any]):
+        _require_numpy()
+        missing = [name for name in COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        self._columns = {}
+        for name in TEXT_COLUMNS:
+            self._columns[name] = np.asarray(columns[name], dtype=object)
+        for name in NUMERIC_COLUMNS:
+            self._columns[name] = np.asarray(columns[name], dtype=np.int64)
+        for name in DATE_COLUMNS:
+            self._columns[name] = np.asarray(columns[name], dtype='datetime64[s]')
+        lengths = {len(array) for array in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+
+    @classmethod
+    def from_api_response(cls, items: Iterable[Dict[str, Any]]) -> 'ProjectTable':
+        """
+        Build a table from repository payloads (REST, GraphQL-converted or search items).
+
+        Args:
+            items: Repository dictionaries as returned by the GitHub API
+        """
+        _require_numpy()
+        items = list(items)
+        columns = {}
+        for name in TEXT_COLUMNS:
+            columns[name] = [item.get(name) for item in items]
+        # full_name falls back to name, as in GitHubProject
+        columns['full_name'] = [full or name for full, name in zip(columns['full_name'], columns['name'])]
+        for name in NUMERIC_COLUMNS:
+            columns[name] = np.fromiter((item.get(name) or 0 for item in items),
+                                        dtype=np.int64, count=len(items))
+        for name in DATE_COLUMNS:
+            columns[name] = np.array([_to_datetime64(item.get(name)) for item in items],
+                                     dtype='datetime64[s]')
+        return cls(columns)
+
+    @classmethod
+    def from_search_response(cls, payload: Dict[str, Any]) -> 'ProjectTable':
+        """Build a table from a ``/search/repositories`` response."""
+        return cls.from_api_response(payload.get('items', []))
+
+    @classmethod
+    def from_projects(cls, projects: Iterable[GitHubProject]) -> 'ProjectTable':
+        """Build a table from existing ``GitHubProject`` instances."""
+        return cls.from_api_response(project.to_dict() for project in projects)
+
+    def __len__(self) -> int:
+        return len(self._columns['name'])
+
+    def __getitem__(self, key: Union[int, slice, Any]) -> Union[GitHubProject, 'ProjectTable']:
+        """Get one row as a ``GitHubProject``, or a sub-table for a slice, mask or index array."""
+        if isinstance(key, (int, np.integer)):
+            return self._row(int(key))
+        return self.take(key)
+
+    def __iter__(self) -> Iterator[GitHubProject]:
+        for index in range(len(self)):
+            yield self._row(index)
+
+    def __repr__(self) -> str:
+        return f"ProjectTable({len(self)} projects)"
+
+    def _row(self, index: int) -> GitHubProject:
+        columns = self._columns
+        return GitHubProject(
+            name=columns['name'][index],
+            full_name=columns['full_name'][index],
+            html_url=columns['html_url'][index],
+            description=columns['description'][index],
+            language=columns['language'][index],
+            stargazers_count=int(columns['stargazers_count'][index]),
+            forks_count=int(columns['forks_count'][index]),
+            open_issues_count=int(columns['open_issues_count'][index]),
+            created_at=_from_datetime64(columns['created_at'][index]),
+            updated_at=_from_datetime64(columns['updated_at'][index])
+        )
+
+    def column(self, name: str):
+        """Get the underlying array for a column."""
+        if name not in self._columns:
+            raise KeyError(f"Unknown column: {name}")
+        return self._columns[name]
+
+    def take(self, selector) -> 'ProjectTable':
+        """Get a sub-table selected by a boolean mask, index array or slice."""
+        return ProjectTable({name: array[selector] for name, array in self._columns.items()})
+
+    def filter(self, min_stars: Optional[int] = None, min_forks: Optional[int] = None,
+               max_open_issues: Optional[int] = None, language: Optional[str] = None,
+               created_after: Optional[str] = None,
+               updated_after: Optional[str] = None) -> 'ProjectTable':
+        """
+        Get the rows matching all given conditions.
+
+        Args:
+            min_stars: Minimum star count
+            min_forks: Minimum fork count
+            max_open_issues: Maximum open issue count
+            language: Primary language (case-insensitive)
+            created_after: ISO date or timestamp the repository was created after
+            updated_after: ISO date or timestamp the repository was updated after
+
+        Returns:
+            Filtered ProjectTable
+        """
+        columns = self._columns
+        mask = np.ones(len(self), dtype=bool)
+        if min_stars is not None:
+            mask &= columns['stargazers_count'] >= min_stars
+        if min_forks is not None:
+            mask &= columns['forks_count'] >= min_forks
+        if max_open_issues is not None:
+            mask &= columns['open_issues_count'] <= max_open_issues
+        if language is not None:
+            wanted = language.lower()
+            mask &= np.array([(value or '').lower() == wanted for value in columns['language']],
+                             dtype=bool)
+        if created_after is not None:
+            mask &= columns['created_at'] > _to_datetime64(created_after)
+        if updated_after is not None:
+            mask &= columns['updated_at'] > _to_datetime64(updated_after)
+        return self.take(mask)
+
+    def _order(self, column: str, descending: bool):
+        values = self.column(column)
+        if values.dtype.kind == 'M':
+            # Sort missing dates last in either direction
+            values = values.astype(np.int64)
+            missing = np.iinfo(np.int64).min
+            if not descending:
+                values = np.where(values == missing, np.iinfo(np.int64).max, values)
+        elif values.dtype == object:
+            values = np.array([(value or '').lower() for value in values], dtype=object)
+        if descending:
+            # Negate via a reversed stable sort so ties keep their original order
+            order = np.argsort(values[::-1], kind='stable')[::-1]
+            return len(values) - 1 - order
+        return np.argsort(values, kind='stable')
+
+    def sort_by(self, column: str = 'stargazers_count', descending: bool = True) -> 'ProjectTable':
+        """
+        Get the table sorted by a column.
+
+        The sort is stable, so rows with equal values keep their current order.
+        """
+        return self.take(self._order(column, descending))
+
+    def top_k(self, k: int, column: str = 'stargazers_count') -> 'ProjectTable':
+        """
+        Get the ``k`` rows with the highest values of a numeric column, highest first.
+
+        Uses a partial partition, so it is linear in the table size for small ``k``.
+        """
+        if column not in NUMERIC_COLUMNS:
+            raise ValueError(f"top_k requires a numeric column, got {column}")
+        values = self._columns[column]
+        if k <= 0:
+            return self.take(slice(0, 0))
+        if k < len(values):
+            candidates = np.argpartition(-values, k - 1)[:k]
+        else:
+            candidates = np.arange(len(values))
+        # Order the candidates by value, breaking ties by original position
+        order = np.lexsort((candidates, -values[candidates]))
+        return self.take(candidates[order])
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get aggregate statistics for the table.
+
+        Returns:
+            Dictionary with the row count, per-column sum/mean/median/min/max
+            for the numeric columns, language counts and the date range
+        """
+        result = {'count': len(self)}
+        for name in NUMERIC_COLUMNS:
+            values = self._columns[name]
+            if len(values):
+                result[name] = {
+                    'sum': int(values.sum()),
+                    'mean': float(values.mean()),
+                    'median': float(np.median(values)),
+                    'min': int(values.min()),
+                    'max': int(values.max())
+                }
+            else:
+                result[name] = {'sum': 0, 'mean': 0.0, 'median': 0.0, 'min': 0, 'max': 0}
+
+        languages = np.array([value or 'Unknown' for value in self._columns['language']], dtype=object)
+        names, counts = np.unique(languages.astype(str), return_counts=True)
+        order = sorted(zip(names, counts), key=lambda pair: (-pair[1], pair[0]))
+        result['languages'] = {str(name): int(count) for name, count in order}
+
+        for name in DATE_COLUMNS:
+            values = self._columns[name]
+            present = values[~np.isnat(values)]
+            result[name] = {
+                'min': _from_datetime64(present.min()) if len(present) else None,
+                'max': _from_datetime64(present.max()) if len(present) else None
+            }
+        return result
+
+    def to_projects(self) -> List[GitHubProject]:
+        """Convert every row to a ``GitHubProject``."""
+        return list(self)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert every row to its ``GitHubProject.to_dict()`` form."""
+        return [project.to_dict() for project in self]
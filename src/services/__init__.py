@@ -4,7 +4,66 @@ Services package for GitHub Proposal Generator.
 This package contains service classes for GitHub API interaction and proposal generation.
 """
 
-from .github_api import GitHubAPI, GitHubAPIError
+from .github_api import (
+    GitHubAPI, GitHubAPIError, GitHubRateLimitError, GitHubCircuitOpenError,
+    get_github_api, reset_github_api
+)
+from .cache import TTLCache
+from .http_cache import CachedResponse, ResponseCache, ValidatorCache
+from .persistent_cache import SQLiteResponseCache
+from .rate_limit import RateLimitExceeded, RateLimitScheduler
+from .resilience import CircuitBreaker, RetryPolicy
+from .singleflight import SingleFlight
+from .async_github_api import AsyncGitHubAPI, get_async_github_api
+from .prefetch import RepositoryPrefetcher, get_prefetcher
+from .jobs import JobQueue, JobQueueFull, MemoryJobStore, SQLiteJobStore, get_job_queue
+from .repo_index import RepositoryIndex, get_repository_index
+from .search import RepositorySearchService, build_search_query, normalize_query, get_search_service
+from .templates import CompiledTemplate, TemplateError, TemplateRegistry, get_template_registry
+from .history import ProposalHistory
+from .render_cache import RenderCache, RenderedProposal, get_render_cache, render_key
 from .proposal_generator import ProposalGenerator
 
-__all__ = ['GitHubAPI', 'GitHubAPIError', 'ProposalGenerator']
+__all__ = [
+    'GitHubAPI',
+    'GitHubAPIError',
+    'GitHubRateLimitError',
+    'GitHubCircuitOpenError',
+    'get_github_api',
+    'reset_github_api',
+    'TTLCache',
+    'CachedResponse',
+    'ResponseCache',
+    'ValidatorCache',
+    'SQLiteResponseCache',
+    'RateLimitExceeded',
+    'RateLimitScheduler',
+    'CircuitBreaker',
+    'RetryPolicy',
+    'SingleFlight',
+    'AsyncGitHubAPI',
+    'get_async_github_api',
+    'RepositoryPrefetcher',
+    'get_prefetcher',
+    'JobQueue',
+    'JobQueueFull',
+    'MemoryJobStore',
+    'SQLiteJobStore',
+    'get_job_queue',
+    'RepositoryIndex',
+    'get_repository_index',
+    'RepositorySearchService',
+    'build_search_query',
+    'normalize_query',
+    'get_search_service',
+    'CompiledTemplate',
+    'TemplateError',
+    'TemplateRegistry',
+    'get_template_registry',
+    'ProposalHistory',
+    'RenderCache',
+    'RenderedProposal',
+    'get_render_cache',
+    'render_key',
+    'ProposalGenerator'
+]
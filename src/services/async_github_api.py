@@ -0,0 +1,140 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from config.settings import ASYNC_MAX_CONCURRENCY
+from models.github_project import GitHubProject
+from .github_api import GitHubAPI, get_github_api
+
+
+class AsyncGitHubAPI:
+    """
+    Asyncio front end for GitHubAPI.
+    
+    Requests run on a dedicated thread pool over the wrapped client, so they keep
+    using its pooled session, validator cache and metadata cache, while callers can
+    overlap many of them with ``asyncio.gather``. The pool is shared by every
+    event loop (Flask runs each async view in a loop of its own), so its size is
+    the limit on concurrent requests across the whole process; further calls wait
+    for a free thread.
+    
+    Args:
+        api: Synchronous client to wrap (defaults to the process-wide client)
+        max_concurrency: Maximum concurrent requests (worker threads)
+    """
+
+    def __init__(self, api: Optional[GitHubAPI] = None, max_concurrency: int = ASYNC_MAX_CONCURRENCY):
+        self.api = api or get_github_api()
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix='github-async')
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking client call on the shared executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def fetch_project_data(self, project_name: str) -> Dict[str, Any]:
+        """Fetch project data from GitHub API. See GitHubAPI.fetch_project_data."""
+        return await self._run(self.api.fetch_project_data, project_name)
+
+    async def get_project(self, project_name: str) -> GitHubProject:
+        """Get a repository as a GitHubProject. See GitHubAPI.get_project."""
+        return await self._run(self.api.get_project, project_name)
+
+    async def fetch_repository_readme(self, project_name: str) -> Optional[str]:
+        """Fetch repository README content. See GitHubAPI.fetch_repository_readme."""
+        return await self._run(self.api.fetch_repository_readme, project_name)
+
+    async def has_repository_readme(self, project_name: str) -> bool:
+        """Check whether a repository has a README. See GitHubAPI.has_repository_readme."""
+        return await self._run(self.api.has_repository_readme, project_name)
+
+    async def fetch_repository_languages(self, project_name: str) -> Dict[str, int]:
+        """Fetch the language breakdown of a repository. See GitHubAPI.fetch_repository_languages."""
+        return await self._run(self.api.fetch_repository_languages, project_name)
+
+    async def get_project_details(self, project_name: str, include_readme: bool = True,
+                                  include_languages: bool = True) -> Dict[str, Any]:
+        """
+        Fetch a repository's metadata, README presence and languages concurrently.
+        
+        The README is only checked for, not downloaded.
+        
+        Args:
+            project_name: Repository name in format 'owner/repo'
+            include_readme: Whether to check for a README
+            include_languages: Whether to fetch the language breakdown
+            
+        Returns:
+            Dictionary with 'project' (GitHubProject), 'has_readme' (bool, False if
+            not requested) and 'languages' (dict, empty if unavailable or not requested)
+            
+        Raises:
+            GitHubAPIError: If the repository metadata cannot be fetched
+        """
+        async def nothing(value):
+            return value
+        
+        project, has_readme, languages = await asyncio.gather(
+            self.get_project(project_name),
+            self.has_repository_readme(project_name) if include_readme else nothing(False),
+            self.fetch_repository_languages(project_name) if include_languages else nothing({})
+        )
+        return {'project': project, 'has_readme': has_readme, 'languages': languages}
+
+    async def validate_repository_exists(self, project_name: str) -> bool:
+        """Check if a repository exists. See GitHubAPI.validate_repository_exists."""
+        return await self._run(self.api.validate_repository_exists, project_name)
+
+    async def search_repositories(self, query: str, sort: str = 'stars', order: str = 'desc',
+                                  per_page: int = 10, page: int = 1,
+                                  fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Search GitHub repositories. See GitHubAPI.search_repositories."""
+        return await self._run(self.api.search_repositories, query, sort=sort, order=order,
+                               per_page=per_page, page=page, fields=fields)
+
+    async def get_projects(self, project_names: Iterable[str]) -> List[Union[GitHubProject, Exception]]:
+        """
+        Fetch many repositories concurrently.
+        
+        Args:
+            project_names: Repository names in format 'owner/repo'
+            
+        Returns:
+            List in input order holding a GitHubProject, or the exception raised
+            for that repository
+        """
+        return await asyncio.gather(
+            *(self.get_project(name) for name in project_names),
+            return_exceptions=True
+        )
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=False)
+
+
+_shared_async_api = None
+_shared_async_api_lock = threading.Lock()
+
+
+def get_async_github_api(api: Optional[GitHubAPI] = None) -> AsyncGitHubAPI:
+    """
+    Get the process-wide AsyncGitHubAPI.
+    
+    The wrapper is rebuilt when the underlying client changes (for example after
+    ``reset_github_api`` in a forked worker), so it never outlives its client.
+    
+    Args:
+        api: Client to wrap (defaults to the process-wide client)
+    """
+    global _shared_async_api
+    api = api or get_github_api()
+    with _shared_async_api_lock:
+        if _shared_async_api is None or _shared_async_api.api is not api:
+            if _shared_async_api is not None:
+                _shared_async_api.close()
+            _shared_async_api = AsyncGitHubAPI(api)
+        return _shared_async_api
@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+from config.settings import REPO_CACHE_MAX_ENTRIES, REPO_CACHE_TTL, REPO_CACHE_STALE_TTL
+
+
+class _Entry:
+    __slots__ = ('value', 'expires_at', 'stale_until')
+
+    def __init__(self, value: Any, expires_at: float, stale_until: float):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache with per-entry time-to-live.
+    
+    When ``stale_ttl`` is greater than zero, expired entries stay usable for that
+    long: ``get_or_load`` returns the stale value immediately and refreshes it in
+    a background thread (stale-while-revalidate).
+    """
+
+    def __init__(self, max_entries: int = REPO_CACHE_MAX_ENTRIES, ttl: float = REPO_CACHE_TTL,
+                 stale_ttl: float = REPO_CACHE_STALE_TTL, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a fresh value for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= self._clock():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds for this entry (defaults to the cache TTL)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        now = self._clock()
+        with self._lock:
+            self._entries[key] = _Entry(value, now + ttl, now + ttl + self.stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get a value, loading and caching it on a miss.
+        
+        Args:
+            key: Cache key
+            loader: Callable producing a fresh value; exceptions propagate on a miss
+            
+        Returns:
+            Cached, stale or freshly loaded value
+        """
+        now = self._clock()
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            if entry is not None and now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    refresh = True
+                value = entry.value
+            else:
+                self.misses += 1
+                value = None
+                entry = None
+        
+        if entry is None:
+            value = loader()
+            self.set(key, value)
+            return value
+        
+        if refresh:
+            threading.Thread(target=self._refresh, args=(key, loader), daemon=True).start()
+        return value
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """Reload a stale entry in the background, keeping the old value on failure."""
+        try:
+            value = loader()
+        except Exception:
+            with self._lock:
+                self.refresh_errors += 1
+                self._refreshing.discard(key)
+            return
+        self.set(key, value)
+        with self._lock:
+            self.refreshes += 1
+            self._refreshing.discard(key)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a key from the cache."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'stale_ttl': self.stale_ttl,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+                'hit_rate': round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires_at > self._clock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,6 +1,29 @@
+import base64
+import logging
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
-from config.settings import GITHUB_API_URL, API_KEY
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, Any, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+from config.settings import (
+    GITHUB_API_URL, API_KEY, GITHUB_POOL_CONNECTIONS, GITHUB_POOL_MAXSIZE,
+    GITHUB_POOL_BLOCK, GITHUB_REQUEST_TIMEOUT, GITHUB_CONNECT_TIMEOUT, HTTP_CACHE_ENABLED,
+    REPO_CACHE_ENABLED, PERSISTENT_CACHE_ENABLED, GITHUB_GRAPHQL_URL, GRAPHQL_BATCH_SIZE,
+    REPO_INDEX_ENABLED
+)
+from models.github_project import GitHubProject
+from utils.json_backend import loads, select_items
+from .cache import TTLCache
+from .graphql import batch_size, build_repository_query, chunk_names, repository_node_to_rest
+from .rate_limit import RateLimitExceeded, RateLimitScheduler
+from .resilience import CircuitBreaker, RetryPolicy
+from .singleflight import SingleFlight
+from .http_cache import CachedResponse, ResponseCache, ValidatorCache
+from .persistent_cache import SQLiteResponseCache
+from .repo_index import RepositoryIndex, get_repository_index
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubAPIError(Exception):
@@ -8,19 +31,268 @@ class GitHubAPIError(Exception):
     pass
 
 
+class GitHubRateLimitError(GitHubAPIError):
+    """Raised when GitHub rejects a request because of rate limiting."""
+    pass
+
+
+class GitHubCircuitOpenError(GitHubAPIError):
+    """Raised without contacting GitHub while the circuit breaker is open."""
+    pass
+
+
+# Responses worth retrying: GitHub is overloaded or briefly unreachable
+RETRYABLE_STATUSES = frozenset([500, 502, 503, 504])
+
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode a response body with the configured JSON backend."""
+    content = response.content
+    if isinstance(content, (bytes, str)):
+        return loads(content)
+    return response.json()
+
+
+def select_search_fields(body: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """Reduce a search response to the given fields of each item."""
+    return {
+        'total_count': body.get('total_count', 0),
+        'incomplete_results': body.get('incomplete_results', False),
+        'items': select_items(body.get('items', []), fields)
+    }
+
+
+def create_session(pool_connections: int = GITHUB_POOL_CONNECTIONS,
+                   pool_maxsize: int = GITHUB_POOL_MAXSIZE,
+                   max_retries: int = 0,
+                   pool_block: bool = GITHUB_POOL_BLOCK) -> requests.Session:
+    """
+    Create a requests session backed by a tuned keep-alive connection pool.
+    
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept alive per host
+        max_retries: Transport-level retries; GitHubAPI retries through RetryPolicy instead
+        pool_block: Block when the pool is exhausted instead of opening extra connections
+        
+    Returns:
+        Configured requests session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+        pool_block=pool_block
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def create_http_cache() -> Optional[ResponseCache]:
+    """
+    Create the HTTP response cache selected by configuration.
+    
+    Returns:
+        SQLite-backed cache shared across processes when PERSISTENT_CACHE_ENABLED,
+        otherwise an in-memory ValidatorCache, or None when caching is disabled
+    """
+    if PERSISTENT_CACHE_ENABLED:
+        return SQLiteResponseCache()
+    if HTTP_CACHE_ENABLED:
+        return ValidatorCache()
+    return None
+
+
 class GitHubAPI:
-    def __init__(self, base_url: str = GITHUB_API_URL, api_key: Optional[str] = None):
+    def __init__(self, base_url: str = GITHUB_API_URL, api_key: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 timeout: float = GITHUB_REQUEST_TIMEOUT,
+                 http_cache: Optional[ResponseCache] = None,
+                 project_cache: Optional[TTLCache] = None,
+                 graphql_url: str = GITHUB_GRAPHQL_URL,
+                 rate_limiter: Optional[RateLimitScheduler] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 connect_timeout: float = GITHUB_CONNECT_TIMEOUT,
+                 repo_index: Optional[RepositoryIndex] = None):
         self.base_url = base_url.rstrip('/')
+        self.graphql_url = graphql_url or f"{self.base_url}/graphql"
         self.api_key = api_key or API_KEY
-        self.session = requests.Session()
+        self.session = session or create_session()
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.http_cache = http_cache if http_cache is not None else create_http_cache()
+        if project_cache is None and REPO_CACHE_ENABLED:
+            project_cache = TTLCache()
+        self.project_cache = project_cache
+        self.rate_limiter = rate_limiter or RateLimitScheduler()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.single_flight = SingleFlight()
+        # Every repository seen is indexed for offline search
+        if repo_index is None and REPO_INDEX_ENABLED:
+            repo_index = get_repository_index()
+        self.repo_index = repo_index
         
         # Set up authentication if API key is provided
-        if self.api_key and self.api_key != "your_api_key_here":
+        if self.is_authenticated:
             self.session.headers.update({
                 'Authorization': f'token {self.api_key}',
                 'Accept': 'application/vnd.github.v3+json'
             })
 
+    @property
+    def is_authenticated(self) -> bool:
+        """Whether requests are sent with an API token."""
+        return bool(self.api_key) and self.api_key != "your_api_key_here"
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the circuit breaker, retry policy and rate limiter.
+        
+        While the circuit is open the request fails immediately. Connection errors,
+        timeouts and 5xx answers are retried with jittered exponential backoff
+        within the retry budget. Each attempt waits for rate limit budget first,
+        and a 403/429 carrying Retry-After or an exhausted X-RateLimit-Remaining is
+        retried once after the indicated delay when that fits the scheduler's max wait.
+        
+        Raises:
+            GitHubCircuitOpenError: If the circuit breaker is open
+            GitHubRateLimitError: If the budget does not reopen within the max wait
+            requests.exceptions.RequestException: On network errors after retries
+        """
+        if not self.circuit_breaker.allow_request():
+            raise GitHubCircuitOpenError(
+                f"GitHub API is unavailable after repeated failures; "
+                f"retrying in {int(self.circuit_breaker.retry_in())}s"
+            )
+        
+        resource = self.rate_limiter.resource_for(url)
+        send = {'POST': self.session.post, 'HEAD': self.session.head}.get(method, self.session.get)
+        kwargs.setdefault('timeout', (self.connect_timeout, self.timeout))
+        attempt = 0
+        rate_limit_retried = False
+        
+        while True:
+            try:
+                self.rate_limiter.acquire(resource)
+            except RateLimitExceeded as e:
+                raise GitHubRateLimitError(str(e))
+            
+            self.retry_policy.record_request()
+            try:
+                response = send(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if self.retry_policy.should_retry(attempt):
+                    time.sleep(self.retry_policy.delay(attempt))
+                    attempt += 1
+                    continue
+                self.circuit_breaker.record_failure()
+                raise
+            
+            self.rate_limiter.update(resource, response.headers)
+            
+            if response.status_code in RETRYABLE_STATUSES:
+                if self.retry_policy.should_retry(attempt):
+                    time.sleep(self.retry_policy.delay(attempt))
+                    attempt += 1
+                    continue
+                self.circuit_breaker.record_failure()
+                return response
+            
+            self.circuit_breaker.record_success()
+            
+            if (response.status_code in (403, 429) and not rate_limit_retried
+                    and self.rate_limiter.backoff(resource, response.headers) is not None):
+                rate_limit_retried = True
+                continue
+            return response
+
+    def _conditional_get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                         headers: Optional[Dict[str, str]] = None,
+                         transform: Optional[Callable[[Any], Any]] = None,
+                         variant: str = '') -> Tuple[int, Any, Optional[requests.Response]]:
+        """
+        Perform a GET request, revalidating any cached body with ETag/Last-Modified.
+        
+        A 304 Not Modified answer is turned into a 200 carrying the cached body, so
+        callers never see the difference between a fresh and a revalidated response.
+        If GitHub cannot be reached (network error, open circuit, or a server error
+        that persists after retries), a cached body is served regardless of its age. Identical requests made concurrently from
+        several threads are coalesced into a single upstream call.
+        
+        Args:
+            url: Absolute request URL
+            params: Optional query parameters
+            headers: Optional extra request headers
+            transform: Applied to a freshly decoded body before it is cached and
+                returned, so only the reduced body is kept
+            variant: Distinguishes cache entries for different transforms of the
+                same URL
+            
+        Returns:
+            Tuple of (status_code, decoded JSON body or None, raw response or None
+            when the body was served from cache without contacting GitHub)
+        """
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        if variant:
+            cache_key = f"{cache_key}#{variant}"
+        # Concurrent callers for the same request share one upstream call
+        return self.single_flight.do(
+            cache_key, lambda: self._fetch_conditional(cache_key, url, params, headers, transform)
+        )
+
+    def _fetch_conditional(self, cache_key: str, url: str, params: Optional[Dict[str, Any]],
+                           headers: Optional[Dict[str, str]],
+                           transform: Optional[Callable[[Any], Any]] = None) -> Tuple[int, Any, Optional[requests.Response]]:
+        """Perform the conditional GET for _conditional_get."""
+        request_headers = dict(headers or {})
+        
+        cached = self.http_cache.get(cache_key) if self.http_cache is not None else None
+        if cached is not None:
+            if self.http_cache.is_fresh(cached):
+                self.http_cache.record_fresh_hit()
+                return 200, cached.body, None
+            request_headers.update(cached.conditional_headers())
+        
+        try:
+            response = self._send('GET', url, params=params, headers=request_headers or None)
+        except (GitHubCircuitOpenError, requests.exceptions.RequestException):
+            if cached is None:
+                raise
+            # GitHub is unreachable: serve what we have rather than failing
+            self.http_cache.record_stale_hit()
+            return 200, cached.body, None
+        
+        if response.status_code == 304 and cached is not None:
+            self.http_cache.record_hit()
+            return 200, cached.body, response
+        
+        if response.status_code in RETRYABLE_STATUSES and cached is not None:
+            # GitHub kept failing after retries: degrade to the cached body
+            self.http_cache.record_stale_hit()
+            return 200, cached.body, None
+        
+        if response.status_code != 200:
+            return response.status_code, None, response
+        
+        body = decode_json(response)
+        if transform is not None:
+            body = transform(body)
+        if self.http_cache is not None:
+            self.http_cache.record_miss()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if isinstance(etag, str) or isinstance(last_modified, str):
+                self.http_cache.set(cache_key, CachedResponse(
+                    body,
+                    etag=etag if isinstance(etag, str) else None,
+                    last_modified=last_modified if isinstance(last_modified, str) else None
+                ))
+        return 200, body, response
+
     def fetch_project_data(self, project_name: str) -> Dict[str, Any]:
         """
         Fetch project data from GitHub API.
@@ -40,20 +312,170 @@ class GitHubAPI:
         url = f"{self.base_url}/repos/{project_name}"
         
         try:
-            response = self.session.get(url, timeout=30)
+            status_code, data, response = self._conditional_get(url)
             
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
+            if status_code == 200:
+                self._index_repositories([data])
+                return data
+            elif status_code == 404:
                 raise GitHubAPIError(f"Repository '{project_name}' not found")
-            elif response.status_code == 403:
-                raise GitHubAPIError("API rate limit exceeded or access forbidden")
+            elif status_code in (403, 429):
+                raise GitHubRateLimitError("API rate limit exceeded or access forbidden")
             else:
-                raise GitHubAPIError(f"GitHub API request failed with status {response.status_code}: {response.text}")
+                raise GitHubAPIError(f"GitHub API request failed with status {status_code}: {response.text}")
                 
         except requests.exceptions.RequestException as e:
             raise GitHubAPIError(f"Network error while fetching project data: {str(e)}")
 
+    def get_project(self, project_name: str) -> GitHubProject:
+        """
+        Get a repository as a GitHubProject, served from the metadata cache when possible.
+        
+        Args:
+            project_name: Repository name in format 'owner/repo'
+            
+        Returns:
+            GitHubProject instance
+            
+        Raises:
+            GitHubAPIError: If the repository cannot be fetched and nothing usable is cached
+        """
+        def load() -> GitHubProject:
+            return GitHubProject.from_api_response(self.fetch_project_data(project_name))
+        
+        if self.project_cache is None:
+            return load()
+        return self.project_cache.get_or_load(project_name.lower(), load)
+
+    def get_repository_version(self, project: GitHubProject,
+                               project_name: Optional[str] = None) -> Optional[str]:
+        """
+        Identify the state of a repository, for caching output derived from it.
+        
+        The version is the project's ``updated_at``, extended with the ETag GitHub
+        sent for the repository when the validator cache holds one for that same
+        state.
+        
+        Args:
+            project: Repository as returned by get_project
+            project_name: Name the project was requested by, if it differs in
+                case from ``project.full_name``
+            
+        Returns:
+            Version string, or None if the project carries no ``updated_at``
+        """
+        if not project.updated_at:
+            return None
+        version = project.updated_at
+        project_name = project_name or project.full_name
+        if self.http_cache is not None and project_name:
+            cached = self.http_cache.get(f"{self.base_url}/repos/{project_name}")
+            if (cached is not None and cached.etag and isinstance(cached.body, dict)
+                    and cached.body.get('updated_at') == project.updated_at):
+                version = f"{version}|{cached.etag}"
+        return version
+
+    def fetch_many_project_data(self, project_names: Iterable[str],
+                                include_readme: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch many repositories through the GraphQL API, several per round-trip.
+        
+        Names are deduplicated and split into fixed-size queries of
+        GRAPHQL_BATCH_SIZE repositories (half that with include_readme, as README
+        text makes responses much larger). Results use the REST repository payload
+        shape; with include_readme, each payload also carries a 'readme' key
+        holding the README.md text (or None).
+        
+        Args:
+            project_names: Repository names in format 'owner/repo'
+            include_readme: Whether to fetch README.md text as well
+            
+        Returns:
+            Dictionary mapping each requested name to its payload; repositories that
+            do not exist or are not accessible are omitted
+            
+        Raises:
+            GitHubAPIError: If no API token is configured or a query fails
+        """
+        if not self.is_authenticated:
+            raise GitHubAPIError("The GitHub GraphQL API requires an API token")
+        
+        names = []
+        seen = set()
+        for name in project_names:
+            if '/' not in name:
+                raise GitHubAPIError(f"Invalid project name format: '{name}'. Expected 'owner/repo'")
+            if name.lower() not in seen:
+                seen.add(name.lower())
+                names.append(name)
+        
+        results = {}
+        for chunk in chunk_names(names, batch_size(include_readme, GRAPHQL_BATCH_SIZE)):
+            query, variables = build_repository_query(chunk, include_readme)
+            data = self._graphql(query, variables)
+            for i, name in enumerate(chunk):
+                node = data.get(f'r{i}')
+                if node:
+                    results[name] = repository_node_to_rest(node)
+        self._index_repositories(results.values())
+        return results
+
+    def fetch_many_projects(self, project_names: Iterable[str],
+                            include_readme: bool = False) -> Dict[str, GitHubProject]:
+        """
+        Fetch many repositories as GitHubProject objects via GraphQL.
+        
+        Fetched projects are also stored in the metadata cache, so later
+        get_project calls for them are served without a request.
+        
+        Args:
+            project_names: Repository names in format 'owner/repo'
+            include_readme: Whether to fetch README.md text as well
+            
+        Returns:
+            Dictionary mapping each found repository name to its GitHubProject
+            
+        Raises:
+            GitHubAPIError: If no API token is configured or a query fails
+        """
+        projects = {}
+        for name, data in self.fetch_many_project_data(project_names, include_readme).items():
+            project = GitHubProject.from_api_response(data)
+            if self.project_cache is not None:
+                self.project_cache.set(name.lower(), project)
+            projects[name] = project
+        return projects
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GraphQL query.
+        
+        Errors for individual repositories (e.g. NOT_FOUND) are tolerated and their
+        aliases come back as None; a response without data raises.
+        
+        Returns:
+            The 'data' object of the response
+            
+        Raises:
+            GitHubAPIError: If the request fails
+        """
+        try:
+            response = self._send('POST', self.graphql_url, json={'query': query, 'variables': variables})
+        except requests.exceptions.RequestException as e:
+            raise GitHubAPIError(f"Network error during GraphQL query: {str(e)}")
+        
+        if response.status_code in (403, 429):
+            raise GitHubRateLimitError("API rate limit exceeded or access forbidden")
+        if response.status_code != 200:
+            raise GitHubAPIError(f"GitHub GraphQL request failed with status {response.status_code}: {response.text}")
+        
+        payload = decode_json(response)
+        data = payload.get('data')
+        if data is None:
+            messages = '; '.join(error.get('message', '') for error in payload.get('errors', []))
+            raise GitHubAPIError(f"GitHub GraphQL query failed: {messages}")
+        return data
+
     def fetch_repository_readme(self, project_name: str) -> Optional[str]:
         """
         Fetch repository README content.
@@ -67,17 +489,105 @@ class GitHubAPI:
         url = f"{self.base_url}/repos/{project_name}/readme"
         
         try:
-            response = self.session.get(url, timeout=30)
-            if response.status_code == 200:
-                data = response.json()
+            status_code, data, _ = self._conditional_get(url)
+            if status_code == 200:
                 # Decode base64 content
-                import base64
-                content = base64.b64decode(data['content']).decode('utf-8')
-                return content
+                return base64.b64decode(data['content']).decode('utf-8')
             return None
         except Exception:
             return None
 
+    def has_repository_readme(self, project_name: str) -> bool:
+        """
+        Check whether a repository has a README without downloading it.
+        
+        Args:
+            project_name: Repository name in format 'owner/repo'
+            
+        Returns:
+            True if the repository has a README, False if not or if unavailable
+        """
+        url = f"{self.base_url}/repos/{project_name}/readme"
+        
+        try:
+            return self._send('HEAD', url, allow_redirects=True).status_code == 200
+        except Exception:
+            return False
+
+    def fetch_repository_languages(self, project_name: str) -> Dict[str, int]:
+        """
+        Fetch the language breakdown of a repository.
+        
+        Args:
+            project_name: Repository name in format 'owner/repo'
+            
+        Returns:
+            Mapping of language to bytes of code, largest first; empty if unavailable
+        """
+        url = f"{self.base_url}/repos/{project_name}/languages"
+        
+        try:
+            status_code, data, _ = self._conditional_get(url)
+            if status_code == 200:
+                return dict(sorted(data.items(), key=lambda item: item[1], reverse=True))
+            return {}
+        except Exception:
+            return {}
+
+    def search_repositories(self, query: str, sort: str = 'stars', order: str = 'desc',
+                            per_page: int = 10, page: int = 1,
+                            fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Search GitHub repositories.
+        
+        Search responses carry up to 100 full repository objects. Pass ``fields``
+        to keep only those keys of each item; the reduced response is what gets
+        cached, so the full objects are released right after decoding.
+        
+        Args:
+            query: GitHub search query string
+            sort: Sort field ('stars', 'forks', 'updated', ...)
+            order: Sort order ('asc' or 'desc')
+            per_page: Results per page (max 100)
+            page: Page number, starting at 1
+            fields: Repository fields to keep in each item (all when None)
+            
+        Returns:
+            Search response dictionary with 'total_count' and 'items'
+            
+        Raises:
+            GitHubRateLimitError: If the search rate limit is exhausted
+            GitHubAPIError: If the search request fails
+        """
+        url = f"{self.base_url}/search/repositories"
+        params = {
+            'q': query,
+            'sort': sort,
+            'order': order,
+            'per_page': per_page,
+            'page': page
+        }
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+        transform, variant = None, ''
+        if fields is not None:
+            fields = tuple(fields)
+            transform = lambda body: select_search_fields(body, fields)
+            variant = 'fields=' + ','.join(fields)
+        
+        try:
+            status_code, data, _ = self._conditional_get(url, params=params, headers=headers,
+                                                         transform=transform, variant=variant)
+        except requests.exceptions.RequestException as e:
+            raise GitHubAPIError(f"Network error during search: {str(e)}")
+        
+        if status_code == 200:
+            self._index_repositories(data.get('items', []))
+            return data
+        elif status_code in (403, 429):
+            raise GitHubRateLimitError("GitHub API rate limit exceeded. Please try again later.")
+        else:
+            raise GitHubAPIError(f"GitHub search failed with status {status_code}")
+
     def validate_repository_exists(self, project_name: str) -> bool:
         """
         Check if a repository exists.
@@ -93,3 +603,85 @@ class GitHubAPI:
             return True
         except GitHubAPIError:
             return False
+
+    def _index_repositories(self, repos: Iterable[Dict[str, Any]]) -> None:
+        """Add repository payloads to the local index; indexing never fails a fetch."""
+        if self.repo_index is None:
+            return
+        try:
+            self.repo_index.add_many(repos)
+        except Exception as e:
+            logger.warning("Could not index repositories: %s", e)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics for this client's session.
+        
+        Returns:
+            Dictionary with per-host connection/request counts and the overall reuse rate
+        """
+        hosts = {}
+        total_connections = 0
+        total_requests = 0
+        
+        # The same adapter is mounted for several URL prefixes; count it once
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                host = f"{pool.scheme}://{pool.host}:{pool.port}"
+                hosts[host] = {
+                    'connections_opened': pool.num_connections,
+                    'requests': pool.num_requests,
+                    'idle_connections': pool.pool.qsize() if pool.pool else 0,
+                    'max_size': pool.pool.maxsize if pool.pool else 0
+                }
+                total_connections += pool.num_connections
+                total_requests += pool.num_requests
+        
+        reuse_rate = 0.0
+        if total_requests:
+            reuse_rate = max(0.0, 1 - total_connections / total_requests)
+        
+        return {
+            'hosts': hosts,
+            'connections_opened': total_connections,
+            'requests': total_requests,
+            'reuse_rate': round(reuse_rate, 4)
+        }
+
+
+_shared_api = None
+_shared_api_lock = threading.Lock()
+
+
+def get_github_api() -> GitHubAPI:
+    """
+    Get the process-wide GitHubAPI client.
+    
+    The client is created lazily on first use and shares one pooled session
+    across all threads, so repeated calls reuse kept-alive connections.
+    
+    Returns:
+        Shared GitHubAPI instance
+    """
+    global _shared_api
+    if _shared_api is None:
+        with _shared_api_lock:
+            if _shared_api is None:
+                _shared_api = GitHubAPI()
+    return _shared_api
+
+
+def reset_github_api() -> None:
+    """Close and discard the process-wide GitHubAPI client."""
+    global _shared_api
+    with _shared_api_lock:
+        if _shared_api is not None:
+            _shared_api.session.close()
+        _shared_api = None
@@ -0,0 +1,118 @@
+"""
+GraphQL helpers for fetching many repositories in one round-trip.
+
+Queries alias one ``repository`` field per requested name and map each result
+back into the REST ``/repos/{owner}/{repo}`` shape used by GitHubProject.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+REPOSITORY_FIELDS = """
+  name
+  nameWithOwner
+  url
+  description
+  primaryLanguage { name }
+  stargazerCount
+  forkCount
+  createdAt
+  updatedAt
+  pushedAt
+  isFork
+  isArchived
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+"""
+
+README_FIELDS = """
+  readme: object(expression: "HEAD:README.md") { ... on Blob { text } }
+"""
+
+def batch_size(include_readme: bool, max_batch_size: int) -> int:
+    """
+    Number of repositories to fetch per query.
+    
+    Batches are fixed-size: README blobs make responses much larger, so queries
+    requesting them take half as many repositories.
+    """
+    return max(1, max_batch_size // 2 if include_readme else max_batch_size)
+
+
+def chunk_names(names: Iterable[str], size: int) -> List[List[str]]:
+    """
+    Split repository names into consecutive chunks of at most ``size`` names.
+    
+    Args:
+        names: Repository names in format 'owner/repo'
+        size: Maximum names per chunk
+        
+    Returns:
+        List of name chunks
+    """
+    names = list(names)
+    return [names[i:i + size] for i in range(0, len(names), size)]
+
+
+def build_repository_query(names: List[str], include_readme: bool = False) -> Tuple[str, Dict[str, str]]:
+    """
+    Build an aliased GraphQL query for several repositories.
+    
+    Args:
+        names: Repository names in format 'owner/repo'
+        include_readme: Whether to request README.md text
+        
+    Returns:
+        Tuple of (query string, variables)
+    """
+    fields = REPOSITORY_FIELDS + (README_FIELDS if include_readme else '')
+    declarations = []
+    selections = []
+    variables = {}
+    for i, name in enumerate(names):
+        owner, repo = name.split('/', 1)
+        variables[f'o{i}'] = owner
+        variables[f'n{i}'] = repo
+        declarations.append(f'$o{i}: String!, $n{i}: String!')
+        selections.append(f'r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoFields }}')
+    
+    query = (
+        f"query({', '.join(declarations)}) {{\n"
+        + '\n'.join(selections)
+        + "\n}\n"
+        + f"fragment RepoFields on Repository {{{fields}}}"
+    )
+    return query, variables
+
+
+def repository_node_to_rest(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a GraphQL repository node into the REST repository payload shape.
+    
+    ``open_issues_count`` counts open issues plus open pull requests, matching
+    the REST API.
+    """
+    language = node.get('primaryLanguage') or {}
+    topics = (node.get('repositoryTopics') or {}).get('nodes') or []
+    data = {
+        'name': node.get('name'),
+        'full_name': node.get('nameWithOwner'),
+        'html_url': node.get('url'),
+        'description': node.get('description'),
+        'language': language.get('name'),
+        'stargazers_count': node.get('stargazerCount', 0),
+        'forks_count': node.get('forkCount', 0),
+        'open_issues_count': ((node.get('issues') or {}).get('totalCount', 0)
+                              + (node.get('pullRequests') or {}).get('totalCount', 0)),
+        'created_at': node.get('createdAt'),
+        'updated_at': node.get('updatedAt'),
+        'pushed_at': node.get('pushedAt'),
+        'fork': node.get('isFork', False),
+        'archived': node.get('isArchived', False),
+        'topics': [item['topic']['name'] for item in topics if item and item.get('topic')]
+    }
+    if 'readme' in node:
+        readme: Optional[Dict[str, Any]] = node.get('readme')
+        data['readme'] = readme.get('text') if readme else None
+    return data
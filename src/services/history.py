@@ -0,0 +1,128 @@
+import hashlib
+import os
+import threading
+from collections import Counter, deque
+from typing import Any, Dict, Iterator, List, Optional
+from config.settings import PROPOSAL_HISTORY_LIMIT, PROPOSAL_HISTORY_COMPACT, PROPOSAL_HISTORY_SPILL_DIR
+
+
+class ProposalHistory:
+    """
+    Bounded store of generated proposals.
+    
+    Holds at most ``max_entries`` records, dropping the oldest first. In compact
+    mode a record keeps only summary metadata plus a SHA-256 hash of the formatted
+    proposal instead of the text itself; with ``spill_dir`` set, the text is
+    written there (one file per distinct hash) so it can still be exported.
+    
+    Args:
+        max_entries: Maximum number of records kept
+        compact: Whether to drop the formatted text from stored records
+        spill_dir: Directory for formatted text of compact records (optional)
+    """
+
+    def __init__(self, max_entries: int = PROPOSAL_HISTORY_LIMIT, compact: bool = PROPOSAL_HISTORY_COMPACT,
+                 spill_dir: Optional[str] = PROPOSAL_HISTORY_SPILL_DIR or None):
+        self.max_entries = max_entries
+        self.compact = compact
+        self.spill_dir = spill_dir
+        self._records = deque()
+        self._spilled = Counter()
+        self._lock = threading.Lock()
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+
+    def _spill_path(self, content_hash: str) -> str:
+        return os.path.join(self.spill_dir, f'{content_hash}.md')
+
+    def _compact_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a generated proposal record to metadata and a content hash."""
+        content = record['formatted_proposal']
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        if self.spill_dir and self._spilled[content_hash] == 0:
+            with open(self._spill_path(content_hash), 'w', encoding='utf-8') as f:
+                f.write(content)
+        
+        user_proposal = record.get('user_proposal') or {}
+        github_project = record.get('github_project') or {}
+        return {
+            'user_proposal': {'title': user_proposal.get('title')},
+            'github_project': {'full_name': github_project.get('full_name')},
+            'generated_at': record.get('generated_at'),
+            'content_hash': content_hash,
+            'content_length': len(content)
+        }
+
+    def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a record, evicting the oldest one when full.
+        
+        Returns:
+            The record as stored
+        """
+        with self._lock:
+            if self.compact and record.get('formatted_proposal') is not None:
+                record = self._compact_record(record)
+                if self.spill_dir:
+                    self._spilled[record['content_hash']] += 1
+            
+            self._records.append(record)
+            while len(self._records) > self.max_entries:
+                self._release(self._records.popleft())
+            return record
+
+    def _release(self, record: Dict[str, Any]) -> None:
+        """Delete the spill file of an evicted record once nothing references it."""
+        content_hash = record.get('content_hash')
+        if not content_hash or not self.spill_dir:
+            return
+        self._spilled[content_hash] -= 1
+        if self._spilled[content_hash] <= 0:
+            del self._spilled[content_hash]
+            try:
+                os.remove(self._spill_path(content_hash))
+            except OSError:
+                pass
+
+    def get_content(self, index: int = -1) -> Optional[str]:
+        """
+        Get the formatted proposal text of a record.
+        
+        Returns:
+            The text, or None if the record has none or it was not spilled
+            
+        Raises:
+            IndexError: If there is no record at the index
+        """
+        with self._lock:
+            record = self._records[index]
+        if 'formatted_proposal' in record:
+            return record['formatted_proposal']
+        if record.get('content_hash') and self.spill_dir:
+            try:
+                with open(self._spill_path(record['content_hash']), 'r', encoding='utf-8') as f:
+                    return f.read()
+            except OSError:
+                return None
+        return None
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Get a snapshot of the stored records, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        """Remove all records and their spill files."""
+        with self._lock:
+            while self._records:
+                self._release(self._records.popleft())
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        with self._lock:
+            return self._records[index]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_list())
+
+    def __len__(self) -> int:
+        return len(self._records)
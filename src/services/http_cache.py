@@ -0,0 +1,156 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from config.settings import HTTP_CACHE_MAX_ENTRIES
+
+
+class CachedResponse:
+    """A cached response body together with its HTTP validators."""
+
+    def __init__(self, body: Any, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None, stored_at: Optional[float] = None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at if stored_at is not None else time.time()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get the request headers that revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache(ABC):
+    """
+    Base class for stores of validated GitHub responses.
+    
+    Subclasses provide storage via ``get``/``set``/``delete``/``clear``; this class
+    keeps the shared hit/miss accounting and the freshness policy.
+    
+    Args:
+        fresh_ttl: Seconds after storing during which an entry is served without
+            revalidating it against GitHub (0 always revalidates)
+    """
+
+    def __init__(self, fresh_ttl: float = 0):
+        self.fresh_ttl = fresh_ttl
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get the cached entry for a key, if any."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry under a key."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Check whether an entry may be used without a conditional request."""
+        return self.fresh_ttl > 0 and time.time() - entry.stored_at < self.fresh_ttl
+
+    def record_hit(self) -> None:
+        """Record a response served from cache after a 304."""
+        with self._stats_lock:
+            self.hits += 1
+
+    def record_fresh_hit(self) -> None:
+        """Record a response served from cache without contacting GitHub."""
+        with self._stats_lock:
+            self.fresh_hits += 1
+
+    def record_stale_hit(self) -> None:
+        """Record a response served from cache because GitHub was unreachable."""
+        with self._stats_lock:
+            self.stale_hits += 1
+
+    def record_miss(self) -> None:
+        """Record a response that had to be downloaded in full."""
+        with self._stats_lock:
+            self.misses += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._stats_lock:
+            return {
+                'not_modified_hits': self.hits,
+                'fresh_hits': self.fresh_hits,
+                'stale_if_error_hits': self.stale_hits,
+                'full_downloads': self.misses,
+                'fresh_ttl': self.fresh_ttl
+            }
+
+
+class ValidatorCache(ResponseCache):
+    """
+    Thread-safe in-memory LRU store of response bodies keyed by request.
+    
+    Entries carry the ETag/Last-Modified validators returned by GitHub so the
+    client can send conditional requests and reuse the body on 304 Not Modified.
+    """
+
+    def __init__(self, max_entries: int = HTTP_CACHE_MAX_ENTRIES, fresh_ttl: float = 0):
+        super().__init__(fresh_ttl=fresh_ttl)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get the cached entry for a key, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry, evicting the least recently used one when full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        stats = super().get_stats()
+        with self._lock:
+            stats.update({
+                'backend': 'memory',
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'evictions': self.evictions
+            })
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,399 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from config.settings import (
+    CACHE_DIR, JOB_STORE, JOB_DB_PATH, JOB_WORKERS, JOB_MAX_QUEUED, JOB_RESULT_TTL, JOB_TIMEOUT
+)
+from utils.json_backend import dumps, loads
+from .persistent_cache import thread_connection
+
+
+# Job states; the last two are final
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+FINISHED_STATES = (SUCCEEDED, FAILED)
+
+# Reports progress as (fraction between 0 and 1, stage description)
+ProgressCallback = Callable[[float, str], None]
+
+JOB_FIELDS = ('id', 'kind', 'status', 'progress', 'stage', 'result', 'error',
+              'created_at', 'started_at', 'finished_at', 'updated_at', 'expires_at')
+
+
+class JobQueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class JobStore(ABC):
+    """
+    Base class for stores of job records.
+
+    A record is a dictionary with the keys in ``JOB_FIELDS``; ``result`` holds
+    any JSON-serializable value.
+    """
+
+    @abstractmethod
+    def create(self, job: Dict[str, Any]) -> None:
+        """Store a new record."""
+
+    @abstractmethod
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Change fields of a record; unknown ids are ignored."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a record, or None."""
+
+    @abstractmethod
+    def purge(self, now: float) -> int:
+        """Delete records whose ``expires_at`` has passed; returns the number removed."""
+
+
+class MemoryJobStore(JobStore):
+    """Job records held in this process only."""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            self._jobs[job['id']] = dict(job)
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def purge(self, now: float) -> int:
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job['expires_at'] is not None and job['expires_at'] <= now]
+            for job_id in expired:
+                del self._jobs[job_id]
+            return len(expired)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL,
+    stage TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    updated_at REAL NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_expires_at ON jobs (expires_at);
+"""
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Job records stored in a SQLite database.
+
+    Jobs run in the process that accepted them, but with a shared database any
+    web worker process can answer status polls for them. The database runs in
+    WAL mode, like ``SQLiteResponseCache``.
+
+    Args:
+        path: Database file path (defaults to ``CACHE_DIR/jobs.sqlite3``)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, 'jobs.sqlite3')
+        self.path = path
+        self._local = threading.local()
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        return thread_connection(self._local, self.path)
+
+    def create(self, job: Dict[str, Any]) -> None:
+        row = dict(job, result=dumps(job['result']) if job['result'] is not None else None)
+        self._connect().execute(
+            f"INSERT INTO jobs ({', '.join(JOB_FIELDS)}) VALUES ({', '.join('?' * len(JOB_FIELDS))})",
+            [row[field] for field in JOB_FIELDS]
+        )
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        if 'result' in fields and fields['result'] is not None:
+            fields['result'] = dumps(fields['result'])
+        assignments = ', '.join(f'{field} = ?' for field in fields)
+        self._connect().execute(f'UPDATE jobs SET {assignments} WHERE id = ?',
+                                [*fields.values(), job_id])
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            f"SELECT {', '.join(JOB_FIELDS)} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        job = dict(zip(JOB_FIELDS, row))
+        if job['result'] is not None:
+            job['result'] = loads(job['result'])
+        return job
+
+    def purge(self, now: float) -> int:
+        cursor = self._connect().execute('DELETE FROM jobs WHERE expires_at <= ?', (now,))
+        return cursor.rowcount
+
+
+def create_job_store() -> JobStore:
+    """Create the job store selected by JOB_STORE ('sqlite' or 'memory')."""
+    if JOB_STORE == 'memory':
+        return MemoryJobStore()
+    return SQLiteJobStore(JOB_DB_PATH or None)
+
+
+class JobQueue:
+    """
+    Bounded background job queue.
+
+    Jobs are handled by named handlers on a thread pool; a handler receives the
+    job payload and a progress callback, and returns a JSON-serializable
+    result. At most ``max_workers`` jobs run and ``max_queued`` wait at a time;
+    beyond that ``submit`` raises JobQueueFull so callers can push back.
+    Finished jobs are kept for ``result_ttl`` seconds. A job still running
+    ``timeout`` seconds after it started (for example because the process
+    running it exited) is reported as failed. Every record carries an expiry
+    from the moment it is submitted, so records of jobs that never finish are
+    purged too.
+
+    Args:
+        store: Where job records are kept (defaults to ``create_job_store()``,
+            created on first use)
+        max_workers: Jobs run concurrently
+        max_queued: Jobs waiting for a worker
+        result_ttl: Seconds finished jobs are kept
+        timeout: Seconds a job may run before it counts as lost
+        clock: Wall-clock time source
+    """
+
+    def __init__(self, store: Optional[JobStore] = None, max_workers: int = JOB_WORKERS,
+                 max_queued: int = JOB_MAX_QUEUED, result_ttl: float = JOB_RESULT_TTL,
+                 timeout: float = JOB_TIMEOUT, clock: Callable[[], float] = time.time):
+        self._store = store
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self.timeout = timeout
+        self._clock = clock
+        self._handlers: Dict[str, Callable[[Dict[str, Any], ProgressCallback], Any]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._durations: List[float] = []
+        self.submitted = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    @property
+    def store(self) -> JobStore:
+        """The job store; the default store is only created once jobs are used."""
+        if self._store is None:
+            with self._lock:
+                if self._store is None:
+                    self._store = create_job_store()
+        return self._store
+
+    def register(self, kind: str, handler: Callable[[Dict[str, Any], ProgressCallback], Any]) -> None:
+        """
+        Register the handler for a kind of job.
+
+        Args:
+            kind: Job kind, as passed to ``submit``
+            handler: Called as ``handler(payload, progress)`` on a worker thread
+        """
+        self._handlers[kind] = handler
+
+    @property
+    def kinds(self) -> List[str]:
+        """Registered job kinds."""
+        return sorted(self._handlers)
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enqueue a job.
+
+        Args:
+            kind: Registered job kind
+            payload: Handler input
+
+        Returns:
+            The new job record
+
+        Raises:
+            ValueError: If no handler is registered for the kind
+            JobQueueFull: If ``max_queued`` jobs are already waiting
+        """
+        handler = self._handlers.get(kind)
+        if handler is None:
+            raise ValueError(f"Unknown job kind: '{kind}'")
+
+        now = self._clock()
+        with self._lock:
+            if self._queued >= self.max_queued:
+                self.rejected += 1
+                raise JobQueueFull(f"Job queue is full ({self.max_queued} jobs waiting)",
+                                   retry_after=self._retry_after())
+            self._queued += 1
+            self.submitted += 1
+
+        job = {field: None for field in JOB_FIELDS}
+        job.update(id=uuid.uuid4().hex, kind=kind, status=QUEUED, progress=0.0, stage='queued',
+                   created_at=now, updated_at=now, expires_at=self._unfinished_expiry(now))
+        try:
+            self.store.purge(now)
+            self.store.create(job)
+            self._executor.submit(self._run, job['id'], handler, payload)
+        except Exception:
+            with self._lock:
+                self._queued -= 1
+            raise
+        return job
+
+    def _unfinished_expiry(self, now: float) -> float:
+        """Expiry of a record not yet finished: lost once timed out, then kept like a result."""
+        return now + self.timeout + self.result_ttl
+
+    def _retry_after(self) -> int:
+        """Seconds until a slot is likely to free up, from recent job durations."""
+        if not self._durations:
+            return 1
+        average = sum(self._durations) / len(self._durations)
+        return max(1, math.ceil(average * (self._queued + 1) / self.max_workers))
+
+    def _run(self, job_id: str, handler: Callable, payload: Dict[str, Any]) -> None:
+        """Run one job on a worker thread, recording progress and outcome."""
+        started = self._clock()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        self.store.update(job_id, status=RUNNING, stage='running', started_at=started, updated_at=started,
+                          expires_at=self._unfinished_expiry(started))
+
+        def progress(fraction: float, stage: str) -> None:
+            self.store.update(job_id, progress=round(min(max(fraction, 0.0), 1.0), 3),
+                              stage=stage, updated_at=self._clock())
+
+        try:
+            result = handler(payload, progress)
+        except Exception as e:
+            outcome = dict(status=FAILED, stage='failed', error=str(e) or e.__class__.__name__)
+        else:
+            outcome = dict(status=SUCCEEDED, stage='done', progress=1.0, result=result)
+
+        finished = self._clock()
+        try:
+            self.store.update(job_id, finished_at=finished, updated_at=finished,
+                              expires_at=finished + self.result_ttl, **outcome)
+        except Exception as e:
+            # An unstorable result (e.g. not JSON-serializable) fails the job instead
+            outcome = dict(status=FAILED, stage='failed', error=f'Could not store result: {e}')
+            self.store.update(job_id, finished_at=finished, updated_at=finished,
+                              expires_at=finished + self.result_ttl, **outcome)
+        with self._lock:
+            self._running -= 1
+            if outcome['status'] == SUCCEEDED:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            self._durations = (self._durations + [finished - started])[-20:]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job record.
+
+        Returns:
+            The job, or None if it does not exist or its result has expired
+        """
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        now = self._clock()
+        if job['expires_at'] is not None and job['expires_at'] <= now:
+            return None
+        if job['status'] == RUNNING and now - job['started_at'] > self.timeout:
+            job.update(status=FAILED, stage='failed', error='Job was interrupted or timed out')
+        return job
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics for this process."""
+        with self._lock:
+            return {
+                'queued': self._queued,
+                'running': self._running,
+                'max_queued': self.max_queued,
+                'workers': self.max_workers,
+                'submitted': self.submitted,
+                'rejected': self.rejected,
+                'succeeded': self.succeeded,
+                'failed': self.failed
+            }
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=False)
+
+
+def job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Public view of a job record: the result is included only once it succeeded."""
+    view = {
+        'id': job['id'],
+        'kind': job['kind'],
+        'status': job['status'],
+        'progress': job['progress'],
+        'stage': job['stage'],
+        'created_at': job['created_at'],
+        'started_at': job['started_at'],
+        'finished_at': job['finished_at'],
+        'expires_at': job['expires_at']
+    }
+    if job['status'] == SUCCEEDED:
+        view['result'] = job['result']
+    elif job['status'] == FAILED:
+        view['error'] = job['error']
+    return view
+
+
+_shared_queue = None
+_shared_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide JobQueue."""
+    global _shared_queue
+    if _shared_queue is None:
+        with _shared_queue_lock:
+            if _shared_queue is None:
+                _shared_queue = JobQueue()
+    return _shared_queue
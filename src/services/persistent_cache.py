@@ -0,0 +1,181 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from config.settings import (
+    CACHE_DIR, PERSISTENT_CACHE_MAX_AGE, PERSISTENT_CACHE_MAX_BYTES, PERSISTENT_CACHE_FRESH_TTL
+)
+from utils.json_backend import dumps, loads
+from .http_cache import CachedResponse, ResponseCache
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_stored_at ON responses (stored_at);
+"""
+
+
+def thread_connection(local: threading.local, path: str) -> sqlite3.Connection:
+    """
+    Get this thread's connection to a SQLite database, opening it on first use.
+
+    Connections run in WAL mode with autocommit, so several threads and
+    processes can read and write the same file concurrently.
+
+    Args:
+        local: Thread-local storage owned by the caller
+        path: Database file path
+    """
+    conn = getattr(local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=30000')
+        local.conn = conn
+    return conn
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Persistent response cache stored in a SQLite database.
+
+    The database runs in WAL mode so several processes (web workers, batch CLI
+    jobs) can read and write the same file concurrently. Entries older than
+    ``max_age`` are dropped and the oldest entries are evicted once the stored
+    bodies exceed ``max_bytes``; compaction runs on open and every
+    ``compact_every`` writes.
+
+    Args:
+        path: Database file path (defaults to ``CACHE_DIR/github_cache.sqlite3``)
+        max_age: Maximum entry age in seconds
+        max_bytes: Maximum total size of stored bodies in bytes
+        fresh_ttl: Seconds during which entries are served without revalidation
+        compact_every: Number of writes between automatic compactions
+    """
+
+    def __init__(self, path: Optional[str] = None, max_age: float = PERSISTENT_CACHE_MAX_AGE,
+                 max_bytes: int = PERSISTENT_CACHE_MAX_BYTES,
+                 fresh_ttl: float = PERSISTENT_CACHE_FRESH_TTL, compact_every: int = 100):
+        super().__init__(fresh_ttl=fresh_ttl)
+        if path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, 'github_cache.sqlite3')
+        self.path = path
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.compact_every = compact_every
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+        self.evictions = 0
+
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        self.compact()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        return thread_connection(self._local, self.path)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get the cached entry for a key, if present and not expired."""
+        row = self._connect().execute(
+            'SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, stored_at = row
+        if time.time() - stored_at > self.max_age:
+            return None
+        return CachedResponse(loads(body), etag=etag, last_modified=last_modified,
+                              stored_at=stored_at)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry, compacting the database periodically."""
+        body = dumps(entry.body)
+        self._connect().execute(
+            'INSERT OR REPLACE INTO responses (key, body, etag, last_modified, stored_at, size) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (key, body, entry.etag, entry.last_modified, entry.stored_at, len(body))
+        )
+        with self._writes_lock:
+            self._writes += 1
+            due = self._writes % self.compact_every == 0
+        if due:
+            self.compact()
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._connect().execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._connect().execute('DELETE FROM responses')
+
+    def compact(self) -> int:
+        """
+        Evict expired entries, then the oldest entries until under the size limit.
+
+        Returns:
+            Number of entries removed
+        """
+        conn = self._connect()
+        removed = 0
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            cursor = conn.execute('DELETE FROM responses WHERE stored_at < ?',
+                                  (time.time() - self.max_age,))
+            removed += cursor.rowcount
+
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                cutoff = conn.execute(
+                    'SELECT stored_at FROM ('
+                    '  SELECT stored_at, SUM(size) OVER (ORDER BY stored_at, key) AS running'
+                    '  FROM responses'
+                    ') WHERE running >= ? ORDER BY stored_at LIMIT 1',
+                    (excess,)
+                ).fetchone()
+                if cutoff is not None:
+                    cursor = conn.execute('DELETE FROM responses WHERE stored_at <= ?', (cutoff[0],))
+                    removed += cursor.rowcount
+            conn.execute('COMMIT')
+        except sqlite3.OperationalError:
+            # Another process holds the write lock; it will compact instead
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            return 0
+
+        with self._writes_lock:
+            self.evictions += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        stats = super().get_stats()
+        entries, total = self._connect().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses'
+        ).fetchone()
+        stats.update({
+            'backend': 'sqlite',
+            'path': self.path,
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'max_age': self.max_age,
+            'evictions': self.evictions
+        })
+        return stats
+
+    def __len__(self) -> int:
+        return self._connect().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
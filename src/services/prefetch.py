@@ -0,0 +1,139 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from config.settings import PREFETCH_WORKERS, PREFETCH_MAX_PENDING, PREFETCH_TTL, REPO_CACHE_MAX_ENTRIES
+from .cache import TTLCache
+from .github_api import GitHubAPI, get_github_api
+
+
+class RepositoryPrefetcher:
+    """
+    Warms repository data in the background ahead of proposal generation.
+
+    A prefetch loads a repository's metadata (which also fills the client's
+    metadata and validator caches), whether it has a README and its language
+    breakdown on a small worker pool, and keeps the result for ``ttl`` seconds.
+    Prefetches for a repository already cached or in flight are not repeated,
+    and at most ``max_pending`` run or wait at a time; further requests are
+    skipped rather than queued, since a prefetch is only a hint.
+
+    Args:
+        api: Client to fetch with (defaults to the process-wide client)
+        max_workers: Worker threads
+        max_pending: Maximum prefetches in flight
+        ttl: Seconds prefetched details are served for
+        clock: Monotonic time source
+    """
+
+    def __init__(self, api: Optional[GitHubAPI] = None, max_workers: int = PREFETCH_WORKERS,
+                 max_pending: int = PREFETCH_MAX_PENDING, ttl: float = PREFETCH_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        self.api = api or get_github_api()
+        self.max_pending = max_pending
+        self.cache = TTLCache(max_entries=REPO_CACHE_MAX_ENTRIES, ttl=ttl, stale_ttl=0, clock=clock)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='github-prefetch')
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.scheduled = 0
+        self.skipped = 0
+        self.completed = 0
+        self.failed = 0
+
+    def prefetch(self, project_name: str) -> str:
+        """
+        Schedule a background fetch of a repository.
+
+        Args:
+            project_name: Repository name in format 'owner/repo'
+
+        Returns:
+            'scheduled', 'pending' (already in flight), 'cached' (already
+            prefetched) or 'skipped' (too many prefetches in flight)
+        """
+        key = project_name.lower()
+        if key in self.cache:
+            return 'cached'
+        with self._lock:
+            if key in self._pending:
+                return 'pending'
+            if len(self._pending) >= self.max_pending:
+                self.skipped += 1
+                return 'skipped'
+            future = self._executor.submit(self._load, key, project_name)
+            self._pending[key] = future
+            self.scheduled += 1
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return 'scheduled'
+
+    def _load(self, key: str, project_name: str) -> Dict[str, Any]:
+        """Fetch and cache the details of one repository."""
+        details = {
+            'project': self.api.get_project(project_name),
+            'has_readme': self.api.has_repository_readme(project_name),
+            'languages': self.api.fetch_repository_languages(project_name)
+        }
+        self.cache.set(key, details)
+        return details
+
+    def _finish(self, key: str, future: Future) -> None:
+        """Record the outcome of a prefetch; failures are only counted."""
+        with self._lock:
+            self._pending.pop(key, None)
+            if future.exception() is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def get_details(self, project_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get prefetched details of a repository.
+
+        Returns:
+            Dictionary with 'project' (GitHubProject), 'has_readme' (bool) and
+            'languages' (dict), like AsyncGitHubAPI.get_project_details, or None
+            if the repository has not been prefetched recently
+        """
+        return self.cache.get(project_name.lower())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get prefetch statistics."""
+        with self._lock:
+            stats = {
+                'pending': len(self._pending),
+                'max_pending': self.max_pending,
+                'scheduled': self.scheduled,
+                'skipped': self.skipped,
+                'completed': self.completed,
+                'failed': self.failed
+            }
+        stats['cache'] = self.cache.get_stats()
+        return stats
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=False)
+
+
+_shared_prefetcher = None
+_shared_prefetcher_lock = threading.Lock()
+
+
+def get_prefetcher(api: Optional[GitHubAPI] = None) -> RepositoryPrefetcher:
+    """
+    Get the process-wide RepositoryPrefetcher.
+
+    Like ``get_async_github_api``, the prefetcher is rebuilt when the underlying
+    client changes, so it never outlives its client.
+
+    Args:
+        api: Client to fetch with (defaults to the process-wide client)
+    """
+    global _shared_prefetcher
+    api = api or get_github_api()
+    with _shared_prefetcher_lock:
+        if _shared_prefetcher is None or _shared_prefetcher.api is not api:
+            if _shared_prefetcher is not None:
+                _shared_prefetcher.close()
+            _shared_prefetcher = RepositoryPrefetcher(api)
+        return _shared_prefetcher
@@ -1,101 +1,173 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
+from config.settings import DEFAULT_PROPOSAL_TEMPLATE
 from models.proposal import Proposal
 from models.github_project import GitHubProject
+from .history import ProposalHistory
+from .render_cache import RenderCache, RenderedProposal, render_key
+from .templates import TemplateRegistry, get_template_registry
 
 
-class ProposalGenerator:
-    def __init__(self):
-        self.proposals = []
+# Slots filled when a proposal is served rather than when it is rendered
+SERVE_TIME_SLOTS = ('generated_on',)
+
 
-    def generate(self, proposal: Proposal, github_project: GitHubProject) -> str:
+class ProposalGenerator:
+    def __init__(self, template_name: str = DEFAULT_PROPOSAL_TEMPLATE,
+                 templates: Optional[TemplateRegistry] = None,
+                 history: Optional[ProposalHistory] = None,
+                 render_cache: Optional[RenderCache] = None):
+        self.proposals = history if history is not None else ProposalHistory()
+        self.template_name = template_name
+        self.templates = templates or get_template_registry()
+        self.render_cache = render_cache
+
+    def _render_key(self, proposal: Proposal, github_project: GitHubProject,
+                    repo_version: Optional[str]) -> Optional[str]:
+        """Render cache key, or None when caching is off or the repository version is unknown."""
+        repo_version = repo_version or github_project.updated_at
+        if self.render_cache is None or not repo_version or not github_project.full_name:
+            return None
+        return render_key(proposal, github_project.full_name, repo_version,
+                          self.templates.get(self.template_name))
+
+    def lookup(self, proposal: Proposal, github_project: GitHubProject,
+               repo_version: Optional[str] = None) -> Optional[RenderedProposal]:
         """
-        Generate a comprehensive proposal based on user input and GitHub project data.
+        Find a cached rendering of a proposal for this repository state.
         
         Args:
             proposal: User's proposal with title, description, and conclusions
             github_project: GitHub project information
+            repo_version: Repository version (defaults to the project's updated_at)
             
         Returns:
-            Formatted proposal string
+            The cached RenderedProposal, or None
         """
-        # Store the proposal
-        proposal_data = {
-            'user_proposal': proposal.to_dict(),
-            'github_project': github_project.to_dict(),
-            'generated_at': datetime.now().isoformat(),
-            'formatted_proposal': None
-        }
+        key = self._render_key(proposal, github_project, repo_version)
+        return self.render_cache.get(key) if key is not None else None
+
+    def _bind(self, proposal: Proposal, github_project: GitHubProject,
+              repo_version: Optional[str], metadata: Optional[Dict[str, Any]]) -> RenderedProposal:
+        """
+        Get the rendering with serve-time slots open, from the render cache when possible.
+        
+        A new rendering is only cached together with its response metadata, so a
+        cache hit can always answer with complete metadata.
+        """
+        key = self._render_key(proposal, github_project, repo_version)
+        if key is not None:
+            cached = self.render_cache.get(key)
+            if cached is not None:
+                return cached
         
-        # Generate the formatted proposal
-        formatted_proposal = self._format_comprehensive_proposal(proposal, github_project)
-        proposal_data['formatted_proposal'] = formatted_proposal
+        template = self.templates.get(self.template_name)
+        bound = template.bind(self._build_context(proposal, github_project), SERVE_TIME_SLOTS)
+        if key is None or not metadata:
+            return RenderedProposal(bound, metadata)
+        return self.render_cache.put(key, github_project.full_name,
+                                     repo_version or github_project.updated_at, bound, metadata)
+
+    def generate(self, proposal: Proposal, github_project: GitHubProject,
+                 repo_version: Optional[str] = None,
+                 metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Generate a comprehensive proposal based on user input and GitHub project data.
         
-        self.proposals.append(proposal_data)
+        With a render cache, an identical proposal for the same repository version
+        and template is served from the cache; only the serve-time slots (the
+        "generated on" footer) are filled again.
         
+        Args:
+            proposal: User's proposal with title, description, and conclusions
+            github_project: GitHub project information
+            repo_version: Repository version for the render cache (defaults to the
+                project's updated_at)
+            metadata: Response metadata to cache along with a new rendering; a
+                rendering without metadata is not cached
+            
+        Returns:
+            Formatted proposal string
+        """
+        rendered = self._bind(proposal, github_project, repo_version, metadata)
+        formatted_proposal = rendered.template.render(self._serve_context())
+        self._store(proposal, github_project, formatted_proposal)
         return formatted_proposal
 
-    def _format_comprehensive_proposal(self, proposal: Proposal, github_project: GitHubProject) -> str:
-        """Format a comprehensive proposal combining user input and project data."""
+    def generate_stream(self, proposal: Proposal, github_project: GitHubProject,
+                        repo_version: Optional[str] = None,
+                        metadata: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Generate a proposal incrementally, yielding one section at a time.
         
-        formatted_proposal = f"""
-# {proposal.title}
-
-## Project Information
-**Repository:** {github_project.full_name}
-**URL:** {github_project.html_url}
-**Language:** {github_project.language or 'Not specified'}
-
-## Project Statistics
-- **Stars:** {github_project.stargazers_count:,}
-- **Forks:** {github_project.forks_count:,}
-- **Open Issues:** {github_project.open_issues_count:,}
-- **Created:** {github_project.get_formatted_date(github_project.created_at)}
-- **Last Updated:** {github_project.get_formatted_date(github_project.updated_at)}
-
-## Project Description
-{github_project.description}
-
-## Proposal Description
-{proposal.description}
-
-## Objectives and Conclusions
-"""
+        The joined chunks equal what generate() returns for the same input, and the
+        proposal is stored once the last section has been produced.
         
-        for i, conclusion in enumerate(proposal.conclusions_list, 1):
-            formatted_proposal += f"{i}. {conclusion}\n"
+        Args:
+            proposal: User's proposal with title, description, and conclusions
+            github_project: GitHub project information
+            repo_version: Repository version for the render cache (defaults to the
+                project's updated_at)
+            metadata: Response metadata to cache along with a new rendering; a
+                rendering without metadata is not cached
+            
+        Yields:
+            Consecutive chunks of the formatted proposal
+        """
+        rendered = self._bind(proposal, github_project, repo_version, metadata)
         
-        formatted_proposal += f"""
-
-## Project Context Analysis
-This proposal is designed for the **{github_project.full_name}** repository, which is primarily written in **{github_project.language or 'multiple languages'}**. 
-
-The project has demonstrated community engagement with **{github_project.stargazers_count:,} stars** and **{github_project.forks_count:,} forks**, indicating {"strong" if github_project.stargazers_count > 100 else "emerging"} community interest.
-
-With **{github_project.open_issues_count} open issues**, there {"are active development opportunities" if github_project.open_issues_count > 0 else "appears to be stable maintenance"} that align with this proposal's objectives.
-
-## Implementation Recommendations
-Based on the project's characteristics and the stated objectives, the following implementation approach is recommended:
-
-1. **Assessment Phase**: Review existing codebase and documentation
-2. **Planning Phase**: Align proposal objectives with project roadmap
-3. **Development Phase**: Implement changes following project conventions
-4. **Testing Phase**: Ensure compatibility with existing functionality
-5. **Documentation Phase**: Update relevant documentation and examples
-6. **Community Engagement**: Collaborate with maintainers and contributors
+        chunks = []
+        for chunk in rendered.template.render_sections(self._serve_context()):
+            chunks.append(chunk)
+            yield chunk
+        
+        self._store(proposal, github_project, ''.join(chunks))
 
-## Expected Outcomes
-The implementation of this proposal should result in:
-- Enhanced project functionality aligned with stated objectives
-- Improved user experience and community value
-- Sustainable code changes that follow project best practices
-- Clear documentation for future maintenance and development
+    def _store(self, proposal: Proposal, github_project: GitHubProject, formatted_proposal: str) -> None:
+        """Record a generated proposal in the history store."""
+        self.proposals.append({
+            'user_proposal': proposal.to_dict(),
+            'github_project': github_project.to_dict(),
+            'generated_at': datetime.now().isoformat(),
+            'formatted_proposal': formatted_proposal
+        })
 
----
-*Proposal generated on {datetime.now().strftime("%B %d, %Y at %I:%M %p")}*
-"""
-        
-        return formatted_proposal.strip()
+    def _format_comprehensive_proposal(self, proposal: Proposal, github_project: GitHubProject) -> str:
+        """Format a comprehensive proposal combining user input and project data."""
+        template = self.templates.get(self.template_name)
+        return template.render(self._build_context(proposal, github_project))
+
+    @staticmethod
+    def _serve_context() -> Dict[str, Any]:
+        """Compute the slot values filled each time a proposal is served."""
+        return {'generated_on': datetime.now().strftime("%B %d, %Y at %I:%M %p")}
+
+    def _build_context(self, proposal: Proposal, github_project: GitHubProject) -> Dict[str, Any]:
+        """Compute the dynamic slot values of a proposal template."""
+        context = {
+            'title': proposal.title,
+            'full_name': github_project.full_name,
+            'html_url': github_project.html_url,
+            'language': github_project.language or 'Not specified',
+            'stars': f"{github_project.stargazers_count:,}",
+            'forks': f"{github_project.forks_count:,}",
+            'open_issues': f"{github_project.open_issues_count:,}",
+            'created': github_project.get_formatted_date(github_project.created_at),
+            'updated': github_project.get_formatted_date(github_project.updated_at),
+            'project_description': github_project.description,
+            'proposal_description': proposal.description,
+            'conclusions': ''.join(
+                f"{i}. {conclusion}\n" for i, conclusion in enumerate(proposal.conclusions_list, 1)
+            ),
+            'primary_language': github_project.language or 'multiple languages',
+            'community_interest': "strong" if github_project.stargazers_count > 100 else "emerging",
+            'open_issues_count': github_project.open_issues_count,
+            'maintenance_outlook': ("are active development opportunities"
+                                    if github_project.open_issues_count > 0
+                                    else "appears to be stable maintenance")
+        }
+        context.update(self._serve_context())
+        return context
 
     def add_proposal(self, title: str, description: str, conclusions: List[str]) -> Dict[str, Any]:
         """Add a proposal to the internal storage (legacy method)."""
@@ -118,17 +190,17 @@ The implementation of this proposal should result in:
         return formatted_proposal
 
     def get_all_proposals(self) -> List[Dict[str, Any]]:
-        """Get all stored proposals."""
-        return self.proposals
+        """Get all stored proposals (at most the history limit, oldest first)."""
+        return self.proposals.to_list()
 
     def get_latest_proposal(self) -> Dict[str, Any]:
         """Get the most recently generated proposal."""
-        return self.proposals[-1] if self.proposals else None
+        return self.proposals[-1] if len(self.proposals) else None
 
     def export_proposal_to_markdown(self, proposal_index: int = -1) -> str:
         """Export a proposal to markdown format."""
-        if not self.proposals:
+        if not len(self.proposals):
             return "No proposals available"
         
-        proposal = self.proposals[proposal_index]
-        return proposal.get('formatted_proposal', 'No formatted proposal available')
+        content = self.proposals.get_content(proposal_index)
+        return content if content is not None else 'No formatted proposal available'
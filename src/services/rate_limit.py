@@ -0,0 +1,183 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+from config.settings import RATE_LIMIT_MAX_WAIT, RATE_LIMIT_PACE_BELOW
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to wait longer than allowed for budget."""
+
+    def __init__(self, resource: str, wait: float):
+        super().__init__(f"GitHub {resource} API rate limit exceeded; resets in {int(wait)}s")
+        self.resource = resource
+        self.wait = wait
+
+
+def _header_number(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    """Read a numeric response header, ignoring missing or malformed values."""
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimitBudget:
+    """Known request budget of one GitHub rate limit resource."""
+
+    def __init__(self, resource: str):
+        self.resource = resource
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None
+        self.blocked_until = 0.0
+        self.next_slot = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+
+class RateLimitScheduler:
+    """
+    Paces GitHub requests to stay within the rate limits reported by the API.
+    
+    Budgets are tracked separately per resource ('core', 'search', 'graphql') from
+    the X-RateLimit-* headers. Once less than ``pace_below`` of a budget remains,
+    requests are spread evenly until the reset time; when the budget is exhausted
+    or GitHub answers with Retry-After, requests wait for the window to reopen.
+    Waits longer than ``max_wait`` raise RateLimitExceeded instead of blocking.
+    """
+
+    def __init__(self, max_wait: float = RATE_LIMIT_MAX_WAIT, pace_below: float = RATE_LIMIT_PACE_BELOW,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        self.max_wait = max_wait
+        self.pace_below = pace_below
+        self._clock = clock
+        self._sleep = sleep
+        self._budgets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def resource_for(url: str) -> str:
+        """Get the rate limit resource a request URL is counted against."""
+        if '/search/' in url:
+            return 'search'
+        if url.rstrip('/').endswith('/graphql'):
+            return 'graphql'
+        return 'core'
+
+    def _budget(self, resource: str) -> RateLimitBudget:
+        budget = self._budgets.get(resource)
+        if budget is None:
+            budget = self._budgets[resource] = RateLimitBudget(resource)
+        return budget
+
+    def acquire(self, resource: str) -> float:
+        """
+        Wait until a request against a resource fits the budget.
+        
+        Args:
+            resource: Rate limit resource name
+            
+        Returns:
+            Seconds waited
+            
+        Raises:
+            RateLimitExceeded: If the required wait exceeds max_wait
+        """
+        with self._lock:
+            budget = self._budget(resource)
+            now = self._clock()
+            start = max(now, budget.blocked_until)
+            
+            if budget.remaining is not None and budget.reset_at is not None and budget.reset_at > now:
+                if budget.remaining <= 0:
+                    start = max(start, budget.reset_at)
+                elif budget.limit and budget.remaining < budget.limit * self.pace_below:
+                    interval = (budget.reset_at - now) / budget.remaining
+                    start = max(start, budget.next_slot)
+                    budget.next_slot = start + interval
+            
+            wait = start - now
+            if wait > self.max_wait:
+                budget.throttled += 1
+                raise RateLimitExceeded(resource, wait)
+            
+            budget.requests += 1
+            if budget.remaining is not None and budget.remaining > 0:
+                budget.remaining -= 1
+            if wait > 0:
+                budget.throttled += 1
+                budget.total_wait += wait
+        
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def update(self, resource: str, headers: Mapping[str, Any]) -> None:
+        """Record the budget reported by a response's X-RateLimit-* headers."""
+        reported = headers.get('X-RateLimit-Resource')
+        if isinstance(reported, str) and reported:
+            resource = reported
+        limit = _header_number(headers, 'X-RateLimit-Limit')
+        remaining = _header_number(headers, 'X-RateLimit-Remaining')
+        reset_at = _header_number(headers, 'X-RateLimit-Reset')
+        if remaining is None and reset_at is None:
+            return
+        with self._lock:
+            budget = self._budget(resource)
+            if limit is not None:
+                budget.limit = int(limit)
+            if remaining is not None:
+                budget.remaining = int(remaining)
+            if reset_at is not None:
+                budget.reset_at = reset_at
+
+    def backoff(self, resource: str, headers: Mapping[str, Any]) -> Optional[float]:
+        """
+        Handle a rate-limited (403/429) response.
+        
+        Args:
+            resource: Rate limit resource name
+            headers: Response headers
+            
+        Returns:
+            Seconds until the request may be retried, or None if the response
+            carries no rate limit information (e.g. a plain permission error)
+        """
+        self.update(resource, headers)
+        now = self._clock()
+        retry_after = _header_number(headers, 'Retry-After')
+        remaining = _header_number(headers, 'X-RateLimit-Remaining')
+        reset_at = _header_number(headers, 'X-RateLimit-Reset')
+        
+        if retry_after is not None:
+            until = now + retry_after
+        elif remaining == 0 and reset_at is not None:
+            until = reset_at
+        else:
+            return None
+        
+        with self._lock:
+            budget = self._budget(resource)
+            budget.blocked_until = max(budget.blocked_until, until)
+        return max(0.0, until - now)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the remaining budget and throttling counters per resource."""
+        now = self._clock()
+        with self._lock:
+            return {
+                resource: {
+                    'limit': budget.limit,
+                    'remaining': budget.remaining,
+                    'reset_in': round(max(0.0, budget.reset_at - now), 1) if budget.reset_at else None,
+                    'blocked_for': round(max(0.0, budget.blocked_until - now), 1),
+                    'requests': budget.requests,
+                    'throttled': budget.throttled,
+                    'total_wait': round(budget.total_wait, 3)
+                }
+                for resource, budget in self._budgets.items()
+            }
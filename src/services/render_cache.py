@@ -0,0 +1,148 @@
+import hashlib
+import threading
+from typing import Any, Dict, Mapping, Optional
+from config.settings import RENDER_CACHE_MAX_ENTRIES, RENDER_CACHE_TTL
+from models.proposal import Proposal
+from utils.json_backend import dumps
+from .cache import TTLCache
+from .templates import CompiledTemplate
+
+
+def render_key(proposal: Proposal, full_name: str, repo_version: str,
+               template: CompiledTemplate) -> str:
+    """
+    Content address of a rendered proposal.
+
+    Args:
+        proposal: Sanitized user proposal
+        full_name: Repository name in format 'owner/repo'
+        repo_version: Identifies the repository state (see GitHubAPI.get_repository_version)
+        template: Template the proposal is rendered with
+
+    Returns:
+        SHA-256 hex digest over the proposal fields, repository, its version and
+        the template name and version
+    """
+    payload = dumps([proposal.to_dict(), full_name.lower(), repo_version,
+                     template.name, template.version], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderedProposal:
+    """
+    A cached proposal rendering.
+
+    Holds the template bound to everything but its serve-time slots, plus any
+    response metadata the caller stored with it.
+    """
+    __slots__ = ('template', 'metadata')
+
+    def __init__(self, template: CompiledTemplate, metadata: Optional[Dict[str, Any]] = None):
+        self.template = template
+        self.metadata = metadata or {}
+
+
+class RenderCache:
+    """
+    Content-addressed cache of rendered proposals.
+
+    Entries are keyed by ``render_key``, so an identical submission against an
+    unchanged repository and template is served without rendering again. Only the
+    latest version of each repository is kept: storing a rendering for a new
+    version drops the entries of the previous one.
+
+    Args:
+        max_entries: Maximum number of cached renderings
+        ttl: Seconds a rendering is kept
+    """
+
+    def __init__(self, max_entries: int = RENDER_CACHE_MAX_ENTRIES, ttl: float = RENDER_CACHE_TTL):
+        self._cache = TTLCache(max_entries=max_entries, ttl=ttl, stale_ttl=0)
+        self._versions: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[RenderedProposal]:
+        """Get the rendering stored under a key, or None."""
+        return self._cache.get(key)
+
+    def put(self, key: str, full_name: str, repo_version: str, template: CompiledTemplate,
+            metadata: Optional[Mapping[str, Any]] = None) -> RenderedProposal:
+        """
+        Store a bound template.
+
+        Args:
+            key: Key from ``render_key``
+            full_name: Repository name in format 'owner/repo'
+            repo_version: Repository version the rendering was made from
+            template: Template bound to all but its serve-time slots
+            metadata: Optional response metadata to serve with it
+
+        Returns:
+            The stored RenderedProposal
+        """
+        entry = RenderedProposal(template, dict(metadata) if metadata else None)
+        repository = full_name.lower()
+        with self._lock:
+            version, keys = self._versions.get(repository, (None, set()))
+            if version != repo_version:
+                for stale_key in keys:
+                    self._cache.invalidate(stale_key)
+                    self.invalidations += 1
+                keys = set()
+            keys.add(key)
+            self._versions[repository] = (repo_version, keys)
+            self._cache.set(key, entry)
+            # Evicted keys are only forgotten in batches, keeping puts cheap
+            limit = 2 * self._cache.max_entries
+            if len(self._versions) > limit or len(keys) > limit:
+                self._forget_evicted()
+        return entry
+
+    def _forget_evicted(self) -> None:
+        """Stop tracking keys the LRU has already evicted."""
+        for repository, (version, keys) in list(self._versions.items()):
+            keys = {key for key in keys if key in self._cache}
+            if keys:
+                self._versions[repository] = (version, keys)
+            else:
+                del self._versions[repository]
+
+    def invalidate_repository(self, full_name: str) -> None:
+        """Drop every rendering of a repository."""
+        with self._lock:
+            _, keys = self._versions.pop(full_name.lower(), (None, set()))
+            for key in keys:
+                self._cache.invalidate(key)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove all renderings."""
+        with self._lock:
+            self._versions.clear()
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        stats = self._cache.get_stats()
+        with self._lock:
+            stats['repositories'] = len(self._versions)
+            stats['invalidations'] = self.invalidations
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCache:
+    """Get the process-wide RenderCache."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = RenderCache()
+    return _shared_cache
@@ -0,0 +1,290 @@
+import logging
+import math
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from config.settings import REPO_INDEX_MAX_DOCUMENTS, REPO_INDEX_PATH
+from utils.json_backend import dumps, loads
+from utils.keywords import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Repository fields kept for each indexed document
+DOCUMENT_FIELDS = ('name', 'full_name', 'description', 'language', 'stargazers_count',
+                   'forks_count', 'open_issues_count', 'html_url', 'updated_at', 'topics')
+
+# Field weights: a term in the repository name counts three times, in a topic twice
+FIELD_WEIGHTS = (('name', 3), ('topics', 2), ('language', 1), ('description', 1))
+
+_QUERY_TOKEN_PATTERN = re.compile(r'"[^"]*"|\S+')
+_RANGE_PATTERN = re.compile(r'^(>=|<=|>|<)?(\d+)$')
+_COMPARISONS = {
+    '>': lambda value, bound: value > bound,
+    '>=': lambda value, bound: value >= bound,
+    '<': lambda value, bound: value < bound,
+    '<=': lambda value, bound: value <= bound,
+    None: lambda value, bound: value == bound
+}
+
+
+def parse_query(query: str) -> Optional[Tuple[List[str], List[Callable[[Dict[str, Any]], bool]]]]:
+    """
+    Split a GitHub search query into terms and document filters.
+
+    Supports free text (quoted phrases match as their individual terms) and the
+    ``language:``, ``stars:`` and ``forks:`` qualifiers (with >, >=, <, <= or an
+    exact count).
+
+    Returns:
+        Tuple of (terms, filters), or None if the query uses a qualifier the
+        local index cannot evaluate
+    """
+    terms, filters = [], []
+    for token in _QUERY_TOKEN_PATTERN.findall(query.lower()):
+        if ':' not in token or token.startswith('"'):
+            terms.extend(tokenize(token))
+            continue
+        qualifier, value = token.split(':', 1)
+        if qualifier == 'language':
+            filters.append(lambda doc, value=value: (doc['language'] or '').lower() == value)
+            continue
+        match = _RANGE_PATTERN.match(value)
+        if qualifier in ('stars', 'forks') and match:
+            field = 'stargazers_count' if qualifier == 'stars' else 'forks_count'
+            compare, bound = _COMPARISONS[match.group(1)], int(match.group(2))
+            filters.append(lambda doc, field=field, compare=compare, bound=bound:
+                           compare(doc[field] or 0, bound))
+            continue
+        return None
+    return terms, filters
+
+
+class RepositoryIndex:
+    """
+    In-memory inverted index over repositories the application has seen.
+
+    Repositories fetched from the API or returned by searches are indexed on
+    their name, description, topics and language, and can then be searched
+    offline with BM25 ranking (stars break ties). Terms are weighted by field
+    (see ``FIELD_WEIGHTS``). The index holds at most ``max_documents``
+    repositories, dropping the least recently indexed first. With a ``path``,
+    the index is loaded from that JSON file on creation and saved back every
+    ``save_every`` additions.
+
+    Args:
+        max_documents: Maximum number of indexed repositories
+        path: Optional JSON file to load from and save to
+        save_every: Number of additions between automatic saves when ``path`` is set
+        k1: BM25 term frequency saturation
+        b: BM25 document length normalization
+    """
+
+    def __init__(self, max_documents: int = REPO_INDEX_MAX_DOCUMENTS, path: Optional[str] = None,
+                 save_every: int = 100, k1: float = 1.2, b: float = 0.75):
+        self.max_documents = max_documents
+        self.path = None
+        self.save_every = save_every
+        self.k1 = k1
+        self.b = b
+        self._additions = 0
+        self._documents = OrderedDict()
+        self._term_freqs = {}
+        self._lengths = {}
+        self._total_length = 0
+        self._postings = defaultdict(set)
+        self._lock = threading.Lock()
+        self.searches = 0
+        self.evictions = 0
+        self.save_errors = 0
+        if path and os.path.exists(path):
+            self.load(path)
+        # Set after loading so the initial load does not trigger saves
+        self.path = path
+
+    def add(self, repo: Dict[str, Any]) -> bool:
+        """
+        Index a repository payload, replacing any earlier version of it.
+
+        Returns:
+            True if the repository was indexed (payloads without a full_name are skipped)
+        """
+        key = (repo.get('full_name') or '').lower()
+        if not key:
+            return False
+        document = {field: repo.get(field) for field in DOCUMENT_FIELDS}
+        document['topics'] = list(document['topics'] or [])
+
+        term_freqs = defaultdict(int)
+        for field, weight in FIELD_WEIGHTS:
+            value = document[field]
+            text = ' '.join(value) if isinstance(value, list) else value
+            for term in tokenize(text):
+                term_freqs[term] += weight
+
+        with self._lock:
+            self._remove(key)
+            self._documents[key] = document
+            self._term_freqs[key] = dict(term_freqs)
+            length = sum(term_freqs.values())
+            self._lengths[key] = length
+            self._total_length += length
+            for term in term_freqs:
+                self._postings[term].add(key)
+            while len(self._documents) > self.max_documents:
+                self._remove(next(iter(self._documents)))
+                self.evictions += 1
+            self._additions += 1
+            due = self.path is not None and self._additions % self.save_every == 0
+        if due:
+            self._autosave()
+        return True
+
+    def add_many(self, repos: Iterable[Dict[str, Any]]) -> int:
+        """Index several repositories; returns how many were indexed."""
+        return sum(1 for repo in repos if self.add(repo))
+
+    def _remove(self, key: str) -> None:
+        """Drop a document from the index. Caller must hold the lock."""
+        if key not in self._documents:
+            return
+        del self._documents[key]
+        for term in self._term_freqs.pop(key):
+            postings = self._postings[term]
+            postings.discard(key)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(key)
+
+    def search(self, query: str, limit: Optional[int] = 10, match_all: bool = True) -> List[Dict[str, Any]]:
+        """
+        Search the index with a GitHub-style query.
+
+        Args:
+            query: Search query; see ``parse_query`` for supported qualifiers
+            limit: Maximum number of results (all matches when None)
+            match_all: Require every term to match, as GitHub search does
+
+        Returns:
+            Matching repository dictionaries, best first; empty if the query
+            uses qualifiers the index cannot evaluate
+        """
+        parsed = parse_query(query)
+        if parsed is None:
+            return []
+        terms, filters = parsed
+        terms = list(dict.fromkeys(terms))
+
+        with self._lock:
+            self.searches += 1
+            count = len(self._documents)
+            if not count:
+                return []
+            if terms:
+                postings = [self._postings.get(term, set()) for term in terms]
+                candidates = set.intersection(*postings) if match_all else set.union(*postings)
+            else:
+                candidates = set(self._documents)
+
+            average_length = self._total_length / count or 1.0
+            idf = {term: math.log(1 + (count - len(self._postings.get(term, ())) + 0.5)
+                                  / (len(self._postings.get(term, ())) + 0.5))
+                   for term in terms}
+            scored = []
+            for key in candidates:
+                document = self._documents[key]
+                if not all(check(document) for check in filters):
+                    continue
+                freqs = self._term_freqs[key]
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[key] / average_length)
+                score = 0.0
+                for term in terms:
+                    tf = freqs.get(term, 0)
+                    if tf:
+                        score += idf[term] * tf * (self.k1 + 1) / (tf + norm)
+                scored.append((-score, -(document['stargazers_count'] or 0), key, document))
+
+        scored.sort(key=lambda entry: entry[:3])
+        return [dict(entry[3]) for entry in scored[:limit]]
+
+    def document_frequency(self, term: str) -> int:
+        """Number of indexed repositories containing a term."""
+        return len(self._postings.get(term, ()))
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write the indexed repositories to a JSON file (postings are rebuilt on load).
+
+        The file is written to a uniquely named temporary file in the same
+        directory and then renamed over the target, so concurrent saves from
+        several processes never mix their contents.
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path = path or self.path
+        with self._lock:
+            documents = list(self._documents.values())
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory or None, prefix=f'.{os.path.basename(path)}.',
+                                        suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(dumps(documents))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _autosave(self) -> None:
+        """Save during indexing; the index is optional, so failures are only logged."""
+        try:
+            self.save()
+        except OSError as e:
+            with self._lock:
+                self.save_errors += 1
+            logger.warning("Could not save repository index to %s: %s", self.path, e)
+
+    def load(self, path: Optional[str] = None) -> int:
+        """Index the repositories stored in a JSON file; returns how many were loaded."""
+        with open(path or self.path, 'r', encoding='utf-8') as f:
+            return self.add_many(loads(f.read()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        with self._lock:
+            return {
+                'documents': len(self._documents),
+                'max_documents': self.max_documents,
+                'terms': len(self._postings),
+                'searches': self.searches,
+                'evictions': self.evictions,
+                'save_errors': self.save_errors
+            }
+
+    def __contains__(self, full_name: str) -> bool:
+        return full_name.lower() in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def get_repository_index() -> RepositoryIndex:
+    """Get the process-wide RepositoryIndex, loaded from REPO_INDEX_PATH when set."""
+    global _shared_index
+    if _shared_index is None:
+        with _shared_index_lock:
+            if _shared_index is None:
+                _shared_index = RepositoryIndex(path=REPO_INDEX_PATH or None)
+    return _shared_index
@@ -0,0 +1,161 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict
+from config.settings import (
+    GITHUB_MAX_RETRIES, GITHUB_RETRY_BASE_DELAY, GITHUB_RETRY_MAX_DELAY, GITHUB_RETRY_BUDGET_RATIO,
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter and a retry budget.
+    
+    The budget caps retries at ``budget_ratio`` of the requests made (plus a small
+    reserve of ``min_retries``), so a failing upstream does not get hit with a
+    multiple of normal traffic.
+    
+    Args:
+        max_retries: Maximum retries per request
+        base_delay: Delay ceiling for the first retry in seconds
+        max_delay: Maximum delay ceiling in seconds
+        budget_ratio: Retry tokens earned per request
+        min_retries: Retry tokens available before any requests were made
+    """
+
+    def __init__(self, max_retries: int = GITHUB_MAX_RETRIES, base_delay: float = GITHUB_RETRY_BASE_DELAY,
+                 max_delay: float = GITHUB_RETRY_MAX_DELAY, budget_ratio: float = GITHUB_RETRY_BUDGET_RATIO,
+                 min_retries: int = 10, random_func: Callable[[float, float], float] = random.uniform):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.max_tokens = float(min_retries)
+        self._random = random_func
+        self._tokens = float(min_retries)
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.budget_exhausted = 0
+
+    def record_request(self) -> None:
+        """Earn retry budget for a request sent."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.budget_ratio)
+
+    def should_retry(self, attempt: int) -> bool:
+        """
+        Check whether a failed attempt may be retried, spending budget if so.
+        
+        Args:
+            attempt: Number of retries already made for this request
+        """
+        if attempt >= self.max_retries:
+            return False
+        with self._lock:
+            if self._tokens < 1:
+                self.budget_exhausted += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+    def delay(self, attempt: int) -> float:
+        """Get the jittered backoff delay before retry number ``attempt + 1``."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return self._random(0, ceiling)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get retry statistics."""
+        with self._lock:
+            return {
+                'max_retries': self.max_retries,
+                'retries': self.retries,
+                'budget_remaining': round(self._tokens, 2),
+                'budget_exhausted': self.budget_exhausted
+            }
+
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream that keeps failing.
+    
+    After ``failure_threshold`` consecutive failures the circuit opens and requests
+    are rejected immediately. Once ``reset_timeout`` has passed a single trial
+    request is let through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current circuit state."""
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a trial request through."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get circuit breaker statistics."""
+        state = self.state
+        with self._lock:
+            return {
+                'state': state,
+                'consecutive_failures': self._failures,
+                'times_opened': self.times_opened,
+                'rejected': self.rejected
+            }
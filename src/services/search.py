@@ -0,0 +1,305 @@
+import re
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from config.settings import (
+    SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_TTL, SEARCH_MIN_STARS, SEARCH_MIN_FORKS,
+    REPO_INDEX_ENABLED, REPO_INDEX_MIN_RESULTS
+)
+from utils.json_backend import select_items
+from utils.keywords import KeywordExtractor
+from .cache import TTLCache
+from .github_api import GitHubAPI, get_github_api
+from .repo_index import RepositoryIndex, get_repository_index
+
+
+# GitHub only ever returns the first 1000 results of a search
+MAX_SEARCH_RESULTS = 1000
+MAX_PER_PAGE = 100
+
+_TOKEN_PATTERN = re.compile(r'"[^"]*"|\S+')
+_STRIP_CHARS = '.,!?;:()[]{}\'"'
+
+
+def extract_search_terms(title: str = '', description: str = '', conclusions: str = '',
+                         max_terms: int = 5, corpus: Optional[RepositoryIndex] = None) -> List[str]:
+    """
+    Pick search terms from proposal text.
+
+    The title keywords, then the best remaining keywords by TF-IDF (see
+    ``utils.keywords``), up to ``max_terms``, are returned in sorted order. Ties
+    are broken alphabetically, so texts differing only in case, punctuation or
+    word order give the same terms.
+
+    Args:
+        title: Proposal title
+        description: Proposal description
+        conclusions: Proposal conclusions
+        max_terms: Maximum number of terms
+        corpus: Repository index providing document frequencies
+
+    Returns:
+        Sorted list of search terms (possibly empty)
+    """
+    return sorted(KeywordExtractor(corpus).extract(title, description, conclusions, max_terms))
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonicalize a GitHub search query.
+
+    GitHub search is case-insensitive and terms are combined with AND, so terms
+    are lowercased, deduplicated and sorted, with ``qualifier:value`` terms
+    placed after free-text terms. Quoted phrases are kept intact.
+    """
+    terms, qualifiers = set(), set()
+    for token in _TOKEN_PATTERN.findall(query.lower()):
+        if token.startswith('"'):
+            terms.add(token)
+        elif ':' in token:
+            qualifiers.add(token)
+        else:
+            term = token.strip(_STRIP_CHARS)
+            if term:
+                terms.add(term)
+    return ' '.join(sorted(terms) + sorted(qualifiers))
+
+
+def build_search_query(title: str = '', description: str = '', conclusions: str = '',
+                       language: str = '', min_stars: int = SEARCH_MIN_STARS,
+                       min_forks: int = SEARCH_MIN_FORKS,
+                       corpus: Optional[RepositoryIndex] = None) -> str:
+    """
+    Build a normalized repository search query from proposal text.
+
+    Args:
+        title: Proposal title
+        description: Proposal description
+        conclusions: Proposal conclusions
+        language: Optional primary language filter
+        min_stars: Only match repositories with more stars than this
+        min_forks: Only match repositories with more forks than this
+        corpus: Repository index used to weight terms by rarity
+
+    Returns:
+        Normalized query string
+
+    Raises:
+        ValueError: If the text contains no usable search terms
+    """
+    terms = extract_search_terms(title, description, conclusions, corpus=corpus)
+    if not terms:
+        raise ValueError('No valid search terms found in proposal')
+
+    parts = list(terms)
+    if language.strip():
+        parts.append(f'language:{language.strip()}')
+    # Only repositories with some community engagement
+    parts.append(f'stars:>{min_stars}')
+    parts.append(f'forks:>{min_forks}')
+    return normalize_query(' '.join(parts))
+
+
+class RepositorySearchService:
+    """
+    Repository search with normalized queries, a result cache and pagination.
+
+    Requests go through the shared ``GitHubAPI`` client, so they use its pooled
+    session, rate-limit scheduler and conditional-request cache. On top of that,
+    pages are cached by normalized query, so equivalent queries are answered
+    without contacting GitHub until the entry expires.
+
+    GitHub allows only 30 searches a minute, so a search is first run against the
+    local index of repositories seen so far. When it finds at least
+    ``min_local_results`` matches, the query is answered locally and GitHub is
+    not contacted. The source is chosen once per normalized query and cached
+    with the local matches, so every page of a query comes from the same
+    source and the same result set; locally answered queries end at the last
+    local match.
+
+    Args:
+        api: GitHub client (defaults to the process-wide client)
+        cache: Result cache (defaults to a TTLCache sized from settings)
+        index: Local repository index (defaults to the process-wide index if enabled)
+        min_local_results: Matches the local index needs to answer a search
+    """
+
+    def __init__(self, api: Optional[GitHubAPI] = None, cache: Optional[TTLCache] = None,
+                 index: Optional[RepositoryIndex] = None,
+                 min_local_results: int = REPO_INDEX_MIN_RESULTS):
+        self._api = api
+        self.cache = cache if cache is not None else TTLCache(
+            max_entries=SEARCH_CACHE_MAX_ENTRIES, ttl=SEARCH_CACHE_TTL, stale_ttl=0
+        )
+        if index is None and REPO_INDEX_ENABLED:
+            index = get_repository_index()
+        self.index = index
+        self.min_local_results = min_local_results
+        self._stats_lock = threading.Lock()
+        self.local_searches = 0
+        self.remote_searches = 0
+
+    @property
+    def api(self) -> GitHubAPI:
+        return self._api if self._api is not None else get_github_api()
+
+    def search(self, query: str, sort: str = 'stars', order: str = 'desc', page: int = 1,
+               per_page: int = 10, fields: Optional[Iterable[str]] = None,
+               prefer_local: bool = True) -> Dict[str, Any]:
+        """
+        Get one page of search results.
+
+        Args:
+            query: GitHub search query (normalized before use)
+            sort: Sort field ('stars', 'forks', 'updated', ...)
+            order: Sort order ('asc' or 'desc')
+            page: Page number, starting at 1
+            per_page: Results per page (1-100)
+            fields: Repository fields to keep in each item (all when None)
+            prefer_local: Answer from the local index when it had enough matches
+                the first time this query was searched
+
+        Returns:
+            Dictionary with 'query', 'total_count', 'items', 'page', 'per_page',
+            'has_more' and 'source' ('local' or 'github')
+
+        Raises:
+            ValueError: If the query or paging arguments are invalid
+            GitHubAPIError: If the search request fails
+        """
+        query = normalize_query(query)
+        if not query:
+            raise ValueError('Search query is empty')
+        if page < 1 or not 1 <= per_page <= MAX_PER_PAGE:
+            raise ValueError(f'page must be >= 1 and per_page between 1 and {MAX_PER_PAGE}')
+        if (page - 1) * per_page >= MAX_SEARCH_RESULTS:
+            raise ValueError(f'GitHub only returns the first {MAX_SEARCH_RESULTS} search results')
+
+        fields = tuple(fields) if fields is not None else None
+        if prefer_local and self.index is not None:
+            matches = self.cache.get_or_load(('source', query), lambda: self._local_matches(query))
+            if matches is not None:
+                return self._local_page(query, matches, page, per_page, fields)
+
+        key = (query, sort, order, page, per_page, fields)
+
+        def load() -> Dict[str, Any]:
+            with self._stats_lock:
+                self.remote_searches += 1
+            data = self.api.search_repositories(query, sort=sort, order=order, per_page=per_page,
+                                                page=page, fields=fields)
+            items = data.get('items', [])
+            total = min(data.get('total_count', 0), MAX_SEARCH_RESULTS)
+            return {
+                'query': query,
+                'total_count': total,
+                'items': items,
+                'page': page,
+                'per_page': per_page,
+                'has_more': len(items) == per_page and page * per_page < total,
+                'source': 'github'
+            }
+
+        return self.cache.get_or_load(key, load)
+
+    def _local_matches(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """Get every local match of a query, or None if there are too few to answer it locally."""
+        matches = self.index.search(query, limit=None)
+        return matches if len(matches) >= self.min_local_results else None
+
+    def _local_page(self, query: str, matches: List[Dict[str, Any]], page: int, per_page: int,
+                    fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+        """Build one page of a locally answered search."""
+        end = page * per_page
+        items = matches[end - per_page:end]
+        with self._stats_lock:
+            self.local_searches += 1
+        return {
+            'query': query,
+            'total_count': len(matches),
+            'items': select_items(items, fields) if fields is not None else items,
+            'page': page,
+            'per_page': per_page,
+            'has_more': len(matches) > end,
+            'source': 'local'
+        }
+
+    def iter_results(self, query: str, sort: str = 'stars', order: str = 'desc',
+                     per_page: int = 30, max_results: Optional[int] = None,
+                     fields: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over search results, fetching further pages only as they are consumed.
+
+        Pages always come from GitHub, so results are not mixed with local ones.
+
+        Args:
+            query: GitHub search query
+            sort: Sort field
+            order: Sort order
+            per_page: Results fetched per request (1-100)
+            max_results: Stop after this many results (GitHub caps searches at 1000)
+            fields: Repository fields to keep in each item
+
+        Yields:
+            Repository dictionaries
+        """
+        limit = MAX_SEARCH_RESULTS if max_results is None else min(max_results, MAX_SEARCH_RESULTS)
+        fields = tuple(fields) if fields is not None else None
+        yielded = 0
+        page = 1
+        while yielded < limit:
+            result = self.search(query, sort=sort, order=order, page=page, per_page=per_page,
+                                 fields=fields, prefer_local=False)
+            for item in result['items']:
+                yield item
+                yielded += 1
+                if yielded >= limit:
+                    return
+            if not result['has_more']:
+                return
+            page += 1
+
+    def search_proposal(self, title: str = '', description: str = '', conclusions: str = '',
+                        language: str = '', page: int = 1, per_page: int = 10,
+                        fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Search repositories matching proposal text.
+
+        Keyword weights depend on the local index, which grows with every
+        search, so the query built for a text is cached alongside the results.
+        Resubmitting the same text then reuses the same query and cached pages.
+
+        Raises:
+            ValueError: If the text contains no usable search terms
+            GitHubAPIError: If the search request fails
+        """
+        key = ('query',) + tuple(' '.join(text.lower().split())
+                                 for text in (title, description, conclusions, language))
+        query = self.cache.get_or_load(key, lambda: build_search_query(
+            title, description, conclusions, language, corpus=self.index
+        ))
+        return self.search(query, page=page, per_page=per_page, fields=fields)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get search, result cache and local index statistics."""
+        with self._stats_lock:
+            stats = {
+                'local_searches': self.local_searches,
+                'remote_searches': self.remote_searches
+            }
+        stats['result_cache'] = self.cache.get_stats()
+        stats['index'] = self.index.get_stats() if self.index is not None else None
+        return stats
+
+
+_shared_search = None
+_shared_search_lock = threading.Lock()
+
+
+def get_search_service() -> RepositorySearchService:
+    """Get the process-wide RepositorySearchService."""
+    global _shared_search
+    if _shared_search is None:
+        with _shared_search_lock:
+            if _shared_search is None:
+                _shared_search = RepositorySearchService()
+    return _shared_search
@@ -0,0 +1,73 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one execution.
+    
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait for it and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run ``func`` for ``key`` unless a call for that key is already in flight.
+        
+        Args:
+            key: Deduplication key
+            func: Zero-argument callable doing the work
+            
+        Returns:
+            The result of the (possibly shared) call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get single-flight statistics."""
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'executions': self.executions,
+                'shared': self.shared
+            }
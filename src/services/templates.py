@@ -0,0 +1,269 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from config.settings import PROPOSAL_TEMPLATE_DIR, TEMPLATE_AUTO_RELOAD
+
+
+_SLOT_PATTERN = re.compile(r'\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\}\}')
+
+# Streaming output is chunked before each second-level Markdown heading
+_SECTION_BREAK = '\n## '
+
+
+class TemplateError(Exception):
+    """Raised when a template cannot be found or rendered."""
+    pass
+
+
+class CompiledTemplate:
+    """
+    A template split once into static text and ``{{ slot }}`` placeholders.
+    
+    Rendering only stringifies the slot values and joins a prepared list, so the
+    cost grows with the dynamic content rather than the size of the template.
+    Static segments are also kept UTF-8 encoded for byte-oriented output.
+    
+    Args:
+        source: Template text using ``{{ name }}`` placeholders
+        name: Template name used in error messages
+        split_sections: Whether to also compile per-section templates for
+            ``render_sections``
+    """
+
+    def __init__(self, source: str, name: str = '<string>', split_sections: bool = True):
+        self.name = name
+        self.source = source
+        self.version = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+        
+        parts = []
+        slot_positions = []
+        position = 0
+        for match in _SLOT_PATTERN.finditer(source):
+            parts.append(source[position:match.start()])
+            slot_positions.append((len(parts), match.group(1)))
+            parts.append(None)
+            position = match.end()
+        parts.append(source[position:])
+        
+        self._parts = parts
+        self._slot_positions = slot_positions
+        self._encoded_parts = [part.encode('utf-8') if part is not None else None for part in parts]
+        self.slots = frozenset(name for _, name in slot_positions)
+        
+        self._sections = None
+        if split_sections:
+            self._sections = [
+                CompiledTemplate(section, name=name, split_sections=False)
+                for section in self._split_sections(source)
+            ]
+
+    @staticmethod
+    def _split_sections(source: str) -> List[str]:
+        """Split template source before each '## ' heading, keeping every character."""
+        sections = []
+        start = 0
+        index = source.find(_SECTION_BREAK)
+        while index != -1:
+            sections.append(source[start:index])
+            start = index
+            index = source.find(_SECTION_BREAK, index + 1)
+        sections.append(source[start:])
+        return sections
+
+    def _fill(self, parts: List[Any], context: Mapping[str, Any], encode: bool = False) -> List[Any]:
+        """Fill slot positions of a copy of ``parts`` from the context."""
+        parts = list(parts)
+        try:
+            for index, name in self._slot_positions:
+                value = str(context[name])
+                parts[index] = value.encode('utf-8') if encode else value
+        except KeyError as e:
+            raise TemplateError(f"Template '{self.name}' is missing a value for slot {e}")
+        return parts
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        """
+        Render the template.
+        
+        Args:
+            context: Values for every slot; values are converted with str()
+            
+        Returns:
+            Rendered text
+            
+        Raises:
+            TemplateError: If a slot has no value
+        """
+        return ''.join(self._fill(self._parts, context))
+
+    def render_sections(self, context: Mapping[str, Any]) -> Iterator[str]:
+        """
+        Render the template section by section.
+        
+        Each yielded chunk ends just before a '## ' heading; joined together the
+        chunks equal ``render(context)``.
+        
+        Raises:
+            TemplateError: If a slot has no value
+        """
+        if self._sections is None:
+            yield self.render(context)
+            return
+        for section in self._sections:
+            yield section.render(context)
+
+    def render_bytes(self, context: Mapping[str, Any]) -> bytes:
+        """Render the template to UTF-8 bytes using the pre-encoded static segments."""
+        return b''.join(self._fill(self._encoded_parts, context, encode=True))
+
+    def bind(self, context: Mapping[str, Any], deferred: Iterable[str] = ()) -> 'CompiledTemplate':
+        """
+        Fill every slot except the deferred ones, returning a template of the rest.
+        
+        Filled values become static text and are never parsed for placeholders, so
+        user input containing ``{{ ... }}`` stays literal. The bound template keeps
+        the version of this one and can still be rendered section by section.
+        
+        Args:
+            context: Values for every slot that is not deferred
+            deferred: Slots left open for a later ``render``
+        
+        Returns:
+            Template whose only slots are the deferred ones
+        
+        Raises:
+            TemplateError: If a slot that is not deferred has no value
+        """
+        deferred = frozenset(deferred)
+        parts = []
+        slot_positions = []
+        static = []
+        for part in self._fill_except(deferred, context):
+            if isinstance(part, _Deferred):
+                parts.append(''.join(static))
+                static = []
+                slot_positions.append((len(parts), part.name))
+                parts.append(None)
+            else:
+                static.append(part)
+        parts.append(''.join(static))
+        
+        bound = CompiledTemplate.__new__(CompiledTemplate)
+        bound.name = self.name
+        names = dict(slot_positions)
+        bound.source = ''.join(part if part is not None else '{{ %s }}' % names[index]
+                               for index, part in enumerate(parts))
+        bound.version = self.version
+        bound._parts = parts
+        bound._slot_positions = slot_positions
+        bound._encoded_parts = [part.encode('utf-8') if part is not None else None for part in parts]
+        bound.slots = frozenset(name for _, name in slot_positions)
+        bound._sections = None
+        if self._sections is not None:
+            bound._sections = [section.bind(context, deferred) for section in self._sections]
+        return bound
+
+    def _fill_except(self, deferred: frozenset, context: Mapping[str, Any]) -> List[Any]:
+        """Fill slots from the context, marking deferred ones with a _Deferred."""
+        parts = list(self._parts)
+        try:
+            for index, name in self._slot_positions:
+                parts[index] = _Deferred(name) if name in deferred else str(context[name])
+        except KeyError as e:
+            raise TemplateError(f"Template '{self.name}' is missing a value for slot {e}")
+        return parts
+
+
+class _Deferred:
+    """Placeholder for a slot left open by CompiledTemplate.bind."""
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class TemplateRegistry:
+    """
+    Loads named templates (``<name>.md``) from a directory and caches them compiled.
+    
+    With ``auto_reload`` enabled, a template file is re-read when its modification
+    time changes; the check runs at most once per ``check_interval`` seconds per
+    template so the render path rarely touches the filesystem.
+    """
+
+    def __init__(self, directory: str = PROPOSAL_TEMPLATE_DIR, auto_reload: bool = TEMPLATE_AUTO_RELOAD,
+                 check_interval: float = 1.0):
+        self.directory = directory
+        self.auto_reload = auto_reload
+        self.check_interval = check_interval
+        self._templates: Dict[str, Tuple[CompiledTemplate, float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, name: str) -> str:
+        if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+            raise TemplateError(f"Invalid template name: '{name}'")
+        return os.path.join(self.directory, f'{name}.md')
+
+    def _load(self, name: str) -> Tuple[CompiledTemplate, float]:
+        path = self._path(name)
+        try:
+            mtime = os.path.getmtime(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        except OSError:
+            raise TemplateError(f"Template '{name}' not found in {self.directory}")
+        # Files end with a newline by convention; rendered proposals do not
+        if source.endswith('\n'):
+            source = source[:-1]
+        return CompiledTemplate(source, name=name), mtime
+
+    def get(self, name: str) -> CompiledTemplate:
+        """
+        Get a compiled template by name, reloading it if the file changed.
+        
+        Raises:
+            TemplateError: If the template does not exist
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._templates.get(name)
+            if cached is not None:
+                template, mtime, checked_at = cached
+                if not self.auto_reload or now - checked_at < self.check_interval:
+                    return template
+                try:
+                    current_mtime = os.path.getmtime(self._path(name))
+                except OSError:
+                    current_mtime = mtime
+                if current_mtime == mtime:
+                    self._templates[name] = (template, mtime, now)
+                    return template
+            
+            template, mtime = self._load(name)
+            self._templates[name] = (template, mtime, now)
+            return template
+
+    def names(self) -> List[str]:
+        """List the template names available in the directory."""
+        try:
+            files = os.listdir(self.directory)
+        except OSError:
+            return []
+        return sorted(f[:-3] for f in files if f.endswith('.md'))
+
+
+_default_registry: Optional[TemplateRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Get the process-wide template registry for PROPOSAL_TEMPLATE_DIR."""
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = TemplateRegistry()
+    return _default_registry
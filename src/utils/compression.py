@@ -0,0 +1,95 @@
+"""
+HTTP response body compression.
+
+Brotli is offered when the ``brotli`` package is installed; gzip always is.
+The encoding is negotiated from the client's Accept-Encoding header, preferring
+Brotli, and bodies below a size threshold or of types that do not compress well
+are left alone.
+"""
+
+import gzip
+from typing import Optional
+from config.settings import COMPRESSION_MIN_SIZE, COMPRESSION_LEVEL, BROTLI_QUALITY
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Encodings in order of preference
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# Text-based types worth compressing; images and fonts are already compressed
+COMPRESSIBLE_MIMETYPES = frozenset([
+    'text/html', 'text/css', 'text/plain', 'text/markdown', 'text/javascript',
+    'application/javascript', 'application/json', 'application/xml', 'image/svg+xml'
+])
+
+
+def parse_accept_encoding(header: Optional[str]) -> dict:
+    """
+    Parse an Accept-Encoding header.
+
+    Returns:
+        Mapping of lowercase coding name to its quality value
+    """
+    codings = {}
+    for item in (header or '').split(','):
+        name, _, params = item.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[name] = quality
+    return codings
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the content coding to answer with.
+
+    Args:
+        accept_encoding: The request's Accept-Encoding header
+
+    Returns:
+        'br' or 'gzip', or None if the client accepts neither
+    """
+    codings = parse_accept_encoding(accept_encoding)
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = codings.get(encoding, codings.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(mimetype: Optional[str], size: int, min_size: int = COMPRESSION_MIN_SIZE) -> bool:
+    """Whether a body of this type and size is worth compressing."""
+    return size >= min_size and (mimetype or '').lower() in COMPRESSIBLE_MIMETYPES
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Compress a body.
+
+    Args:
+        data: Uncompressed body
+        encoding: 'br' or 'gzip'
+
+    Raises:
+        ValueError: If the encoding is not available
+    """
+    if encoding == 'gzip':
+        # mtime=0 keeps the output identical for identical input
+        return gzip.compress(data, compresslevel=COMPRESSION_LEVEL, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    raise ValueError(f"Unsupported content encoding: '{encoding}'")
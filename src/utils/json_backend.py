@@ -0,0 +1,109 @@
+"""
+JSON encoding and decoding with an optional fast backend.
+
+orjson is used when installed, then ujson, then the standard library; set
+``JSON_BACKEND`` to force one. Every backend produces the same data, so the
+choice only affects speed: orjson would write datetimes in its own format, so
+they are handed to ``default`` as the standard library does.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from config.settings import JSON_BACKEND
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _select_backend(preferred: str) -> str:
+    available = {'orjson': orjson is not None, 'ujson': ujson is not None, 'json': True}
+    if preferred in available and available[preferred]:
+        return preferred
+    for name in ('orjson', 'ujson', 'json'):
+        if available[name]:
+            return name
+
+
+BACKEND = _select_backend(JSON_BACKEND)
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: JSON text, either bytes (preferred, avoids a decode step) or str
+    """
+    if BACKEND == 'orjson':
+        return orjson.loads(data)
+    if BACKEND == 'ujson':
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False,
+          default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Encode an object as JSON text.
+
+    Non-ASCII characters are written as UTF-8 rather than escaped. orjson only
+    supports two-space indentation, so any ``indent`` is rendered as two spaces
+    with that backend. Objects the fast backend cannot encode fall back to the
+    standard library. Datetimes, dates and times are encoded by ``default`` with
+    every backend (a TypeError without one).
+
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with this indentation
+        sort_keys: Sort object keys
+        default: Called for objects that are not natively serializable
+    """
+    return dumps_bytes(obj, indent=indent, sort_keys=sort_keys, default=default).decode('utf-8')
+
+
+def dumps_bytes(obj: Any, indent: Optional[int] = None, sort_keys: bool = False,
+                default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode an object as UTF-8 JSON bytes; see ``dumps``."""
+    if BACKEND == 'orjson':
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib handles these
+            pass
+    elif BACKEND == 'ujson' and default is None:
+        try:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                               indent=indent or 0, sort_keys=sort_keys).encode('utf-8')
+        except (TypeError, OverflowError):
+            pass
+
+    separators = None if indent else (',', ':')
+    return json.dumps(obj, ensure_ascii=False, indent=indent, sort_keys=sort_keys,
+                      default=default, separators=separators).encode('utf-8')
+
+
+def select_fields(item: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Keep only the given top-level fields of a decoded object.
+
+    Missing fields are set to None, so callers can index the result directly.
+    """
+    return {field: item.get(field) for field in fields}
+
+
+def select_items(items: Iterable[Dict[str, Any]], fields: Iterable[str]) -> List[Dict[str, Any]]:
+    """Apply ``select_fields`` to every object in a list."""
+    fields = tuple(fields)
+    return [select_fields(item, fields) for item in items]
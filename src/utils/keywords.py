@@ -0,0 +1,125 @@
+"""
+Keyword extraction for building repository search queries.
+
+Terms are weighted by TF-IDF: term frequency in the proposal (title words count
+more) times inverse document frequency over a corpus of repositories seen
+before, so words that appear in nearly every repository description carry
+little weight. Terms the corpus has never seen are not treated as rare: they
+are more likely proposal filler than distinctive topics, so they get the
+neutral weight. Title keywords are always chosen before body keywords.
+Results are ordered deterministically, so identical text always yields
+identical keywords.
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Common English words plus filler that shows up in proposals but not in useful searches
+STOP_WORDS = frozenset([
+    'a', 'about', 'above', 'after', 'again', 'all', 'also', 'am', 'an', 'and', 'any', 'are',
+    'as', 'at', 'be', 'because', 'been', 'before', 'being', 'below', 'between', 'both', 'but',
+    'by', 'can', 'could', 'did', 'do', 'does', 'doing', 'down', 'during', 'each', 'etc', 'few',
+    'for', 'from', 'further', 'get', 'had', 'has', 'have', 'having', 'he', 'her', 'here', 'him',
+    'his', 'how', 'i', 'if', 'in', 'into', 'is', 'it', 'its', 'just', 'may', 'me', 'might',
+    'more', 'most', 'much', 'must', 'my', 'no', 'nor', 'not', 'now', 'of', 'off', 'on', 'once',
+    'only', 'or', 'other', 'our', 'out', 'over', 'own', 'same', 'she', 'should', 'so', 'some',
+    'such', 'than', 'that', 'the', 'their', 'them', 'then', 'there', 'these', 'they', 'this',
+    'those', 'through', 'to', 'too', 'under', 'until', 'up', 'us', 'very', 'via', 'was', 'we',
+    'were', 'what', 'when', 'where', 'which', 'while', 'who', 'whom', 'why', 'will', 'with',
+    'would', 'you', 'your',
+    'add', 'adding', 'allow', 'allows', 'based', 'better', 'build', 'create', 'easy', 'feature',
+    'features', 'help', 'implement', 'improve', 'improved', 'make', 'need', 'needs', 'new',
+    'project', 'proposal', 'provide', 'provides', 'support', 'supports', 'use', 'used', 'using',
+    'want', 'way', 'work'
+])
+
+# Title words count this many times, as the title usually names the topic
+TITLE_WEIGHT = 3
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase alphanumeric terms ('c++' and 'c#' are kept whole)."""
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def is_keyword(term: str) -> bool:
+    """Whether a term is worth searching for: not a stop word, number or short fragment."""
+    return len(term) > 2 and term not in STOP_WORDS and not term.isdigit()
+
+
+class KeywordExtractor:
+    """
+    TF-IDF keyword extractor.
+
+    Args:
+        corpus: Documents to compute inverse document frequencies against, any
+            object with ``document_frequency(term)`` and ``__len__`` (such as
+            ``services.repo_index.RepositoryIndex``); without one every term has
+            the same IDF and only frequency counts
+    """
+
+    def __init__(self, corpus: Optional[Any] = None):
+        self.corpus = corpus
+
+    def term_frequencies(self, title: str = '', description: str = '',
+                         conclusions: str = '') -> Dict[str, int]:
+        """Count keyword occurrences, with title words weighted by TITLE_WEIGHT."""
+        counts = {}
+        for text, weight in ((title, TITLE_WEIGHT), (description, 1), (conclusions, 1)):
+            for term in tokenize(text):
+                if is_keyword(term):
+                    counts[term] = counts.get(term, 0) + weight
+        return counts
+
+    def idf(self, term: str) -> float:
+        """
+        Smoothed inverse document frequency of a term in the corpus.
+
+        Terms missing from the corpus get 1.0, the weight of a term found in
+        every document, rather than the highest weight.
+        """
+        if self.corpus is None:
+            return 1.0
+        frequency = self.corpus.document_frequency(term)
+        if frequency == 0:
+            return 1.0
+        documents = len(self.corpus)
+        return math.log((documents + 1) / (frequency + 1)) + 1.0
+
+    def score(self, title: str = '', description: str = '',
+              conclusions: str = '') -> List[Tuple[str, float]]:
+        """
+        Score every keyword in the text.
+
+        Returns:
+            (term, score) pairs, highest score first; ties are ordered alphabetically
+        """
+        scored = [(term, count * self.idf(term))
+                  for term, count in self.term_frequencies(title, description, conclusions).items()]
+        scored.sort(key=lambda pair: (-pair[1], pair[0]))
+        return scored
+
+    def extract(self, title: str = '', description: str = '', conclusions: str = '',
+                max_terms: int = 5) -> List[str]:
+        """
+        Get the top keywords of the text.
+
+        Args:
+            title: Proposal title
+            description: Proposal description
+            conclusions: Proposal conclusions
+            max_terms: Maximum number of keywords
+
+        Returns:
+            Up to ``max_terms`` keywords, title keywords first, each group best first
+        """
+        title_terms = set(tokenize(title))
+        ranked = sorted(self.score(title, description, conclusions),
+                        key=lambda pair: pair[0] not in title_terms)
+        return [term for term, _ in ranked[:max_terms]]
@@ -0,0 +1,140 @@
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from argparse import Namespace
+from contextlib import redirect_stderr
+from unittest.mock import patch, MagicMock
+
+# Add the project root and src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cli import read_batch_rows, run_batch
+from models.github_project import GitHubProject
+from services.github_api import GitHubAPIError
+
+
+class TestBatchMode(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        
+        def get_project(name):
+            if name.lower() == 'user/missing':
+                raise GitHubAPIError(f"Repository '{name}' not found")
+            owner, repo = name.lower().split('/')
+            return GitHubProject(name=repo, full_name=f'{owner}/{repo}', description='A test repository',
+                                 html_url=f'https://github.com/{owner}/{repo}', language='Python',
+                                 updated_at='2023-12-01T00:00:00Z')
+        
+        self.api = MagicMock()
+        self.api.is_authenticated = False
+        self.api.get_project.side_effect = get_project
+        patcher = patch('cli.get_github_api', return_value=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, name, content, encoding='utf-8'):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding=encoding) as f:
+            f.write(content)
+        return path
+
+    def run_batch(self, path, **kwargs):
+        args = Namespace(batch=path, workers=2, output_dir=None, output=None, no_save=False)
+        for name, value in kwargs.items():
+            setattr(args, name, value)
+        summary = io.StringIO()
+        with redirect_stderr(summary):
+            ok = run_batch(args)
+        return ok, summary.getvalue()
+
+    def test_csv_rows_deduped_by_repository(self):
+        """Test that CSV rows for the same repository share one fetch and write JSONL results."""
+        path = self.write('rows.csv', (
+            'repository,title,description,conclusions\n'
+            'user/one,First Proposal,A description of the first proposal.,Add docs\n'
+            'User/One,Second Proposal,A description of the second proposal.,Add tests\n'
+            'user/two,Third Proposal,A description of the third proposal.,Add examples\n'
+        ))
+        output = os.path.join(self.tmp.name, 'results.jsonl')
+        ok, summary = self.run_batch(path, output=output)
+        
+        self.assertTrue(ok)
+        self.assertEqual(self.api.get_project.call_count, 2)
+        with open(output, encoding='utf-8') as f:
+            results = sorted((json.loads(line) for line in f), key=lambda result: result['row'])
+        self.assertEqual([result['row'] for result in results], [1, 2, 3])
+        self.assertEqual([result['repository'] for result in results], ['user/one', 'user/one', 'user/two'])
+        self.assertIn('# Second Proposal', results[1]['proposal'])
+        self.assertIn('3 generated, 0 failed, 3 rows, 2 unique repositories', summary)
+
+    def test_csv_with_byte_order_mark(self):
+        """Test that a BOM-prefixed CSV, as saved by Excel, keeps its first header name."""
+        path = self.write('rows.csv', (
+            'repository,title,description,conclusions\n'
+            'user/one,First Proposal,A description of the first proposal.,Add docs\n'
+        ), encoding='utf-8-sig')
+        
+        rows = list(read_batch_rows(path))
+        self.assertEqual(rows[0]['repository'], 'user/one')
+        ok, summary = self.run_batch(path, no_save=True)
+        self.assertTrue(ok)
+        self.assertIn('1 generated, 0 failed', summary)
+
+    def test_jsonl_row_errors_reported(self):
+        """Test that malformed lines and invalid or missing repositories fail only their rows."""
+        path = self.write('rows.jsonl', '\n'.join([
+            json.dumps({'repository': 'user/one', 'title': 'Good Proposal',
+                        'description': 'A description of a good proposal.', 'conclusions': 'Add docs'}),
+            '{"repository": "user/two", "title": ',
+            '["not", "an", "object"]',
+            json.dumps({'repository': 'not a repo', 'title': 'Bad Repository',
+                        'description': 'A description of a proposal.', 'conclusions': 'Add docs'}),
+            json.dumps({'repository': 'user/missing', 'title': 'Missing Repository',
+                        'description': 'A description of a proposal.', 'conclusions': 'Add docs'}),
+            json.dumps({'repository': 'user/one', 'title': '', 'description': '', 'conclusions': ''})
+        ]) + '\n')
+        
+        rows = list(read_batch_rows(path))
+        self.assertEqual(len(rows), 6)
+        self.assertIn('Invalid JSON line', rows[1]['error'])
+        self.assertIn('Invalid JSON line', rows[2]['error'])
+        
+        output = os.path.join(self.tmp.name, 'results.jsonl')
+        ok, summary = self.run_batch(path, output=output)
+        
+        self.assertFalse(ok)
+        with open(output, encoding='utf-8') as f:
+            results = {result['row']: result for result in map(json.loads, f)}
+        self.assertEqual(sorted(results), [1, 2, 3, 4, 5, 6])
+        self.assertIn('proposal', results[1])
+        for row in (2, 3, 4, 5, 6):
+            self.assertIn('error', results[row])
+        self.assertIn('GitHub API Error', results[5]['error'])
+        self.assertIn('Validation Error', results[6]['error'])
+        self.assertIn('1 generated, 5 failed', summary)
+
+    def test_output_dir_writes_markdown_files(self):
+        """Test that --output-dir writes one Markdown file per generated proposal."""
+        path = self.write('rows.csv', (
+            'repository,title,description,conclusions\n'
+            'user/one,First Proposal,A description of the first proposal.,Add docs\n'
+            'user/missing,Second Proposal,A description of the second proposal.,Add tests\n'
+        ))
+        output_dir = os.path.join(self.tmp.name, 'proposals')
+        ok, summary = self.run_batch(path, output_dir=output_dir)
+        
+        self.assertFalse(ok)
+        self.assertEqual(os.listdir(output_dir), ['00001_user_one.md'])
+        with open(os.path.join(output_dir, '00001_user_one.md'), encoding='utf-8') as f:
+            self.assertTrue(f.read().startswith('# First Proposal'))
+        self.assertIn('Row 2 (user/missing)', summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
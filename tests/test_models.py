@@ -7,6 +7,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from models.proposal import Proposal
 from models.github_project import GitHubProject
+from models.project_table import ProjectTable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestProposal(unittest.TestCase):
@@ -137,6 +143,109 @@ class TestGitHubProject(unittest.TestCase):
         self.assertEqual(data['language'], "Python")
         self.assertEqual(data['stargazers_count'], 100)
 
+    def test_github_project_is_slotted(self):
+        """Test instances carry no per-instance __dict__."""
+        project = GitHubProject(name="test-repo")
+        self.assertFalse(hasattr(project, '__dict__'))
+        with self.assertRaises(AttributeError):
+            project.unexpected = True
+
+    def test_github_project_drops_extra_fields(self):
+        """Test unused API fields are not kept by default."""
+        api_data = {
+            'name': 'test-repo',
+            'full_name': 'user/test-repo',
+            'topics': ['cli', 'python'],
+            'owner': {'login': 'user'},
+            'default_branch': 'main'
+        }
+        project = GitHubProject.from_api_response(api_data)
+        self.assertEqual(project.topics, ('cli', 'python'))
+        self.assertIsNone(project.raw)
+        self.assertEqual(project.additional_data, {})
+
+    def test_github_project_keep_raw(self):
+        """Test the raw payload is kept on request and decoded lazily."""
+        api_data = {
+            'name': 'test-repo',
+            'full_name': 'user/test-repo',
+            'owner': {'login': 'user'},
+            'default_branch': 'main'
+        }
+        project = GitHubProject.from_api_response(api_data, keep_raw=True)
+        self.assertIsInstance(project._raw, bytes)
+        self.assertEqual(project.raw, api_data)
+        self.assertEqual(project.additional_data,
+                         {'owner': {'login': 'user'}, 'default_branch': 'main'})
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestProjectTable(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [
+            {'name': 'alpha', 'full_name': 'user/alpha', 'language': 'Python',
+             'stargazers_count': 50, 'forks_count': 5, 'open_issues_count': 2,
+             'created_at': '2019-01-01T00:00:00Z', 'updated_at': '2024-01-01T00:00:00Z'},
+            {'name': 'beta', 'full_name': 'user/beta', 'language': 'Go',
+             'stargazers_count': 300, 'forks_count': 40, 'open_issues_count': 12,
+             'created_at': '2020-06-01T00:00:00Z', 'updated_at': '2023-01-01T00:00:00Z'},
+            {'name': 'gamma', 'full_name': 'user/gamma', 'language': 'python',
+             'stargazers_count': 50, 'forks_count': 1, 'open_issues_count': 0,
+             'created_at': None, 'updated_at': '2024-06-01T12:30:00Z'}
+        ]
+        self.table = ProjectTable.from_search_response({'items': self.items})
+
+    def test_columns(self):
+        """Test fields are stored as typed arrays."""
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.column('stargazers_count').dtype, numpy.int64)
+        self.assertEqual(str(self.table.column('created_at').dtype), 'datetime64[s]')
+        self.assertTrue(numpy.isnat(self.table.column('created_at')[2]))
+
+    def test_rows_round_trip(self):
+        """Test rows convert back to GitHubProject instances."""
+        project = self.table[1]
+        self.assertIsInstance(project, GitHubProject)
+        self.assertEqual(project.full_name, 'user/beta')
+        self.assertEqual(project.stargazers_count, 300)
+        self.assertEqual(project.updated_at, '2023-01-01T00:00:00Z')
+        self.assertIsNone(self.table[2].created_at)
+
+        rebuilt = ProjectTable.from_projects(self.table.to_projects())
+        self.assertEqual(rebuilt.to_dicts(), self.table.to_dicts())
+
+    def test_filter(self):
+        """Test vectorized filtering."""
+        names = [p.name for p in self.table.filter(language='PYTHON')]
+        self.assertEqual(names, ['alpha', 'gamma'])
+        names = [p.name for p in self.table.filter(min_stars=50, max_open_issues=5)]
+        self.assertEqual(names, ['alpha', 'gamma'])
+        names = [p.name for p in self.table.filter(updated_after='2023-12-31')]
+        self.assertEqual(names, ['alpha', 'gamma'])
+        self.assertEqual(len(self.table.filter(created_after='2019-06-01')), 1)
+
+    def test_sort_and_top_k(self):
+        """Test stable sorting and top-k selection."""
+        names = [p.name for p in self.table.sort_by('stargazers_count')]
+        self.assertEqual(names, ['beta', 'alpha', 'gamma'])
+        names = [p.name for p in self.table.sort_by('created_at', descending=False)]
+        self.assertEqual(names, ['alpha', 'beta', 'gamma'])
+        names = [p.name for p in self.table.top_k(2)]
+        self.assertEqual(names, ['beta', 'alpha'])
+        names = [p.name for p in self.table.top_k(5, column='forks_count')]
+        self.assertEqual(names, ['beta', 'alpha', 'gamma'])
+
+    def test_stats(self):
+        """Test aggregate statistics."""
+        stats = self.table.stats()
+        self.assertEqual(stats['count'], 3)
+        self.assertEqual(stats['stargazers_count']['sum'], 400)
+        self.assertEqual(stats['stargazers_count']['median'], 50.0)
+        self.assertEqual(stats['languages'], {'Go': 1, 'Python': 1, 'python': 1})
+        self.assertEqual(stats['created_at']['min'], '2019-01-01T00:00:00Z')
+        self.assertEqual(stats['updated_at']['max'], '2024-06-01T12:30:00Z')
+
 
 if __name__ == '__main__':
     unittest.main()
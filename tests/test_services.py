@@ -1,17 +1,82 @@
 import unittest
 import sys
 import os
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from services.github_api import GitHubAPI, GitHubAPIError
+from services.github_api import GitHubAPI, GitHubAPIError, get_github_api, reset_github_api
 from services.proposal_generator import ProposalGenerator
 from models.proposal import Proposal
 from models.github_project import GitHubProject
 
 
+class StubGitHubServer:
+    """Minimal local HTTP server that answers like the GitHub REST API."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.body = json.loads(self.rfile.read(length)) if length else None
+                stub.requests.append((self.path, dict(self.headers)))
+                route = stub.routes.get(self.path.split('?')[0])
+                if route is None:
+                    status, headers, body = 404, {}, {'message': 'Not Found'}
+                else:
+                    status, headers, body = route(self)
+                payload = json.dumps(body).encode('utf-8') if body is not None else b''
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(payload)
+
+            do_POST = do_HEAD = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def repo_route(body, headers=None):
+    """Build a stub route that always returns the given repository payload."""
+    return lambda handler: (200, headers or {}, body)
+
+
+def etag_route(body, etag='"v1"'):
+    """Build a stub route that answers 304 when the client sends a matching ETag."""
+    def route(handler):
+        if handler.headers.get('If-None-Match') == etag:
+            return 304, {'ETag': etag}, None
+        return 200, {'ETag': etag}, body
+    return route
+
+
 class TestGitHubAPI(unittest.TestCase):
     
     def setUp(self):
@@ -81,6 +146,1282 @@ class TestGitHubAPI(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestConnectionPool(unittest.TestCase):
+
+    def tearDown(self):
+        reset_github_api()
+
+    def test_session_uses_configured_pool(self):
+        """Test that the session adapter honours pool settings."""
+        from services.github_api import create_session
+        session = create_session(pool_connections=2, pool_maxsize=7, max_retries=1)
+        adapter = session.get_adapter('https://api.github.com')
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertEqual(adapter.max_retries.total, 1)
+
+    def test_shared_client_is_singleton(self):
+        """Test that the process-wide client is created once."""
+        self.assertIs(get_github_api(), get_github_api())
+
+    def test_pool_stats_report_connection_reuse(self):
+        """Test that repeated requests reuse a kept-alive connection."""
+        routes = {'/repos/user/test-repo': repo_route({'name': 'test-repo'})}
+        with StubGitHubServer(routes) as server:
+            api = GitHubAPI(base_url=server.base_url)
+            for _ in range(3):
+                api.fetch_project_data('user/test-repo')
+            stats = api.get_pool_stats()
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertGreater(stats['reuse_rate'], 0.6)
+
+
+class TestConditionalRequests(unittest.TestCase):
+
+    def test_fetch_project_data_revalidates_with_etag(self):
+        """Test that a 304 answer is served from the validator cache."""
+        routes = {'/repos/user/test-repo': etag_route({'name': 'test-repo', 'stargazers_count': 5})}
+        with StubGitHubServer(routes) as server:
+            api = GitHubAPI(base_url=server.base_url)
+            first = api.fetch_project_data('user/test-repo')
+            second = api.fetch_project_data('user/test-repo')
+        
+        self.assertEqual(first, second)
+        self.assertNotIn('If-None-Match', server.requests[0][1])
+        self.assertEqual(server.requests[1][1].get('If-None-Match'), '"v1"')
+        stats = api.http_cache.get_stats()
+        self.assertEqual(stats['not_modified_hits'], 1)
+        self.assertEqual(stats['full_downloads'], 1)
+
+    def test_readme_and_search_use_validator_cache(self):
+        """Test that README and search requests are revalidated too."""
+        import base64
+        readme = {'content': base64.b64encode(b'# Hello').decode('ascii')}
+        search = {'total_count': 1, 'items': [{'name': 'test-repo'}]}
+        routes = {
+            '/repos/user/test-repo/readme': etag_route(readme),
+            '/search/repositories': etag_route(search, etag='"s1"')
+        }
+        with StubGitHubServer(routes) as server:
+            api = GitHubAPI(base_url=server.base_url)
+            for _ in range(2):
+                self.assertEqual(api.fetch_repository_readme('user/test-repo'), '# Hello')
+                self.assertEqual(api.search_repositories('test')['total_count'], 1)
+        
+        self.assertEqual(api.http_cache.get_stats()['not_modified_hits'], 2)
+
+    def test_has_repository_readme_skips_download(self):
+        """Test that README presence is checked with a HEAD request."""
+        routes = {'/repos/user/test-repo/readme': repo_route({'content': 'IyBIZWxsbw=='})}
+        with StubGitHubServer(routes) as server:
+            api = GitHubAPI(base_url=server.base_url)
+            with patch.object(api.session, 'get') as get:
+                self.assertTrue(api.has_repository_readme('user/test-repo'))
+                self.assertFalse(api.has_repository_readme('user/missing'))
+        
+        get.assert_not_called()
+        self.assertEqual(len(server.requests), 2)
+
+    def test_search_keeps_only_requested_fields(self):
+        """Test that search items are reduced to the requested fields before caching."""
+        search = {'total_count': 2, 'incomplete_results': False, 'items': [
+            {'name': 'one', 'full_name': 'user/one', 'owner': {'login': 'user'}, 'size': 10},
+            {'name': 'two', 'full_name': 'user/two', 'owner': {'login': 'user'}}
+        ]}
+        routes = {'/search/repositories': etag_route(search, etag='"s1"')}
+        with StubGitHubServer(routes) as server:
+            api = GitHubAPI(base_url=server.base_url)
+            reduced = api.search_repositories('test', fields=('name', 'size'))
+            full = api.search_repositories('test')
+        
+        self.assertEqual(reduced['total_count'], 2)
+        self.assertEqual(reduced['items'], [{'name': 'one', 'size': 10}, {'name': 'two', 'size': None}])
+        self.assertEqual(full['items'], search['items'])
+        # Reduced and full responses are cached separately
+        self.assertEqual(len(server.requests), 2)
+
+    def test_search_rate_limit_raises(self):
+        """Test that a 403 from search raises a rate limit error."""
+        from services.github_api import GitHubRateLimitError
+        routes = {'/search/repositories': lambda handler: (403, {}, {'message': 'rate limited'})}
+        with StubGitHubServer(routes) as server:
+            api = GitHubAPI(base_url=server.base_url)
+            with self.assertRaises(GitHubRateLimitError):
+                api.search_repositories('test')
+
+    def test_validator_cache_evicts_least_recently_used(self):
+        """Test that the validator cache stays within its size limit."""
+        from services.http_cache import CachedResponse, ValidatorCache
+        cache = ValidatorCache(max_entries=2)
+        cache.set('a', CachedResponse({}, etag='"a"'))
+        cache.set('b', CachedResponse({}, etag='"b"'))
+        cache.get('a')
+        cache.set('c', CachedResponse({}, etag='"c"'))
+        
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+
+    def test_response_cache_is_abstract(self):
+        """Test that the response cache base class cannot be used as a store."""
+        from services.http_cache import ResponseCache
+        with self.assertRaises(TypeError):
+            ResponseCache()
+
+
+class TestRepositorySearch(unittest.TestCase):
+
+    def test_equivalent_proposals_share_a_query(self):
+        """Test that query building ignores case, punctuation, order and duplicates."""
+        from services.search import build_search_query, normalize_query
+        first = build_search_query('Machine learning pipeline', 'Tools for data pipelines.', '',
+                                   language='Python')
+        second = build_search_query('pipeline, MACHINE learning!', 'tools for data pipelines', '',
+                                    language='python')
+        self.assertEqual(first, second)
+        self.assertTrue(first.endswith('forks:>2 language:python stars:>10'))
+        self.assertEqual(normalize_query('Flask  "web app" stars:>5 flask'), '"web app" flask stars:>5')
+        with self.assertRaises(ValueError):
+            build_search_query('The a an', '', '')
+
+    def test_results_are_cached_and_paginated_lazily(self):
+        """Test the result cache and that pages are only fetched as they are consumed."""
+        from services.repo_index import RepositoryIndex
+        from services.search import RepositorySearchService
+        
+        def search_route(handler):
+            from urllib.parse import parse_qs, urlsplit
+            page = int(parse_qs(urlsplit(handler.path).query)['page'][0])
+            items = [{'name': f'repo-{page}-{i}'} for i in range(2)] if page <= 3 else []
+            return 200, {}, {'total_count': 5, 'items': items[:1] if page == 3 else items}
+        
+        routes = {'/search/repositories': search_route}
+        with StubGitHubServer(routes) as server:
+            service = RepositorySearchService(GitHubAPI(base_url=server.base_url), index=RepositoryIndex())
+            results = service.iter_results('Test', per_page=2)
+            self.assertEqual(next(results)['name'], 'repo-1-0')
+            self.assertEqual(len(server.requests), 1)
+            remaining = [item['name'] for item in results]
+            self.assertEqual(len(server.requests), 3)
+            
+            page = service.search('test', per_page=2, page=2)
+            self.assertEqual(len(server.requests), 3)
+        
+        self.assertEqual(remaining, ['repo-1-1', 'repo-2-0', 'repo-2-1', 'repo-3-0'])
+        self.assertTrue(page['has_more'])
+        self.assertEqual(service.get_stats()['result_cache']['hits'], 1)
+        with self.assertRaises(ValueError):
+            service.search('test', page=0)
+
+
+class TestRepositoryIndex(unittest.TestCase):
+
+    def setUp(self):
+        from services.repo_index import RepositoryIndex
+        self.index = RepositoryIndex(max_documents=10)
+        self.index.add_many([
+            {'name': 'flask', 'full_name': 'pallets/flask', 'language': 'Python',
+             'description': 'The Python micro framework for building web applications',
+             'topics': ['web', 'framework'], 'stargazers_count': 60000, 'forks_count': 16000},
+            {'name': 'django', 'full_name': 'django/django', 'language': 'Python',
+             'description': 'The web framework for perfectionists with deadlines',
+             'topics': ['web'], 'stargazers_count': 70000, 'forks_count': 30000},
+            {'name': 'gin', 'full_name': 'gin-gonic/gin', 'language': 'Go',
+             'description': 'HTTP web framework written in Go', 'stargazers_count': 70000,
+             'forks_count': 7000},
+            {'name': 'web-toy', 'full_name': 'someone/web-toy', 'language': 'Python',
+             'description': 'A toy framework', 'stargazers_count': 3, 'forks_count': 0}
+        ])
+
+    def names(self, query, **kwargs):
+        return [repo['full_name'] for repo in self.index.search(query, **kwargs)]
+
+    def test_bm25_ranking_and_filters(self):
+        """Test that name matches rank first and qualifiers filter results."""
+        self.assertEqual(self.names('flask'), ['pallets/flask'])
+        self.assertEqual(self.names('web framework language:python stars:>10'),
+                         ['pallets/flask', 'django/django'])
+        self.assertEqual(self.names('Web Framework forks:>=7000 language:go'), ['gin-gonic/gin'])
+        self.assertEqual(self.names('web flask', match_all=False)[0], 'pallets/flask')
+        # Qualifiers the index cannot evaluate leave the search to GitHub
+        self.assertEqual(self.names('web user:pallets'), [])
+
+    def test_stars_break_ties(self):
+        """Test that equally scored repositories are ordered by stars."""
+        from services.repo_index import RepositoryIndex
+        index = RepositoryIndex()
+        for name, stars in (('a', 5), ('b', 50), ('c', 20)):
+            index.add({'name': name, 'full_name': f'user/{name}', 'description': 'parser', 'stargazers_count': stars})
+        self.assertEqual([repo['name'] for repo in index.search('parser')], ['b', 'c', 'a'])
+
+    def test_reindex_evict_and_persist(self):
+        """Test replacing documents, the size bound and saving/loading."""
+        import tempfile
+        from services.repo_index import RepositoryIndex
+        self.index.add({'name': 'flask', 'full_name': 'Pallets/Flask', 'description': 'renamed'})
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.names('micro'), [])
+        self.assertEqual(self.names('renamed'), ['Pallets/Flask'])
+        
+        small = RepositoryIndex(max_documents=2)
+        small.add_many({'full_name': f'user/repo{i}', 'name': f'repo{i}'} for i in range(3))
+        self.assertNotIn('user/repo0', small)
+        self.assertEqual(small.get_stats()['evictions'], 1)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'index.json')
+            self.index.save(path)
+            loaded = RepositoryIndex(path=path)
+        self.assertEqual(len(loaded), 4)
+        self.assertEqual([repo['full_name'] for repo in loaded.search('web framework')],
+                         self.names('web framework'))
+
+    def test_index_save_failure_does_not_fail_fetch(self):
+        """Test that an unwritable index path is logged and the fetch still succeeds."""
+        import tempfile
+        from services.repo_index import RepositoryIndex
+        with tempfile.TemporaryDirectory() as directory:
+            blocker = os.path.join(directory, 'not-a-directory')
+            open(blocker, 'w').close()
+            index = RepositoryIndex(path=os.path.join(blocker, 'index.json'), save_every=1)
+            routes = {'/repos/user/test-repo': repo_route({'name': 'test-repo', 'full_name': 'user/test-repo'})}
+            with StubGitHubServer(routes) as server:
+                api = GitHubAPI(base_url=server.base_url, repo_index=index)
+                with self.assertLogs('services.repo_index', level='WARNING'):
+                    self.assertEqual(api.fetch_project_data('user/test-repo')['full_name'], 'user/test-repo')
+            self.assertIn('user/test-repo', index)
+            self.assertEqual(index.get_stats()['save_errors'], 1)
+            
+            path = os.path.join(directory, 'index.json')
+            index.save(path)
+            self.assertEqual(sorted(os.listdir(directory)), ['index.json', 'not-a-directory'])
+
+    def test_search_service_prefers_local_index(self):
+        """Test that the search service answers from the index when it has enough matches."""
+        from services.search import RepositorySearchService
+        api = MagicMock()
+        service = RepositorySearchService(api, index=self.index, min_local_results=2)
+        result = service.search('web framework language:python', per_page=1, fields=('full_name',))
+        self.assertEqual(result['source'], 'local')
+        self.assertEqual(result['items'], [{'full_name': 'pallets/flask'}])
+        self.assertTrue(result['has_more'])
+        api.search_repositories.assert_not_called()
+        
+        api.search_repositories.return_value = {'total_count': 0, 'items': []}
+        result = service.search('web framework language:go')
+        self.assertEqual(result['source'], 'github')
+        self.assertEqual(service.get_stats()['local_searches'], 1)
+        self.assertEqual(service.get_stats()['remote_searches'], 1)
+
+    def test_query_source_chosen_once(self):
+        """Test that every page of a query comes from the source chosen for its first page."""
+        from services.search import RepositorySearchService
+        api = MagicMock()
+        api.search_repositories.return_value = {'total_count': 1000, 'items': [{'name': 'remote'}]}
+        service = RepositorySearchService(api, index=self.index, min_local_results=2)
+        
+        pages = [service.search('web framework', page=page, per_page=2) for page in (1, 2, 3)]
+        self.assertEqual([page['source'] for page in pages], ['local'] * 3)
+        self.assertEqual([page['total_count'] for page in pages], [4, 4, 4])
+        self.assertEqual([len(page['items']) for page in pages], [2, 2, 0])
+        self.assertEqual([page['has_more'] for page in pages], [True, False, False])
+        api.search_repositories.assert_not_called()
+        
+        self.assertEqual(service.search('gin', per_page=1)['source'], 'github')
+        self.index.add_many([{'name': 'gin-contrib', 'full_name': 'gin-gonic/contrib',
+                              'description': 'Middleware for gin'}])
+        self.assertEqual(service.search('gin', page=2, per_page=1)['source'], 'github')
+
+    def test_proposal_terms_with_matching_index(self):
+        """Test that an index full of matching repositories does not push out the topic."""
+        from services.repo_index import RepositoryIndex
+        from services.search import extract_search_terms
+        kinds = ['neural network training', 'deep learning models', 'model training toolkit']
+        index = RepositoryIndex()
+        index.add_many([
+            {'name': f'ml-{i}', 'full_name': f'ml/ml-{i}', 'language': 'Python',
+             'description': f'Machine learning library for {kinds[i % 3]}',
+             'topics': ['machine-learning'], 'stargazers_count': 100 + i, 'forks_count': 10}
+            for i in range(30)
+        ])
+        
+        terms = extract_search_terms('Machine learning library',
+                                     'Training neural network models quickly', 'Add docs; Add tests',
+                                     corpus=index)
+        self.assertEqual(terms, ['learning', 'library', 'machine', 'models', 'network'])
+
+    def test_proposal_terms_weighted_by_index(self):
+        """Test that terms common in the index are dropped first and the query is reused."""
+        from services.search import RepositorySearchService, extract_search_terms
+        self.assertEqual(self.index.document_frequency('web'), 4)
+        terms = extract_search_terms('', 'web framework perfectionists', max_terms=1, corpus=self.index)
+        self.assertEqual(terms, ['perfectionists'])
+        
+        api = MagicMock()
+        api.search_repositories.return_value = {'total_count': 0, 'items': []}
+        service = RepositorySearchService(api, index=self.index)
+        first = service.search_proposal('Perfectionists toolkit')
+        self.index.add({'name': 'toolkit', 'full_name': 'user/toolkit', 'description': 'perfectionists'})
+        second = service.search_proposal('perfectionists   TOOLKIT')
+        self.assertEqual(first['query'], second['query'])
+        self.assertEqual(api.search_repositories.call_count, 1)
+
+    def test_client_indexes_fetched_repositories(self):
+        """Test that fetched and searched repositories are added to the index."""
+        from services.repo_index import RepositoryIndex
+        routes = {
+            '/repos/user/parser': repo_route({'name': 'parser', 'full_name': 'user/parser'}),
+            '/search/repositories': repo_route({'total_count': 1, 'items': [
+                {'name': 'lexer', 'full_name': 'user/lexer'}
+            ]})
+        }
+        index = RepositoryIndex()
+        with StubGitHubServer(routes) as server:
+            api = GitHubAPI(base_url=server.base_url, repo_index=index)
+            api.fetch_project_data('user/parser')
+            api.search_repositories('lexer', fields=('name', 'full_name'))
+        self.assertIn('user/parser', index)
+        self.assertIn('user/lexer', index)
+
+
+class TestPersistentCache(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'cache.sqlite3')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_entries_shared_between_instances(self):
+        """Test that a second cache instance sees entries written by the first."""
+        from services.http_cache import CachedResponse
+        from services.persistent_cache import SQLiteResponseCache
+        writer = SQLiteResponseCache(self.path)
+        writer.set('repo', CachedResponse({'name': 'test-repo'}, etag='"v1"'))
+        
+        reader = SQLiteResponseCache(self.path)
+        entry = reader.get('repo')
+        self.assertEqual(entry.body, {'name': 'test-repo'})
+        self.assertEqual(entry.etag, '"v1"')
+
+    def test_fresh_entries_skip_network(self):
+        """Test that entries within fresh_ttl are served without a request."""
+        from services.persistent_cache import SQLiteResponseCache
+        routes = {'/repos/user/test-repo': etag_route({'name': 'test-repo'})}
+        with StubGitHubServer(routes) as server:
+            first = GitHubAPI(base_url=server.base_url,
+                              http_cache=SQLiteResponseCache(self.path, fresh_ttl=60))
+            first.fetch_project_data('user/test-repo')
+            second = GitHubAPI(base_url=server.base_url,
+                               http_cache=SQLiteResponseCache(self.path, fresh_ttl=60))
+            data = second.fetch_project_data('user/test-repo')
+        
+        self.assertEqual(data['name'], 'test-repo')
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(second.http_cache.get_stats()['fresh_hits'], 1)
+
+    def test_compaction_by_age_and_size(self):
+        """Test eviction of expired entries and of the oldest entries over the size limit."""
+        import time
+        from services.http_cache import CachedResponse
+        from services.persistent_cache import SQLiteResponseCache
+        cache = SQLiteResponseCache(self.path, max_age=100, max_bytes=250)
+        now = time.time()
+        cache.set('expired', CachedResponse({'x': 1}, stored_at=now - 200))
+        for i in range(5):
+            cache.set(f'k{i}', CachedResponse({'data': 'x' * 80}, stored_at=now + i))
+        
+        cache.compact()
+        
+        self.assertIsNone(cache.get('expired'))
+        self.assertIsNone(cache.get('k0'))
+        self.assertIsNotNone(cache.get('k4'))
+        self.assertLessEqual(cache.get_stats()['bytes'], 250)
+
+    def test_concurrent_writers(self):
+        """Test that separate cache instances can write concurrently."""
+        from services.http_cache import CachedResponse
+        from services.persistent_cache import SQLiteResponseCache
+        SQLiteResponseCache(self.path)
+        
+        def write(worker):
+            cache = SQLiteResponseCache(self.path)
+            for i in range(20):
+                cache.set(f'{worker}-{i}', CachedResponse({'i': i}))
+        
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(SQLiteResponseCache(self.path)), 80)
+
+
+class TestGraphQLBatchFetch(unittest.TestCase):
+
+    @staticmethod
+    def graphql_route(queries):
+        """Build a stub GraphQL route answering every aliased repository."""
+        def route(handler):
+            variables = handler.body['variables']
+            queries.append(handler.body['query'])
+            data = {}
+            for key, owner in variables.items():
+                if not key.startswith('o'):
+                    continue
+                alias = 'r' + key[1:]
+                name = variables['n' + key[1:]]
+                if name == 'missing':
+                    data[alias] = None
+                    continue
+                data[alias] = {
+                    'name': name,
+                    'nameWithOwner': f'{owner}/{name}',
+                    'url': f'https://github.com/{owner}/{name}',
+                    'description': None,
+                    'primaryLanguage': {'name': 'Python'},
+                    'stargazerCount': 42,
+                    'forkCount': 7,
+                    'issues': {'totalCount': 3},
+                    'pullRequests': {'totalCount': 2},
+                    'repositoryTopics': {'nodes': [{'topic': {'name': 'cli'}}]},
+                    'readme': {'text': '# Readme'}
+                }
+            return 200, {}, {'data': data}
+        return route
+
+    def test_fetch_many_projects_chunks_and_maps(self):
+        """Test that repositories are fetched in fixed-size chunks and mapped to GitHubProject."""
+        queries = []
+        names = [f'user/repo{i}' for i in range(5)] + ['user/missing', 'USER/repo0']
+        with StubGitHubServer({'/graphql': self.graphql_route(queries)}) as server:
+            api = GitHubAPI(base_url=server.base_url, api_key='test-token')
+            with patch('services.github_api.GRAPHQL_BATCH_SIZE', 4):
+                projects = api.fetch_many_projects(names, include_readme=True)
+        
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(sorted(projects), [f'user/repo{i}' for i in range(5)])
+        project = projects['user/repo3']
+        self.assertEqual(project.full_name, 'user/repo3')
+        self.assertEqual(project.language, 'Python')
+        self.assertEqual(project.stargazers_count, 42)
+        self.assertEqual(project.open_issues_count, 5)
+        self.assertIs(api.get_project('user/repo3'), project)
+
+    def test_fetch_many_requires_token(self):
+        """Test that GraphQL fetches fail clearly without an API token."""
+        api = GitHubAPI(api_key='your_api_key_here')
+        with self.assertRaises(GitHubAPIError):
+            api.fetch_many_projects(['user/repo'])
+
+
+class TestRateLimitScheduler(unittest.TestCase):
+
+    def setUp(self):
+        from services.rate_limit import RateLimitScheduler
+        self.clock = FakeClock()
+        self.clock.now = 1000.0
+        self.sleeps = []
+        
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.clock.now += seconds
+        
+        self.scheduler = RateLimitScheduler(max_wait=30, pace_below=0.1, clock=self.clock, sleep=sleep)
+
+    def headers(self, remaining, reset_in, limit=5000, resource='core'):
+        return {
+            'X-RateLimit-Limit': str(limit),
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Reset': str(int(self.clock.now + reset_in)),
+            'X-RateLimit-Resource': resource
+        }
+
+    def test_budget_reported_in_stats(self):
+        """Test that header budgets are exposed per resource."""
+        self.scheduler.update('core', self.headers(4000, 600))
+        self.scheduler.update('search', self.headers(25, 60, limit=30, resource='search'))
+        stats = self.scheduler.get_stats()
+        self.assertEqual(stats['core']['remaining'], 4000)
+        self.assertEqual(stats['search']['limit'], 30)
+        self.assertEqual(stats['search']['reset_in'], 60)
+
+    def test_exhausted_budget_waits_for_reset(self):
+        """Test that requests queue until the window resets."""
+        self.scheduler.update('search', self.headers(0, 5, limit=30, resource='search'))
+        waited = self.scheduler.acquire('search')
+        self.assertEqual(waited, 5)
+        self.assertEqual(self.scheduler.acquire('core'), 0)
+
+    def test_wait_beyond_max_raises(self):
+        """Test that long waits fail instead of blocking."""
+        from services.rate_limit import RateLimitExceeded
+        self.scheduler.update('core', self.headers(0, 600))
+        with self.assertRaises(RateLimitExceeded):
+            self.scheduler.acquire('core')
+        self.assertEqual(self.sleeps, [])
+
+    def test_low_budget_is_paced(self):
+        """Test that a nearly exhausted budget is spread over the window."""
+        self.scheduler.update('core', self.headers(5, 10, limit=100))
+        waits = [self.scheduler.acquire('core') for _ in range(3)]
+        self.assertEqual(waits[0], 0)
+        self.assertGreater(waits[1], 0)
+        self.assertGreater(waits[2], 0)
+
+    def test_retry_after_blocks_resource(self):
+        """Test that Retry-After delays the next request."""
+        wait = self.scheduler.backoff('core', {'Retry-After': '3'})
+        self.assertEqual(wait, 3)
+        self.assertEqual(self.scheduler.acquire('core'), 3)
+
+    def test_plain_forbidden_is_not_rate_limit(self):
+        """Test that a 403 without rate limit headers is not retried."""
+        self.assertIsNone(self.scheduler.backoff('core', {}))
+
+    def test_client_retries_after_secondary_rate_limit(self):
+        """Test that GitHubAPI waits out Retry-After and retries once."""
+        attempts = []
+        
+        def route(handler):
+            attempts.append(1)
+            if len(attempts) == 1:
+                return 403, {'Retry-After': '0'}, {'message': 'secondary rate limit'}
+            return 200, {'X-RateLimit-Limit': '5000', 'X-RateLimit-Remaining': '4999',
+                         'X-RateLimit-Reset': '9999999999'}, {'name': 'test-repo'}
+        
+        with StubGitHubServer({'/repos/user/test-repo': route}) as server:
+            api = GitHubAPI(base_url=server.base_url)
+            data = api.fetch_project_data('user/test-repo')
+        
+        self.assertEqual(data['name'], 'test-repo')
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(api.rate_limiter.get_stats()['core']['remaining'], 4999)
+
+
+class TestResilience(unittest.TestCase):
+
+    def test_backoff_delay_is_jittered_and_capped(self):
+        """Test exponential backoff ceilings with full jitter."""
+        from services.resilience import RetryPolicy
+        policy = RetryPolicy(base_delay=1, max_delay=5, random_func=lambda low, high: high)
+        self.assertEqual([policy.delay(i) for i in range(4)], [1, 2, 4, 5])
+
+    def test_retry_budget_limits_retries(self):
+        """Test that retries stop once the budget is spent."""
+        from services.resilience import RetryPolicy
+        policy = RetryPolicy(max_retries=5, budget_ratio=0.5, min_retries=1)
+        self.assertTrue(policy.should_retry(0))
+        self.assertFalse(policy.should_retry(0))
+        policy.record_request()
+        policy.record_request()
+        self.assertTrue(policy.should_retry(0))
+        self.assertFalse(policy.should_retry(5))
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        """Test the closed -> open -> half-open -> closed cycle."""
+        from services.resilience import CircuitBreaker
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+        
+        clock.now = 11
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_client_retries_server_errors(self):
+        """Test that a transient 503 is retried."""
+        from services.resilience import RetryPolicy
+        attempts = []
+        
+        def route(handler):
+            attempts.append(1)
+            if len(attempts) == 1:
+                return 503, {}, {'message': 'unavailable'}
+            return 200, {}, {'name': 'test-repo'}
+        
+        with StubGitHubServer({'/repos/user/test-repo': route}) as server:
+            api = GitHubAPI(base_url=server.base_url, retry_policy=RetryPolicy(base_delay=0))
+            data = api.fetch_project_data('user/test-repo')
+        
+        self.assertEqual(data['name'], 'test-repo')
+        self.assertEqual(len(attempts), 2)
+
+    def test_open_circuit_fails_fast_or_serves_cache(self):
+        """Test that an open circuit skips GitHub and falls back to cached data."""
+        from services.github_api import GitHubCircuitOpenError
+        from services.resilience import CircuitBreaker, RetryPolicy
+        routes = {'/repos/user/cached': etag_route({'name': 'cached'})}
+        with StubGitHubServer(routes) as server:
+            api = GitHubAPI(base_url=server.base_url,
+                            retry_policy=RetryPolicy(max_retries=0),
+                            circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60))
+            api.fetch_project_data('user/cached')
+            api.circuit_breaker.record_failure()
+            
+            self.assertEqual(api.fetch_project_data('user/cached')['name'], 'cached')
+            with self.assertRaises(GitHubCircuitOpenError):
+                api.fetch_project_data('user/other')
+        
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(api.http_cache.get_stats()['stale_if_error_hits'], 1)
+
+    def test_persistent_server_error_serves_cache(self):
+        """Test that a 5xx answer that survives retries falls back to cached data."""
+        from services.resilience import RetryPolicy
+        from services.http_cache import ValidatorCache
+        responses = [(200, {'ETag': '"v1"'}, {'name': 'cached'})]
+        
+        def route(handler):
+            if responses:
+                return responses.pop(0)
+            return 503, {}, {'message': 'unavailable'}
+        
+        with StubGitHubServer({'/repos/user/cached': route}) as server:
+            api = GitHubAPI(base_url=server.base_url, retry_policy=RetryPolicy(max_retries=1, base_delay=0),
+                            http_cache=ValidatorCache(fresh_ttl=0))
+            api.fetch_project_data('user/cached')
+            
+            self.assertEqual(api.fetch_project_data('user/cached')['name'], 'cached')
+            with self.assertRaises(GitHubAPIError):
+                api.fetch_project_data('user/other')
+        
+        revalidations = [headers for path, headers in server.requests[1:] if path == '/repos/user/cached']
+        self.assertTrue(revalidations)
+        self.assertEqual(revalidations[0].get('If-None-Match'), '"v1"')
+        self.assertEqual(api.http_cache.get_stats()['stale_if_error_hits'], 1)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers arriving during an in-flight call share its result."""
+        from services.singleflight import SingleFlight
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        
+        def work():
+            calls.append(1)
+            release.wait(2)
+            return 'result'
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do('key', work)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for _ in range(200):
+            if flight.get_stats()['shared'] == 4:
+                break
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results, ['result'] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.get_stats()['in_flight'], 0)
+
+    def test_errors_are_shared_and_not_cached(self):
+        """Test that an exception reaches the caller and the key is released."""
+        from services.singleflight import SingleFlight
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do('key', MagicMock(side_effect=ValueError('boom')))
+        self.assertEqual(flight.do('key', lambda: 'ok'), 'ok')
+
+    def test_concurrent_fetches_hit_github_once(self):
+        """Test that concurrent fetches of one repository make one upstream request."""
+        import time
+        
+        def slow_route(handler):
+            time.sleep(0.3)
+            return 200, {}, {'name': 'popular'}
+        
+        with StubGitHubServer({'/repos/user/popular': slow_route}) as server:
+            api = GitHubAPI(base_url=server.base_url)
+            threads = [threading.Thread(target=api.fetch_project_data, args=('user/popular',))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(len(server.requests), 1)
+
+
+class TestAsyncGitHubAPI(unittest.TestCase):
+
+    def test_concurrency_limited_across_event_loops(self):
+        """Test that the thread pool bounds requests from every event loop together."""
+        import asyncio
+        import time
+        from services.async_github_api import AsyncGitHubAPI
+        lock = threading.Lock()
+        active = [0, 0]
+        
+        def get_project(name):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return name
+        
+        api = MagicMock()
+        api.get_project.side_effect = get_project
+        client = AsyncGitHubAPI(api, max_concurrency=2)
+        self.addCleanup(client.close)
+        loops = [threading.Thread(target=asyncio.run, args=(client.get_projects(['a/b', 'c/d', 'e/f']),))
+                 for _ in range(3)]
+        for thread in loops:
+            thread.start()
+        for thread in loops:
+            thread.join()
+        
+        self.assertEqual(api.get_project.call_count, 9)
+        self.assertEqual(active[1], 2)
+
+    def test_requests_overlap(self):
+        """Test that concurrent fetches run in parallel and keep input order."""
+        import asyncio
+        import time
+        from services.async_github_api import AsyncGitHubAPI
+        
+        def slow_route(name):
+            def route(handler):
+                time.sleep(0.2)
+                return 200, {}, {'name': name, 'full_name': f'user/{name}'}
+            return route
+        
+        routes = {f'/repos/user/repo{i}': slow_route(f'repo{i}') for i in range(5)}
+        with StubGitHubServer(routes) as server:
+            client = AsyncGitHubAPI(GitHubAPI(base_url=server.base_url), max_concurrency=5)
+            started = time.perf_counter()
+            projects = asyncio.run(client.get_projects([f'user/repo{i}' for i in range(5)]))
+            elapsed = time.perf_counter() - started
+            client.close()
+        
+        self.assertEqual([p.name for p in projects], [f'repo{i}' for i in range(5)])
+        self.assertLess(elapsed, 0.8)
+
+    def test_errors_returned_per_repository(self):
+        """Test that a failing repository does not cancel the others."""
+        import asyncio
+        from services.async_github_api import AsyncGitHubAPI
+        routes = {'/repos/user/ok': repo_route({'name': 'ok'})}
+        with StubGitHubServer(routes) as server:
+            client = AsyncGitHubAPI(GitHubAPI(base_url=server.base_url))
+            results = asyncio.run(client.get_projects(['user/ok', 'user/missing']))
+            exists = asyncio.run(client.validate_repository_exists('user/missing'))
+            client.close()
+        
+        self.assertEqual(results[0].name, 'ok')
+        self.assertIsInstance(results[1], GitHubAPIError)
+        self.assertFalse(exists)
+
+
+    def test_project_details_fetched_in_parallel(self):
+        """Test that metadata, README presence and languages are fetched concurrently."""
+        import asyncio
+        import base64
+        import time
+        from services.async_github_api import AsyncGitHubAPI
+        
+        def slow(body):
+            def route(handler):
+                time.sleep(0.3)
+                return 200, {}, body
+            return route
+        
+        routes = {
+            '/repos/user/repo': slow({'name': 'repo', 'full_name': 'user/repo', 'topics': ['cli']}),
+            '/repos/user/repo/readme': slow({'content': base64.b64encode(b'# Repo').decode('ascii')}),
+            '/repos/user/repo/languages': slow({'Shell': 10, 'Python': 500})
+        }
+        with StubGitHubServer(routes) as server:
+            client = AsyncGitHubAPI(GitHubAPI(base_url=server.base_url))
+            started = time.perf_counter()
+            details = asyncio.run(client.get_project_details('user/repo'))
+            elapsed = time.perf_counter() - started
+            client.close()
+        
+        self.assertEqual(details['project'].topics, ('cli',))
+        self.assertTrue(details['has_readme'])
+        self.assertEqual(list(details['languages']), ['Python', 'Shell'])
+        self.assertLess(elapsed, 0.8)
+
+class FakeClock:
+    """Manually advanced clock for cache expiry tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRepositoryPrefetcher(unittest.TestCase):
+
+    def setUp(self):
+        from services.prefetch import RepositoryPrefetcher
+        self.release = threading.Event()
+        self.api = MagicMock()
+        self.api.get_project.side_effect = lambda name: (self.release.wait(5), GitHubProject(
+            name=name.split('/')[1], full_name=name))[1]
+        self.api.has_repository_readme.return_value = True
+        self.api.fetch_repository_languages.return_value = {'Python': 10}
+        self.prefetcher = RepositoryPrefetcher(self.api, max_workers=1, max_pending=2)
+        self.addCleanup(self.prefetcher.close)
+
+    def wait_idle(self):
+        import time
+        deadline = time.monotonic() + 5
+        while self.prefetcher.get_stats()['pending'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_prefetch_dedupes_and_bounds_pending(self):
+        """Test that repeated and excess prefetches are not scheduled."""
+        self.assertEqual(self.prefetcher.prefetch('user/one'), 'scheduled')
+        self.assertEqual(self.prefetcher.prefetch('User/One'), 'pending')
+        self.assertEqual(self.prefetcher.prefetch('user/two'), 'scheduled')
+        self.assertEqual(self.prefetcher.prefetch('user/three'), 'skipped')
+        
+        self.release.set()
+        self.wait_idle()
+        self.assertEqual(self.prefetcher.prefetch('user/one'), 'cached')
+        details = self.prefetcher.get_details('USER/one')
+        self.assertEqual(details['project'].full_name, 'user/one')
+        self.assertTrue(details['has_readme'])
+        self.assertEqual(details['languages'], {'Python': 10})
+        self.assertIsNone(self.prefetcher.get_details('user/three'))
+        
+        stats = self.prefetcher.get_stats()
+        self.assertEqual((stats['scheduled'], stats['skipped'], stats['completed']), (2, 1, 2))
+        self.assertEqual(self.api.get_project.call_count, 2)
+
+    def test_failed_prefetch_is_counted_not_cached(self):
+        """Test that a failing prefetch leaves nothing behind and can be retried."""
+        self.api.get_project.side_effect = GitHubAPIError("Repository 'user/missing' not found")
+        self.prefetcher.prefetch('user/missing')
+        self.wait_idle()
+        
+        self.assertIsNone(self.prefetcher.get_details('user/missing'))
+        self.assertEqual(self.prefetcher.get_stats()['failed'], 1)
+        self.assertEqual(self.prefetcher.prefetch('user/missing'), 'scheduled')
+
+
+class TestJobQueue(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.release = threading.Event()
+
+    def make_queue(self, store=None, **kwargs):
+        from services.jobs import JobQueue, MemoryJobStore
+        queue = JobQueue(store=store or MemoryJobStore(), **kwargs)
+        self.addCleanup(queue.close)
+        
+        def slow(payload, progress):
+            progress(0.5, 'halfway')
+            self.release.wait(5)
+            return {'echo': payload['value']}
+        
+        def broken(payload, progress):
+            raise GitHubAPIError("Repository 'user/missing' not found")
+        
+        queue.register('slow', slow)
+        queue.register('broken', broken)
+        return queue
+
+    def wait_for(self, queue, job_id, statuses=('succeeded', 'failed')):
+        import time
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            job = queue.get(job_id)
+            if job is not None and job['status'] in statuses:
+                return job
+            time.sleep(0.01)
+        self.fail(f'Job {job_id} did not reach {statuses}')
+
+    def test_job_lifecycle_in_each_store(self):
+        """Test progress and results through the memory and SQLite stores."""
+        from services.jobs import SQLiteJobStore, job_status
+        for store in (None, SQLiteJobStore(os.path.join(self.tmpdir.name, 'jobs.sqlite3'))):
+            with self.subTest(store=type(store).__name__):
+                self.release.clear()
+                queue = self.make_queue(store)
+                job = queue.submit('slow', {'value': 42})
+                self.assertEqual(job['status'], 'queued')
+                
+                running = self.wait_for(queue, job['id'], statuses=('running',))
+                self.assertEqual(job_status(running)['stage'], 'halfway')
+                self.assertNotIn('result', job_status(running))
+                
+                self.release.set()
+                done = job_status(self.wait_for(queue, job['id']))
+                self.assertEqual((done['status'], done['progress']), ('succeeded', 1.0))
+                self.assertEqual(done['result'], {'echo': 42})
+                
+                failed = job_status(self.wait_for(queue, queue.submit('broken', {})['id']))
+                self.assertEqual(failed['status'], 'failed')
+                self.assertIn('not found', failed['error'])
+                self.assertIsNone(queue.get('missing'))
+                with self.assertRaises(ValueError):
+                    queue.submit('unknown', {})
+
+    def test_queue_depth_is_bounded(self):
+        """Test that submissions beyond the waiting limit are rejected."""
+        from services.jobs import JobQueueFull
+        queue = self.make_queue(max_workers=1, max_queued=1)
+        first = queue.submit('slow', {'value': 1})
+        self.wait_for(queue, first['id'], statuses=('running',))
+        queue.submit('slow', {'value': 2})
+        
+        with self.assertRaises(JobQueueFull) as raised:
+            queue.submit('slow', {'value': 3})
+        self.assertGreaterEqual(raised.exception.retry_after, 1)
+        self.assertEqual(queue.get_stats()['rejected'], 1)
+        
+        self.release.set()
+        self.wait_for(queue, first['id'])
+
+    def test_results_expire_and_lost_jobs_fail(self):
+        """Test result expiry and that jobs running past the timeout are failed."""
+        from services.jobs import MemoryJobStore
+        clock = FakeClock()
+        store = MemoryJobStore()
+        queue = self.make_queue(store, result_ttl=60, timeout=30, clock=clock)
+        self.release.set()
+        job = self.wait_for(queue, queue.submit('slow', {'value': 1})['id'])
+        
+        clock.now = 59
+        self.assertIsNotNone(queue.get(job['id']))
+        clock.now = 61
+        self.assertIsNone(queue.get(job['id']))
+        
+        store.create(dict(job, id='orphan', status='running', started_at=61, updated_at=61, expires_at=151))
+        store.create(dict(job, id='waiting', status='queued', started_at=None, updated_at=61, expires_at=151))
+        self.assertEqual(queue.get('orphan')['status'], 'running')
+        clock.now = 100
+        self.assertEqual(queue.get('orphan')['status'], 'failed')
+        self.assertEqual(queue.get('waiting')['status'], 'queued')
+        
+        # Expired records are purged on the next submission
+        self.release.clear()
+        submitted = queue.submit('slow', {'value': 2})
+        self.assertEqual(submitted['expires_at'], 100 + 30 + 60)
+        self.assertIsNone(store.get(job['id']))
+        clock.now = 160
+        queue.submit('slow', {'value': 3})
+        self.assertIsNone(store.get('orphan'))
+        self.assertIsNone(store.get('waiting'))
+        self.release.set()
+
+    def test_default_store_created_on_first_use(self):
+        """Test that statistics do not create the default store and stores are abstract."""
+        from services.jobs import JobQueue, JobStore, MemoryJobStore
+        with self.assertRaises(TypeError):
+            JobStore()
+        with patch('services.jobs.create_job_store', return_value=MemoryJobStore()) as create_job_store:
+            queue = JobQueue(max_workers=1)
+            self.addCleanup(queue.close)
+            self.assertEqual(queue.get_stats()['submitted'], 0)
+            create_job_store.assert_not_called()
+            queue.get('missing')
+            create_job_store.assert_called_once()
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def setUp(self):
+        from services.cache import TTLCache
+        self.clock = FakeClock()
+        self.cache = TTLCache(max_entries=2, ttl=10, stale_ttl=0, clock=self.clock)
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are not returned once their TTL passes."""
+        self.cache.set('a', 1)
+        self.assertEqual(self.cache.get('a'), 1)
+        self.clock.now = 11
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_per_entry_ttl(self):
+        """Test that an entry-specific TTL overrides the default."""
+        self.cache.set('a', 1, ttl=100)
+        self.clock.now = 50
+        self.assertEqual(self.cache.get('a'), 1)
+
+    def test_lru_eviction_and_counters(self):
+        """Test size-bounded eviction and hit/miss accounting."""
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+        
+        self.assertIsNone(self.cache.get('b'))
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+    def test_get_or_load_caches_loader_result(self):
+        """Test that the loader runs only on a miss."""
+        loader = MagicMock(return_value='value')
+        self.assertEqual(self.cache.get_or_load('a', loader), 'value')
+        self.assertEqual(self.cache.get_or_load('a', loader), 'value')
+        loader.assert_called_once()
+
+    def test_stale_while_revalidate(self):
+        """Test that stale values are served while refreshing in the background."""
+        from services.cache import TTLCache
+        cache = TTLCache(max_entries=2, ttl=10, stale_ttl=60, clock=self.clock)
+        cache.set('a', 'old')
+        self.clock.now = 20
+        
+        refreshed = threading.Event()
+        
+        def loader():
+            refreshed.set()
+            return 'new'
+        
+        self.assertEqual(cache.get_or_load('a', loader), 'old')
+        self.assertTrue(refreshed.wait(2))
+        for _ in range(100):
+            if cache.get_stats()['refreshes']:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(cache.get_or_load('a', loader), 'new')
+        self.assertEqual(cache.get_stats()['stale_hits'], 1)
+
+
+class TestProjectCache(unittest.TestCase):
+
+    @patch('services.github_api.requests.Session.get')
+    def test_get_project_uses_cache(self, mock_get):
+        """Test that repeated get_project calls hit GitHub once."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'name': 'test-repo', 'full_name': 'user/test-repo'}
+        mock_get.return_value = mock_response
+        
+        api = GitHubAPI()
+        first = api.get_project('user/test-repo')
+        second = api.get_project('User/Test-Repo')
+        
+        self.assertIsInstance(first, GitHubProject)
+        self.assertIs(first, second)
+        mock_get.assert_called_once()
+
+
+class TestTemplates(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_template(self, name, source, mtime=None):
+        path = os.path.join(self.tmpdir.name, f'{name}.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_compiled_template_renders_slots(self):
+        """Test rendering of static segments and slots."""
+        from services.templates import CompiledTemplate
+        template = CompiledTemplate("# {{ title }}\n{{title}} has {{ count }} items")
+        self.assertEqual(template.slots, frozenset(['title', 'count']))
+        self.assertEqual(template.render({'title': 'Doc', 'count': 3}), "# Doc\nDoc has 3 items")
+        self.assertEqual(template.render_bytes({'title': 'Dé', 'count': 1}), "# Dé\nDé has 1 items".encode('utf-8'))
+
+    def test_missing_slot_raises(self):
+        """Test that rendering without a slot value fails clearly."""
+        from services.templates import CompiledTemplate, TemplateError
+        with self.assertRaises(TemplateError):
+            CompiledTemplate("{{ missing }}").render({})
+
+    def test_bind_leaves_deferred_slots_open(self):
+        """Test partial rendering with serve-time slots filled later."""
+        from services.templates import CompiledTemplate
+        template = CompiledTemplate("# {{ title }}\n\n## Body\n{{ body }}\n*{{ when }}*")
+        bound = template.bind({'title': 'Doc', 'body': '{{ when }} stays literal'}, deferred=['when'])
+        
+        self.assertEqual(bound.slots, frozenset(['when']))
+        self.assertEqual(bound.version, template.version)
+        self.assertEqual(bound.render({'when': 'today'}), "# Doc\n\n## Body\n{{ when }} stays literal\n*today*")
+        self.assertEqual(''.join(bound.render_sections({'when': 'today'})), bound.render({'when': 'today'}))
+
+    def test_registry_loads_named_templates_and_hot_reloads(self):
+        """Test loading templates by name and reloading them when the file changes."""
+        from services.templates import TemplateRegistry, TemplateError
+        self.write_template('short', 'v1 {{ title }}\n', mtime=1000)
+        registry = TemplateRegistry(self.tmpdir.name, auto_reload=True, check_interval=0)
+        
+        first = registry.get('short')
+        self.assertIs(registry.get('short'), first)
+        self.assertEqual(first.render({'title': 'x'}), 'v1 x')
+        
+        self.write_template('short', 'v2 {{ title }}\n', mtime=2000)
+        self.assertEqual(registry.get('short').render({'title': 'x'}), 'v2 x')
+        self.assertIn('short', registry.names())
+        with self.assertRaises(TemplateError):
+            registry.get('missing')
+
+    def test_generator_uses_named_template(self):
+        """Test that ProposalGenerator renders the selected template."""
+        from services.templates import TemplateRegistry
+        self.write_template('brief', '{{ title }} for {{ full_name }} ({{ stars }} stars)\n')
+        generator = ProposalGenerator(template_name='brief', templates=TemplateRegistry(self.tmpdir.name))
+        proposal = Proposal("Brief Proposal", "A short description.", "One")
+        project = GitHubProject(name='repo', full_name='user/repo', stargazers_count=1200)
+        
+        self.assertEqual(generator.generate(proposal, project), 'Brief Proposal for user/repo (1,200 stars)')
+
+
+class TestRenderCache(unittest.TestCase):
+
+    def setUp(self):
+        from services.render_cache import RenderCache
+        self.cache = RenderCache()
+        self.generator = ProposalGenerator(render_cache=self.cache)
+        self.proposal = Proposal("Cached Proposal", "A proposal rendered once.", "One; Two")
+        self.project = GitHubProject(name='repo', full_name='user/repo', stargazers_count=3,
+                                     updated_at='2024-01-01T00:00:00Z')
+
+    def test_key_covers_proposal_repository_and_template(self):
+        """Test that the key changes with the proposal, repository version and template."""
+        from services.render_cache import render_key
+        from services.templates import CompiledTemplate
+        template = CompiledTemplate('{{ title }}', name='t')
+        key = render_key(self.proposal, 'user/repo', 'v1', template)
+        
+        self.assertEqual(key, render_key(Proposal("Cached Proposal", "A proposal rendered once.", "One\nTwo"),
+                                         'User/Repo', 'v1', template))
+        self.assertNotEqual(key, render_key(self.proposal, 'user/repo', 'v2', template))
+        self.assertNotEqual(key, render_key(self.proposal, 'user/other', 'v1', template))
+        self.assertNotEqual(key, render_key(self.proposal, 'user/repo', 'v1', CompiledTemplate('{{ title }}!', name='t')))
+
+    def test_repeat_is_served_from_cache_with_fresh_footer(self):
+        """Test that a repeat skips rendering but fills the generated-on slot again."""
+        first = self.generator.generate(self.proposal, self.project, metadata={'has_readme': True})
+        cached = self.generator.lookup(self.proposal, self.project)
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.metadata, {'has_readme': True})
+        self.assertEqual(cached.template.slots, frozenset(['generated_on']))
+        
+        with patch('services.proposal_generator.datetime') as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = 'serve time'
+            mock_datetime.now.return_value.isoformat.return_value = '2024-01-02T00:00:00'
+            second = self.generator.generate(self.proposal, self.project)
+        
+        self.assertIn('*Proposal generated on serve time*', second)
+        self.assertEqual(second.rsplit('*Proposal generated on', 1)[0], first.rsplit('*Proposal generated on', 1)[0])
+        self.assertEqual(len(self.generator.proposals), 2)
+        self.assertEqual(self.cache.get_stats()['entries'], 1)
+
+    def test_rendering_without_metadata_not_cached(self):
+        """Test that only renderings with response metadata are cached."""
+        list(self.generator.generate_stream(self.proposal, self.project))
+        self.generator.generate(self.proposal, self.project)
+        self.assertIsNone(self.generator.lookup(self.proposal, self.project))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_new_repository_version_invalidates(self):
+        """Test that rendering for a new repository version drops the old renderings."""
+        metadata = {'has_readme': True}
+        self.generator.generate(self.proposal, self.project, repo_version='v1', metadata=metadata)
+        self.generator.generate(Proposal("Other Proposal", "Another proposal.", "Three"), self.project,
+                                repo_version='v1', metadata=metadata)
+        self.assertEqual(len(self.cache), 2)
+        
+        self.generator.generate(self.proposal, self.project, repo_version='v2', metadata=metadata)
+        self.assertIsNone(self.generator.lookup(self.proposal, self.project, 'v1'))
+        self.assertIsNotNone(self.generator.lookup(self.proposal, self.project, 'v2'))
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.get_stats()['invalidations'], 2)
+        
+        self.cache.invalidate_repository('User/Repo')
+        self.assertIsNone(self.generator.lookup(self.proposal, self.project, 'v2'))
+
+    def test_repository_version_uses_matching_etag(self):
+        """Test that the version includes the cached ETag only for the same repository state."""
+        from services.http_cache import CachedResponse, ValidatorCache
+        api = GitHubAPI(base_url='https://api.test', http_cache=ValidatorCache())
+        self.assertEqual(api.get_repository_version(self.project), '2024-01-01T00:00:00Z')
+        
+        api.http_cache.set('https://api.test/repos/user/repo',
+                           CachedResponse({'updated_at': '2024-01-01T00:00:00Z'}, etag='"abc"'))
+        self.assertEqual(api.get_repository_version(self.project), '2024-01-01T00:00:00Z|"abc"')
+        
+        api.http_cache.set('https://api.test/repos/user/repo',
+                           CachedResponse({'updated_at': '2024-02-01T00:00:00Z'}, etag='"def"'))
+        self.assertEqual(api.get_repository_version(self.project), '2024-01-01T00:00:00Z')
+        self.assertIsNone(api.get_repository_version(GitHubProject(name='repo', full_name='user/repo')))
+
+
+class TestProposalHistory(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.proposal = Proposal("History Proposal", "A proposal kept in history.", "One; Two")
+        self.project = GitHubProject(name='repo', full_name='user/repo', stargazers_count=3)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_history_is_bounded(self):
+        """Test that only the most recent proposals are kept."""
+        from services.history import ProposalHistory
+        generator = ProposalGenerator(history=ProposalHistory(max_entries=2))
+        for i in range(5):
+            generator.add_proposal(f"Title {i}", "Description", ["Conclusion"])
+        
+        titles = [record['title'] for record in generator.get_all_proposals()]
+        self.assertEqual(titles, ["Title 3", "Title 4"])
+
+    def test_compact_history_spills_content_to_disk(self):
+        """Test that compact records keep a hash and export reads the spilled text."""
+        import hashlib
+        from services.history import ProposalHistory
+        history = ProposalHistory(max_entries=1, compact=True, spill_dir=self.tmpdir.name)
+        generator = ProposalGenerator(history=history)
+        content = generator.generate(self.proposal, self.project)
+        
+        record = generator.get_latest_proposal()
+        self.assertNotIn('formatted_proposal', record)
+        self.assertEqual(record['content_hash'], hashlib.sha256(content.encode('utf-8')).hexdigest())
+        self.assertEqual(generator.export_proposal_to_markdown(), content)
+        
+        # Evicting the record removes its spill file
+        generator.add_proposal("Legacy Title", "Legacy description", ["Conclusion"])
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+    def test_compact_history_without_spill(self):
+        """Test that compact records without a spill directory report no content."""
+        from services.history import ProposalHistory
+        generator = ProposalGenerator(history=ProposalHistory(compact=True))
+        generator.generate(self.proposal, self.project)
+        self.assertEqual(generator.export_proposal_to_markdown(), 'No formatted proposal available')
+
+
 class TestProposalGenerator(unittest.TestCase):
     
     def setUp(self):
@@ -147,6 +1488,21 @@ class TestProposalGenerator(unittest.TestCase):
         self.assertIn("Legacy Title", formatted)
         self.assertIn("Legacy conclusion 1", formatted)
 
+    def test_generate_stream_matches_generate(self):
+        """Test that streamed sections join to the full proposal."""
+        full = ProposalGenerator().generate(self.sample_proposal, self.sample_project)
+        
+        generator = ProposalGenerator()
+        chunks = list(generator.generate_stream(self.sample_proposal, self.sample_project))
+        
+        self.assertGreater(len(chunks), 5)
+        self.assertTrue(chunks[0].startswith("# Test Proposal"))
+        self.assertTrue(chunks[1].startswith("\n## "))
+        # The footer timestamp may differ by a minute between the two renders
+        self.assertEqual(''.join(chunks).rsplit('*Proposal generated on', 1)[0],
+                         full.rsplit('*Proposal generated on', 1)[0])
+        self.assertEqual(generator.get_latest_proposal()['formatted_proposal'], ''.join(chunks))
+
     def test_export_to_markdown(self):
         """Test exporting proposal to markdown."""
         self.proposal_generator.generate(self.sample_proposal, self.sample_project)
@@ -0,0 +1,141 @@
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import compression, json_backend
+from utils.keywords import STOP_WORDS, KeywordExtractor, tokenize
+
+
+class TestJSONBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.data = {'name': 'café', 'count': 3, 'nested': {'items': [1, 2.5, None, True]}}
+
+    def test_round_trip_with_each_backend(self):
+        """Test every available backend encodes and decodes the same data."""
+        backends = ['json'] + [name for name in ('orjson', 'ujson')
+                               if getattr(json_backend, name) is not None]
+        for backend in backends:
+            with self.subTest(backend=backend), patch.object(json_backend, 'BACKEND', backend):
+                text = json_backend.dumps(self.data)
+                self.assertIsInstance(text, str)
+                self.assertIn('café', text)
+                self.assertEqual(json_backend.loads(text), self.data)
+                self.assertEqual(json_backend.loads(text.encode('utf-8')), self.data)
+                self.assertEqual(json_backend.loads(json_backend.dumps(self.data, indent=2)), self.data)
+
+    def test_unknown_backend_falls_back(self):
+        """Test an unavailable backend name falls back to an installed one."""
+        self.assertIn(json_backend._select_backend('missing'), ('orjson', 'ujson', 'json'))
+        self.assertEqual(json_backend._select_backend('json'), 'json')
+
+    def test_default_and_fallback_encoding(self):
+        """Test objects needing a default hook or the stdlib still encode."""
+        from datetime import date
+        text = json_backend.dumps({'day': date(2024, 1, 2)}, default=str)
+        self.assertEqual(json_backend.loads(text), {'day': '2024-01-02'})
+        # Integers beyond 64 bits are not supported by orjson
+        self.assertEqual(json_backend.loads(json_backend.dumps({'big': 2 ** 70})), {'big': 2 ** 70})
+
+    def test_datetimes_encoded_alike_by_each_backend(self):
+        """Test that datetimes go through the default hook with every backend."""
+        from datetime import datetime
+        data = {'at': datetime(2024, 1, 2, 3, 4, 5)}
+        backends = ['json'] + [name for name in ('orjson', 'ujson')
+                               if getattr(json_backend, name) is not None]
+        for backend in backends:
+            with self.subTest(backend=backend), patch.object(json_backend, 'BACKEND', backend):
+                self.assertEqual(json_backend.loads(json_backend.dumps(data, default=lambda value: 'custom')),
+                                 {'at': 'custom'})
+                with self.assertRaises(TypeError):
+                    json_backend.dumps(data)
+
+    def test_select_fields(self):
+        """Test selective field extraction."""
+        items = [{'name': 'a', 'size': 1, 'owner': {}}, {'name': 'b'}]
+        self.assertEqual(json_backend.select_items(items, ('name', 'size')),
+                         [{'name': 'a', 'size': 1}, {'name': 'b', 'size': None}])
+
+
+
+class TestCompression(unittest.TestCase):
+
+    def test_choose_encoding(self):
+        """Test Accept-Encoding negotiation with quality values."""
+        self.assertEqual(compression.choose_encoding('gzip, deflate'), 'gzip')
+        self.assertIsNone(compression.choose_encoding('identity'))
+        self.assertIsNone(compression.choose_encoding('gzip;q=0'))
+        self.assertIsNone(compression.choose_encoding(None))
+        self.assertEqual(compression.choose_encoding('*'), compression.ENCODINGS[0])
+        with patch.object(compression, 'ENCODINGS', ('br', 'gzip')):
+            self.assertEqual(compression.choose_encoding('gzip, br'), 'br')
+            self.assertEqual(compression.choose_encoding('gzip;q=1.0, br;q=0.5'), 'gzip')
+
+    def test_threshold_and_round_trip(self):
+        """Test that only large text bodies qualify and gzip output is reproducible."""
+        import gzip
+        self.assertFalse(compression.is_compressible('application/json', 10, min_size=1024))
+        self.assertFalse(compression.is_compressible('image/png', 5000, min_size=1024))
+        self.assertTrue(compression.is_compressible('application/json', 5000, min_size=1024))
+        
+        data = b'{"proposal": "text"}' * 100
+        compressed = compression.compress(data, 'gzip')
+        self.assertEqual(compressed, compression.compress(data, 'gzip'))
+        self.assertEqual(gzip.decompress(compressed), data)
+        with self.assertRaises(ValueError):
+            compression.compress(data, 'deflate')
+
+
+class StubCorpus:
+    """Corpus with fixed document frequencies."""
+
+    def __init__(self, size, frequencies):
+        self.size = size
+        self.frequencies = frequencies
+
+    def document_frequency(self, term):
+        return self.frequencies.get(term, 0)
+
+    def __len__(self):
+        return self.size
+
+
+class TestKeywordExtractor(unittest.TestCase):
+
+    def test_tokenize_and_stop_words(self):
+        """Test tokenization and the frozen stop list."""
+        self.assertIsInstance(STOP_WORDS, frozenset)
+        self.assertEqual(tokenize('Fast C++ and C# parsers, v2!'), ['fast', 'c++', 'and', 'c#', 'parsers', 'v2'])
+        terms = KeywordExtractor().extract('Improve the project with 2024 features', 'Use an API')
+        self.assertEqual(terms, ['api'])
+
+    def test_title_weight_and_deterministic_order(self):
+        """Test that title words outrank body words and ties are alphabetical."""
+        extractor = KeywordExtractor()
+        terms = extractor.extract('Graph database', 'Query engine for graph storage')
+        self.assertEqual(terms[:2], ['graph', 'database'])
+        self.assertEqual(terms, extractor.extract('database graph', 'storage graph engine query'))
+
+    def test_idf_downweights_common_terms(self):
+        """Test that terms common in the corpus lose to rare ones."""
+        corpus = StubCorpus(100, {'library': 90, 'tokenizer': 2})
+        extractor = KeywordExtractor(corpus)
+        self.assertEqual(extractor.extract('', 'library tokenizer', max_terms=1), ['tokenizer'])
+        self.assertEqual(KeywordExtractor().extract('', 'library tokenizer', max_terms=1), ['library'])
+
+    def test_unseen_terms_not_promoted(self):
+        """Test that title terms and corpus terms beat words the corpus never saw."""
+        corpus = StubCorpus(30, {'machine': 30, 'learning': 30, 'library': 12, 'neural': 20,
+                                 'network': 18, 'models': 22, 'training': 15})
+        extractor = KeywordExtractor(corpus)
+        self.assertEqual(extractor.idf('quickly'), 1.0)
+        terms = extractor.extract('Machine learning library',
+                                  'Training neural network models quickly', 'Add docs; Add tests')
+        self.assertEqual(terms, ['library', 'learning', 'machine', 'training', 'network'])
+
+if __name__ == '__main__':
+    unittest.main()
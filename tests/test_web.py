@@ -0,0 +1,367 @@
+import unittest
+import sys
+import os
+import json
+from unittest.mock import patch, MagicMock
+
+# Add the project root and src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from web.app import app
+from models.github_project import GitHubProject
+from services.github_api import GitHubAPIError
+from services.render_cache import RenderCache
+from services.repo_index import RepositoryIndex
+from services.search import RepositorySearchService
+
+
+def parse_sse(body):
+    """Split a Server-Sent Events body into (event, data) pairs."""
+    events = []
+    for message in body.strip().split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in message.split('\n'))
+        events.append((fields['event'], json.loads(fields['data'])))
+    return events
+
+
+class TestWebApp(unittest.TestCase):
+
+    def setUp(self):
+        self.client = app.test_client()
+        self.project = GitHubProject(
+            name='test-repo',
+            full_name='user/test-repo',
+            html_url='https://github.com/user/test-repo',
+            description='A test repository',
+            language='Python',
+            stargazers_count=150,
+            forks_count=30,
+            open_issues_count=5,
+            created_at='2023-01-01T00:00:00Z',
+            updated_at='2023-12-01T00:00:00Z'
+        )
+        self.payload = {
+            'title': 'Test Proposal',
+            'description': 'This is a test proposal for validation purposes.',
+            'conclusions': 'Improve documentation; Add unit tests',
+            'repo_name': 'user/test-repo'
+        }
+        self.api = MagicMock()
+        self.api.get_project.return_value = self.project
+        self.api.has_repository_readme.return_value = True
+        self.api.fetch_repository_languages.return_value = {'Python': 9000, 'Shell': 100}
+        self.api.get_repository_version.return_value = '2023-12-01T00:00:00Z|"v1"'
+        self.render_cache = RenderCache()
+        for target, value in (('web.app.get_github_api', self.api),
+                              ('web.app.get_search_service',
+                               RepositorySearchService(self.api, index=RepositoryIndex())),
+                              ('web.app.get_render_cache', self.render_cache)):
+            patcher = patch(target, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_generate_proposal(self):
+        """Test the JSON proposal endpoint."""
+        response = self.client.post('/api/generate-proposal', json=self.payload)
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('# Test Proposal', data['proposal'])
+        self.assertEqual(data['metadata']['languages'], {'Python': 9000, 'Shell': 100})
+        self.assertTrue(data['metadata']['has_readme'])
+        self.api.has_repository_readme.assert_called_once_with('user/test-repo')
+        
+        self.api.get_project.side_effect = GitHubAPIError("Repository 'user/test-repo' not found")
+        response = self.client.post('/api/generate-proposal', json=self.payload)
+        self.assertEqual(response.status_code, 400)
+
+    def test_generate_proposal_served_from_render_cache(self):
+        """Test that a repeat submission skips the README check until the repository changes."""
+        first = self.client.post('/api/generate-proposal', json=self.payload).get_json()
+        second = self.client.post('/api/generate-proposal', json=self.payload).get_json()
+        
+        self.assertFalse(first['metadata']['cached'])
+        self.assertTrue(second['metadata']['cached'])
+        self.assertEqual(second['metadata']['languages'], {'Python': 9000, 'Shell': 100})
+        self.assertEqual(second['proposal'].rsplit('*Proposal generated on', 1)[0],
+                         first['proposal'].rsplit('*Proposal generated on', 1)[0])
+        self.assertNotIn('{{', second['proposal'])
+        self.api.has_repository_readme.assert_called_once()
+        
+        self.api.get_repository_version.return_value = '2023-12-02T00:00:00Z|"v2"'
+        third = self.client.post('/api/generate-proposal', json=self.payload).get_json()
+        self.assertFalse(third['metadata']['cached'])
+        self.assertEqual(self.api.has_repository_readme.call_count, 2)
+        self.assertEqual(len(self.render_cache), 1)
+
+    def test_prefetch_warms_generate(self):
+        """Test that a prefetched repository is generated without fetching it again."""
+        import time
+        from services.prefetch import RepositoryPrefetcher
+        prefetcher = RepositoryPrefetcher(self.api)
+        self.addCleanup(prefetcher.close)
+        with patch('web.app.get_prefetcher', return_value=prefetcher):
+            for body in ({'repo_name': 'not a repo'}, {'repo_name': 5}, ['user/test-repo'], 'x'):
+                response = self.client.post('/api/prefetch-repo', json=body)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.get_json())
+            
+            response = self.client.post('/api/prefetch-repo', json={'repo_name': 'user/test-repo'})
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.get_json()['status'], 'scheduled')
+            deadline = time.monotonic() + 5
+            while prefetcher.get_details('user/test-repo') is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(self.client.post('/api/prefetch-repo', json={'repo_name': 'user/test-repo'})
+                             .get_json()['status'], 'cached')
+            
+            data = self.client.post('/api/generate-proposal', json=self.payload).get_json()
+        
+        self.assertEqual(data['metadata']['languages'], {'Python': 9000, 'Shell': 100})
+        self.api.has_repository_readme.assert_called_once_with('user/test-repo')
+        self.api.fetch_repository_languages.assert_called_once_with('user/test-repo')
+
+    def test_prefetch_does_not_replace_fetched_project(self):
+        """Test that prefetched details contribute only the README flag and languages."""
+        from services.prefetch import RepositoryPrefetcher
+        stale = GitHubProject(name='old-name', full_name='user/old-name', html_url='https://github.com/user/old-name',
+                              description='A stale description', language='Python',
+                              updated_at='2023-01-01T00:00:00Z')
+        prefetcher = RepositoryPrefetcher(self.api)
+        self.addCleanup(prefetcher.close)
+        prefetcher.cache.set('user/test-repo', {'project': stale, 'has_readme': False, 'languages': {'Go': 10}})
+        with patch('web.app.get_prefetcher', return_value=prefetcher):
+            data = self.client.post('/api/generate-proposal', json=self.payload).get_json()
+            self.render_cache.clear()
+            done = parse_sse(self.client.post('/api/generate-proposal/stream', json=self.payload)
+                             .get_data(as_text=True))[-1][1]
+        
+        for metadata in (data['metadata'], done):
+            self.assertEqual(metadata['project_name'], 'user/test-repo')
+            self.assertEqual(metadata['project_url'], 'https://github.com/user/test-repo')
+            self.assertEqual(metadata['languages'], {'Go': 10})
+            self.assertFalse(metadata['has_readme'])
+        self.assertNotIn('A stale description', data['proposal'])
+        self.api.has_repository_readme.assert_not_called()
+
+    def test_prefetch_warms_stream(self):
+        """Test that the streaming endpoint uses prefetched details and caches the rendering."""
+        import time
+        from services.prefetch import RepositoryPrefetcher
+        prefetcher = RepositoryPrefetcher(self.api)
+        self.addCleanup(prefetcher.close)
+        with patch('web.app.get_prefetcher', return_value=prefetcher):
+            self.client.post('/api/prefetch-repo', json={'repo_name': 'user/test-repo'})
+            deadline = time.monotonic() + 5
+            while prefetcher.get_details('user/test-repo') is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            
+            response = self.client.post('/api/generate-proposal/stream', json=self.payload)
+            done = parse_sse(response.get_data(as_text=True))[-1]
+            data = self.client.post('/api/generate-proposal', json=self.payload).get_json()
+        
+        self.assertEqual(done[0], 'done')
+        self.assertEqual(done[1]['languages'], {'Python': 9000, 'Shell': 100})
+        self.assertFalse(done[1]['cached'])
+        self.assertTrue(data['metadata']['cached'])
+        self.api.has_repository_readme.assert_called_once_with('user/test-repo')
+        self.api.fetch_repository_languages.assert_called_once_with('user/test-repo')
+
+    def test_background_jobs(self):
+        """Test submitting jobs, polling them to completion and the error answers."""
+        import time
+        from services.jobs import JobQueue, MemoryJobStore
+        queue = JobQueue(store=MemoryJobStore(), max_workers=1, max_queued=0)
+        self.addCleanup(queue.close)
+        with patch('web.app.get_job_queue', return_value=queue):
+            self.assertEqual(self.client.post('/api/jobs', json={'kind': 'nope'}).status_code, 400)
+            bad = self.client.post('/api/jobs', json={'kind': 'generate-proposal', 'payload': {'title': ''}})
+            self.assertEqual(bad.status_code, 400)
+            
+            full = self.client.post('/api/jobs', json={'kind': 'generate-proposal', 'payload': self.payload})
+            self.assertEqual(full.status_code, 429)
+            self.assertIn('Retry-After', full.headers)
+            
+            queue.max_queued = 1
+            response = self.client.post('/api/jobs', json={'kind': 'generate-proposal', 'payload': self.payload})
+            self.assertEqual(response.status_code, 202)
+            status_url = response.get_json()['status_url']
+            self.assertEqual(response.headers['Location'], status_url)
+            
+            deadline = time.monotonic() + 5
+            job = self.client.get(status_url).get_json()
+            while job['status'] not in ('succeeded', 'failed') and time.monotonic() < deadline:
+                time.sleep(0.01)
+                job = self.client.get(status_url).get_json()
+            
+            self.assertEqual(job['status'], 'succeeded')
+            self.assertEqual(job['progress'], 1.0)
+            self.assertIn('# Test Proposal', job['result']['proposal'])
+            self.assertEqual(job['result']['metadata']['languages'], {'Python': 9000, 'Shell': 100})
+            self.assertEqual(self.client.get('/api/jobs/unknown').status_code, 404)
+
+    def test_malformed_job_payloads_rejected(self):
+        """Test that job bodies and payloads of the wrong shape get a JSON 400, not a 500."""
+        bodies = [
+            'x',
+            {'kind': ['generate-proposal']},
+            {'kind': 'generate-proposal', 'payload': 'x'},
+            {'kind': 'generate-proposal', 'payload': {**self.payload, 'title': 5}},
+            {'kind': 'search-repositories', 'payload': {'title': 5}},
+            {'kind': 'search-repositories', 'payload': {'title': 'docs', 'language': None}}
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                response = self.client.post('/api/jobs', json=body)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.get_json())
+        
+        response = self.client.post('/api/generate-proposal', json={**self.payload, 'title': 5})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'title must be a string')
+
+    def test_validate_repo_etag(self):
+        """Test that validate-repo answers a matching If-None-Match with 304, for GET and POST."""
+        first = self.client.post('/api/validate-repo', json={'repo_name': 'user/test-repo'})
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers['ETag']
+        self.assertIn('max-age=', first.headers['Cache-Control'])
+        
+        again = self.client.post('/api/validate-repo', json={'repo_name': 'user/test-repo'},
+                                 headers={'If-None-Match': etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.get_data(), b'')
+        
+        by_get = self.client.get('/api/validate-repo?repo_name=user/test-repo', headers={'If-None-Match': etag})
+        self.assertEqual(by_get.status_code, 304)
+        
+        self.project.stargazers_count = 151
+        changed = self.client.get('/api/validate-repo?repo_name=user/test-repo', headers={'If-None-Match': etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers['ETag'], etag)
+
+    def test_responses_compressed_above_threshold(self):
+        """Test gzip negotiation for large JSON, and no compression for small or streamed bodies."""
+        import gzip
+        response = self.client.post('/api/generate-proposal', json=self.payload,
+                                    headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertIn('# Test Proposal', json.loads(gzip.decompress(response.get_data()))['proposal'])
+        
+        small = self.client.get('/api/health', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', small.headers)
+        
+        stream = self.client.post('/api/generate-proposal/stream', json=self.payload,
+                                  headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', stream.headers)
+        self.assertTrue(stream.get_data(as_text=True).startswith('event: status'))
+
+    def test_static_urls_fingerprinted_and_immutable(self):
+        """Test fingerprinted static URLs get long-lived immutable caching."""
+        import re
+        page = self.client.get('/').get_data(as_text=True)
+        url = re.search(r'/static/js/main\.js\?v=[0-9a-f]+', page).group(0)
+        
+        response = self.client.get(url, headers={'Accept-Encoding': 'gzip'})
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertTrue(response.headers['ETag'].startswith('W/'))
+        response.close()
+        
+        stale = self.client.get('/static/js/main.js?v=0000')
+        self.assertNotIn('immutable', stale.headers.get('Cache-Control', ''))
+        stale.close()
+
+    def test_stream_then_json_returns_full_metadata(self):
+        """Test that a streamed rendering never leaves a cache entry without metadata."""
+        self.client.post('/api/generate-proposal/stream', json=self.payload).get_data()
+        data = self.client.post('/api/generate-proposal', json=self.payload).get_json()
+        
+        for key in ('project_name', 'project_url', 'topics', 'languages', 'has_readme'):
+            self.assertIn(key, data['metadata'])
+        self.assertEqual(data['metadata']['project_name'], 'user/test-repo')
+        
+        again = self.client.post('/api/generate-proposal', json=self.payload).get_json()
+        self.assertTrue(again['metadata']['cached'])
+        self.assertEqual(again['metadata']['languages'], {'Python': 9000, 'Shell': 100})
+
+    def test_generate_proposal_stream(self):
+        """Test that the streaming endpoint emits status, sections and done events."""
+        response = self.client.post('/api/generate-proposal/stream', json=self.payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        
+        events = parse_sse(response.get_data(as_text=True))
+        names = [name for name, _ in events]
+        self.assertEqual(names[0], 'status')
+        self.assertEqual(names[1], 'project')
+        self.assertEqual(names[-1], 'done')
+        text = ''.join(data['text'] for name, data in events if name == 'section')
+        self.assertTrue(text.startswith('# Test Proposal'))
+        self.assertIn('1. Improve documentation', text)
+
+    def test_generate_proposal_stream_errors(self):
+        """Test validation errors before streaming and GitHub errors during it."""
+        response = self.client.post('/api/generate-proposal/stream', json=dict(self.payload, title=''))
+        self.assertEqual(response.status_code, 400)
+        
+        self.api.get_project.side_effect = GitHubAPIError("Repository 'user/test-repo' not found")
+        response = self.client.post('/api/generate-proposal/stream', json=self.payload)
+        events = parse_sse(response.get_data(as_text=True))
+        self.assertEqual(events[-1][0], 'error')
+        self.assertEqual(events[-1][1]['status'], 400)
+
+
+    def test_search_repositories_requests_only_needed_fields(self):
+        """Test that the search endpoint asks for reduced items and maps them."""
+        from web.app import SEARCH_RESULT_FIELDS
+        item = {field: None for field in SEARCH_RESULT_FIELDS}
+        item.update(name='flask', full_name='pallets/flask', stargazers_count=60000,
+                    description='The Python micro framework')
+        self.api.search_repositories.return_value = {'total_count': 1, 'items': [item]}
+        
+        response = self.client.post('/api/search-repositories',
+                                    json={'title': 'Python web framework', 'language': 'Python'})
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['repositories'][0]['full_name'], 'pallets/flask')
+        self.assertEqual(data['repositories'][0]['stars'], 60000)
+        self.assertEqual(data['repositories'][0]['topics'], [])
+        self.assertEqual(data['search_query'], 'framework python web forks:>2 language:python stars:>10')
+        self.assertEqual(self.api.search_repositories.call_args.kwargs['fields'], SEARCH_RESULT_FIELDS)
+        
+        # Equivalent proposal text is answered from the search cache
+        self.client.post('/api/search-repositories',
+                         json={'title': 'web  FRAMEWORK, python!', 'language': 'python'})
+        self.assertEqual(self.api.search_repositories.call_count, 1)
+
+    def test_search_repositories_rejects_invalid_page(self):
+        """Test that the page must be a positive integer."""
+        for page in ('two', 0, -1, None):
+            with self.subTest(page=page):
+                response = self.client.post('/api/search-repositories',
+                                            json={'title': 'Python web framework', 'page': page})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json()['error'], 'page must be a positive integer')
+        self.api.search_repositories.assert_not_called()
+
+
+class TestWebLauncher(unittest.TestCase):
+
+    def test_production_options(self):
+        """Test that gunicorn settings derive from arguments and the CPU count."""
+        import web_launcher
+        args = web_launcher.create_parser().parse_args(['--threads', '8', '--port', '8000'])
+        options = web_launcher.gunicorn_options(args)
+        self.assertEqual(options['bind'], '0.0.0.0:8000')
+        self.assertEqual(options['workers'], web_launcher.default_workers())
+        self.assertEqual(options['worker_class'], 'gthread')
+        self.assertTrue(options['preload_app'])
+        
+        args = web_launcher.create_parser().parse_args(['--workers', '3', '--threads', '1'])
+        options = web_launcher.gunicorn_options(args)
+        self.assertEqual((options['workers'], options['worker_class']), (3, 'sync'))
+
+if __name__ == '__main__':
+    unittest.main()
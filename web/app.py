@@ -1,8 +1,13 @@
 import sys
 import os
-from flask import Flask, render_template, request, jsonify, send_from_directory
+import asyncio
+import hashlib
+import threading
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, url_for
 from flask_cors import CORS
-import json
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import remove_entity_headers
+from werkzeug.security import safe_join
 from datetime import datetime
 import requests
 import urllib.parse
@@ -11,29 +16,175 @@ import urllib.parse
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
 
 from models.proposal import Proposal
-from models.github_project import GitHubProject
-from services.github_api import GitHubAPI, GitHubAPIError
+from services.github_api import GitHubAPIError, GitHubRateLimitError, GitHubCircuitOpenError, get_github_api
+from services.async_github_api import get_async_github_api
 from services.proposal_generator import ProposalGenerator
+from services.cache import TTLCache
+from services.jobs import JobQueueFull, get_job_queue, job_status
+from services.prefetch import get_prefetcher
+from services.render_cache import get_render_cache
+from services.search import get_search_service
 from utils.validators import validate_and_sanitize_proposal, validate_github_repo_name
-from config.settings import PROJECT_NAME
+from utils import json_backend
+from utils.compression import choose_encoding, compress, is_compressible
+from config.settings import (
+    PROJECT_NAME, RENDER_CACHE_ENABLED, COMPRESSION_ENABLED, STATIC_MAX_AGE, VALIDATE_REPO_MAX_AGE,
+    PREFETCH_ENABLED
+)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes through utils.json_backend."""
+
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        return json_backend.dumps(obj, indent=kwargs.get('indent'),
+                                  sort_keys=kwargs.get('sort_keys', self.sort_keys),
+                                  default=kwargs.get('default', self.default))
+
+    def loads(self, s, **kwargs):
+        return json_backend.loads(s)
+
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 CORS(app)
 
 # Configure Flask
 app.config['SECRET_KEY'] = 'github-proposal-generator-secret-key'
 app.config['JSON_SORT_KEYS'] = False
 
+# Content hash of each static file as (mtime, fingerprint)
+_static_fingerprints = {}
+_static_fingerprints_lock = threading.Lock()
+
+# Compressed bodies of responses with a strong ETag (static files), by (ETag, encoding)
+_compressed_bodies = TTLCache(max_entries=64, ttl=STATIC_MAX_AGE, stale_ttl=0)
+
+def static_fingerprint(filename):
+    """Short content hash of a static file, recomputed when the file changes."""
+    path = safe_join(app.static_folder, filename)
+    if path is None:
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = _static_fingerprints.get(filename)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'rb') as f:
+        fingerprint = hashlib.sha256(f.read()).hexdigest()[:12]
+    with _static_fingerprints_lock:
+        _static_fingerprints[filename] = (mtime, fingerprint)
+    return fingerprint
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    """Add a content fingerprint (?v=...) to every url_for('static', ...) URL."""
+    if endpoint == 'static' and 'filename' in values and 'v' not in values:
+        fingerprint = static_fingerprint(values['filename'])
+        if fingerprint is not None:
+            values['v'] = fingerprint
+
+@app.after_request
+def set_static_cache_headers(response):
+    """
+    Let browsers keep fingerprinted static files for good.
+    
+    A URL whose fingerprint matches the current file can never change content, so
+    it is marked immutable; any other static URL is revalidated with its ETag.
+    """
+    if request.endpoint != 'static' or response.status_code not in (200, 304):
+        return response
+    fingerprint = request.args.get('v')
+    if fingerprint and fingerprint == static_fingerprint(request.view_args['filename']):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+    return response
+
+@app.after_request
+def compress_response(response):
+    """
+    Compress text responses with Brotli or gzip, as negotiated with the client.
+    
+    Streamed responses (Server-Sent Events), bodies below COMPRESSION_MIN_SIZE and
+    non-text types are sent as they are. Compressed static files are cached by
+    ETag so each file is compressed once per encoding.
+    """
+    if (not COMPRESSION_ENABLED or response.status_code != 200 or request.method == 'HEAD'
+            or 'Content-Encoding' in response.headers
+            or (response.is_streamed and not response.direct_passthrough)):
+        return response
+    if not is_compressible(response.mimetype, response.content_length or 0):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+    if encoding is None:
+        return response
+    
+    etag, weak = response.get_etag()
+    cache_key = (etag, encoding) if etag and not weak else None
+    body = _compressed_bodies.get(cache_key) if cache_key is not None else None
+    response.direct_passthrough = False
+    if body is None:
+        body = compress(response.get_data(), encoding)
+        if cache_key is not None:
+            _compressed_bodies.set(cache_key, body)
+    else:
+        response.call_on_close(getattr(response.response, 'close', lambda: None))
+    
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    response.headers.pop('Accept-Ranges', None)
+    if etag:
+        # The compressed body is a different representation of the same resource
+        response.set_etag(etag, weak=True)
+    return response
+
+def conditional_response(response, max_age):
+    """
+    Tag a response with an ETag of its body and honour If-None-Match.
+    
+    Unlike Werkzeug's make_conditional this also answers POST requests, so clients
+    re-sending the same request body can revalidate instead of re-downloading.
+    
+    Args:
+        response: Complete 200 response
+        max_age: Seconds the response may be reused without revalidation
+        
+    Returns:
+        The response, or the same response turned into a 304 Not Modified
+    """
+    response.add_etag()
+    response.cache_control.max_age = max_age
+    etag, _ = response.get_etag()
+    if request.if_none_match.contains_weak(etag):
+        response.status_code = 304
+        response.set_data(b'')
+        remove_entity_headers(response.headers)
+    return response
+
 @app.route('/')
 def index():
     """Main page route."""
     return render_template('index.html', project_name=PROJECT_NAME)
 
-@app.route('/api/validate-repo', methods=['POST'])
+@app.route('/api/validate-repo', methods=['GET', 'POST'])
 def validate_repo():
-    """Validate GitHub repository and fetch basic info."""
+    """
+    Validate GitHub repository and fetch basic info.
+    
+    Accepts the repository as a JSON body (POST) or a ``repo_name`` query
+    parameter (GET). Responses carry an ETag, and a matching If-None-Match is
+    answered with 304 Not Modified.
+    """
     try:
-        data = request.get_json()
+        data = request.args if request.method == 'GET' else request.get_json()
         repo_name = data.get('repo_name', '').strip()
         
         if not repo_name:
@@ -46,11 +197,9 @@ def validate_repo():
             return jsonify({'error': str(e)}), 400
         
         # Fetch repository data
-        github_api = GitHubAPI()
-        project_data = github_api.fetch_project_data(repo_name)
-        github_project = GitHubProject.from_api_response(project_data)
+        github_project = get_github_api().get_project(repo_name)
         
-        return jsonify({
+        return conditional_response(jsonify({
             'valid': True,
             'project_info': {
                 'name': github_project.name,
@@ -63,72 +212,267 @@ def validate_repo():
                 'url': github_project.html_url,
                 'created_at': github_project.get_formatted_date(github_project.created_at)
             }
-        })
+        }), VALIDATE_REPO_MAX_AGE)
         
+    except GitHubRateLimitError as e:
+        return jsonify({'error': f'GitHub API Error: {str(e)}'}), 429
+    except GitHubCircuitOpenError as e:
+        return jsonify({'error': f'GitHub API Error: {str(e)}'}), 503
     except GitHubAPIError as e:
         return jsonify({'error': f'GitHub API Error: {str(e)}'}), 400
     except Exception as e:
         return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
 
-@app.route('/api/generate-proposal', methods=['POST'])
-def generate_proposal():
-    """Generate proposal based on user input and GitHub project."""
+@app.route('/api/prefetch-repo', methods=['POST'])
+def prefetch_repo():
+    """
+    Warm the server-side caches for a repository in the background.
+    
+    The front end calls this as soon as a repository is likely to be chosen, so
+    the generate step finds its metadata, README and languages already fetched.
+    Answers immediately with 202 and the prefetch status.
+    """
     try:
-        data = request.get_json()
-        
-        # Extract data
-        title = data.get('title', '').strip()
-        description = data.get('description', '').strip()
-        conclusions = data.get('conclusions', '').strip()
-        repo_name = data.get('repo_name', '').strip()
-        
-        # Validate inputs
-        if not all([title, description, conclusions, repo_name]):
-            return jsonify({'error': 'All fields are required'}), 400
-        
-        # Validate and sanitize proposal data
-        try:
-            clean_title, clean_description, clean_conclusions = validate_and_sanitize_proposal(
-                title, description, conclusions
+        repo_name = text_field(request_object(request.get_json(silent=True)), 'repo_name')
+        validate_github_repo_name(repo_name)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    status = get_prefetcher(get_github_api()).prefetch(repo_name) if PREFETCH_ENABLED else 'disabled'
+    return jsonify({'repo_name': repo_name, 'status': status}), 202
+
+def request_object(data):
+    """
+    Check that a decoded JSON request body is an object.
+    
+    Raises:
+        ValueError: If the body is missing or not a JSON object
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Request body must be a JSON object')
+    return data
+
+def text_field(data, name):
+    """
+    Read an optional string field from a request body, stripped of whitespace.
+    
+    Raises:
+        ValueError: If the field is present but not a string
+    """
+    value = data.get(name, '')
+    if not isinstance(value, str):
+        raise ValueError(f'{name} must be a string')
+    return value.strip()
+
+def parse_proposal_request(data):
+    """
+    Validate a proposal request body.
+    
+    Returns:
+        Tuple of (Proposal, repository name)
+        
+    Raises:
+        ValueError: With a user-facing message if any field is invalid
+    """
+    # Extract data
+    data = request_object(data)
+    title = text_field(data, 'title')
+    description = text_field(data, 'description')
+    conclusions = text_field(data, 'conclusions')
+    repo_name = text_field(data, 'repo_name')
+    
+    # Validate inputs
+    if not all([title, description, conclusions, repo_name]):
+        raise ValueError('All fields are required')
+    
+    # Validate and sanitize proposal data
+    try:
+        clean_title, clean_description, clean_conclusions = validate_and_sanitize_proposal(
+            title, description, conclusions
+        )
+    except ValueError as e:
+        raise ValueError(f'Validation Error: {str(e)}')
+    
+    # Validate repository name
+    validate_github_repo_name(repo_name)
+    
+    # Create proposal instance
+    proposal = Proposal(title=clean_title, description=clean_description, conclusions=clean_conclusions)
+    
+    if not proposal.is_valid():
+        raise ValueError('Invalid proposal data')
+    
+    return proposal, repo_name
+
+def create_proposal_generator():
+    """Create a ProposalGenerator backed by the shared render cache when enabled."""
+    return ProposalGenerator(render_cache=get_render_cache() if RENDER_CACHE_ENABLED else None)
+
+def github_error_status(error):
+    """Map a GitHubAPIError to the HTTP status returned to clients."""
+    if isinstance(error, GitHubRateLimitError):
+        return 429
+    if isinstance(error, GitHubCircuitOpenError):
+        return 503
+    return 400
+
+def repository_metadata(github_project, details):
+    """
+    Build proposal response metadata for a repository.
+    
+    Args:
+        github_project: The GitHubProject the proposal is rendered for
+        details: Repository details (see get_project_details); only 'languages'
+            and 'has_readme' are used, so a prefetched project is never reported
+            in place of a newer one
+    """
+    return {
+        'project_name': github_project.full_name,
+        'project_url': github_project.html_url,
+        'topics': list(github_project.topics),
+        'languages': details['languages'],
+        'has_readme': details['has_readme']
+    }
+
+async def build_proposal(proposal, repo_name, progress=None):
+    """
+    Generate a proposal for a repository.
+    
+    The repository metadata is fetched first (usually answered by the metadata
+    cache), since its version decides whether a repeat of an earlier submission
+    can be served from the render cache. Otherwise README presence and the
+    language breakdown are taken from a recent prefetch (see /api/prefetch-repo)
+    or fetched concurrently, and the proposal is rendered.
+    
+    Args:
+        proposal: Validated Proposal
+        repo_name: Repository name in format 'owner/repo'
+        progress: Optional callback receiving (fraction, stage) as work proceeds
+        
+    Returns:
+        Response body with 'success', 'proposal' and 'metadata'
+        
+    Raises:
+        GitHubAPIError: If the repository cannot be fetched
+    """
+    progress = progress or (lambda fraction, stage: None)
+    
+    # Fetch GitHub project data (usually answered by the metadata cache)
+    progress(0.1, 'fetching repository')
+    github_api = get_github_api()
+    async_api = get_async_github_api(github_api)
+    github_project = await async_api.get_project(repo_name)
+    repo_version = github_api.get_repository_version(github_project, repo_name)
+    
+    proposal_generator = create_proposal_generator()
+    cached = proposal_generator.lookup(proposal, github_project, repo_version)
+    if cached is not None:
+        metadata = cached.metadata
+    else:
+        progress(0.3, 'fetching README and languages')
+        details = get_prefetcher(github_api).get_details(repo_name) if PREFETCH_ENABLED else None
+        if details is None:
+            has_readme, languages = await asyncio.gather(
+                async_api.has_repository_readme(repo_name),
+                async_api.fetch_repository_languages(repo_name)
             )
-        except ValueError as e:
-            return jsonify({'error': f'Validation Error: {str(e)}'}), 400
-        
-        # Validate repository name
+            details = {'has_readme': has_readme, 'languages': languages}
+        metadata = repository_metadata(github_project, details)
+    
+    # Generate proposal
+    progress(0.8, 'rendering proposal')
+    generated_proposal = proposal_generator.generate(proposal, github_project, repo_version, metadata)
+    
+    return {
+        'success': True,
+        'proposal': generated_proposal,
+        'metadata': {'generated_at': datetime.now().isoformat(), **metadata, 'cached': cached is not None}
+    }
+
+@app.route('/api/generate-proposal', methods=['POST'])
+async def generate_proposal():
+    """Generate proposal based on user input and GitHub project (see build_proposal)."""
+    try:
         try:
-            validate_github_repo_name(repo_name)
+            proposal, repo_name = parse_proposal_request(request.get_json())
         except ValueError as e:
             return jsonify({'error': str(e)}), 400
         
-        # Create proposal instance
-        proposal = Proposal(title=clean_title, description=clean_description, conclusions=clean_conclusions)
-        
-        if not proposal.is_valid():
-            return jsonify({'error': 'Invalid proposal data'}), 400
-        
-        # Fetch GitHub project data
-        github_api = GitHubAPI()
-        project_data = github_api.fetch_project_data(repo_name)
-        github_project = GitHubProject.from_api_response(project_data)
-        
-        # Generate proposal
-        proposal_generator = ProposalGenerator()
-        generated_proposal = proposal_generator.generate(proposal, github_project)
-        
-        return jsonify({
-            'success': True,
-            'proposal': generated_proposal,
-            'metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'project_name': github_project.full_name,
-                'project_url': github_project.html_url
-            }
-        })
+        return jsonify(await build_proposal(proposal, repo_name))
         
     except GitHubAPIError as e:
-        return jsonify({'error': f'GitHub API Error: {str(e)}'}), 400
+        return jsonify({'error': f'GitHub API Error: {str(e)}'}), github_error_status(e)
+    except Exception as e:
+        return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
+
+def sse_event(event, data):
+    """Format one Server-Sent Events message with a JSON payload."""
+    return f"event: {event}\ndata: {json_backend.dumps(data)}\n\n"
+
+@app.route('/api/generate-proposal/stream', methods=['POST'])
+def generate_proposal_stream():
+    """
+    Generate a proposal as a Server-Sent Events stream.
+    
+    Emits 'status' immediately, 'project' once repository metadata is available,
+    one 'section' per proposal section as it is rendered, and finally 'done' with
+    the metadata (or 'error' if generation fails mid-stream).
+    
+    Renderings are served from and stored in the render cache like those of
+    build_proposal. The README and languages are not fetched before streaming;
+    they are only included (and the rendering only cached) when a recent
+    prefetch or an earlier rendering supplies them.
+    """
+    try:
+        proposal, repo_name = parse_proposal_request(request.get_json())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
+    
+    def events():
+        yield sse_event('status', {'stage': 'fetching', 'repo_name': repo_name})
+        try:
+            github_api = get_github_api()
+            github_project = github_api.get_project(repo_name)
+            yield sse_event('project', {
+                'full_name': github_project.full_name,
+                'url': github_project.html_url
+            })
+            
+            proposal_generator = create_proposal_generator()
+            repo_version = github_api.get_repository_version(github_project, repo_name)
+            cached = proposal_generator.lookup(proposal, github_project, repo_version)
+            details = None
+            if cached is None and PREFETCH_ENABLED:
+                details = get_prefetcher(github_api).get_details(repo_name)
+            if cached is not None:
+                metadata = cached.metadata
+            elif details is not None:
+                metadata = repository_metadata(github_project, details)
+            else:
+                metadata = None
+            
+            for section in proposal_generator.generate_stream(proposal, github_project,
+                                                              repo_version, metadata):
+                yield sse_event('section', {'text': section})
+            
+            yield sse_event('done', {
+                'generated_at': datetime.now().isoformat(),
+                'project_name': github_project.full_name,
+                'project_url': github_project.html_url,
+                **(metadata or {}),
+                'cached': cached is not None
+            })
+        except GitHubAPIError as e:
+            yield sse_event('error', {'error': f'GitHub API Error: {str(e)}', 'status': github_error_status(e)})
+        except Exception as e:
+            yield sse_event('error', {'error': f'Unexpected error: {str(e)}', 'status': 500})
+    
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
 
 @app.route('/api/save-proposal', methods=['POST'])
 def save_proposal():
@@ -176,101 +520,201 @@ def health_check():
         'timestamp': datetime.now().isoformat()
     })
 
+@app.route('/api/stats')
+def stats():
+    """Runtime statistics for the shared GitHub client."""
+    github_api = get_github_api()
+    return jsonify({
+        'github_pool': github_api.get_pool_stats(),
+        'http_cache': github_api.http_cache.get_stats() if github_api.http_cache is not None else None,
+        'project_cache': github_api.project_cache.get_stats() if github_api.project_cache is not None else None,
+        'rate_limits': github_api.rate_limiter.get_stats(),
+        'retries': github_api.retry_policy.get_stats(),
+        'circuit_breaker': github_api.circuit_breaker.get_stats(),
+        'single_flight': github_api.single_flight.get_stats(),
+        'search': get_search_service().get_stats(),
+        'render_cache': get_render_cache().get_stats() if RENDER_CACHE_ENABLED else None,
+        'prefetch': get_prefetcher(github_api).get_stats() if PREFETCH_ENABLED else None,
+        'jobs': get_proposal_job_queue().get_stats(),
+        'timestamp': datetime.now().isoformat()
+    })
+
+# Repository fields the search endpoint returns; the rest of each item is dropped
+SEARCH_RESULT_FIELDS = ('name', 'full_name', 'description', 'language', 'stargazers_count',
+                        'forks_count', 'open_issues_count', 'html_url', 'updated_at', 'topics')
+
+def parse_search_request(data):
+    """
+    Validate a repository search request body.
+    
+    Returns:
+        Dictionary of title, description, conclusions, language and page
+        
+    Raises:
+        ValueError: With a user-facing message if the request is invalid
+    """
+    # Extract search criteria from proposal
+    data = request_object(data)
+    criteria = {
+        'title': text_field(data, 'title'),
+        'description': text_field(data, 'description'),
+        'conclusions': text_field(data, 'conclusions'),
+        'language': text_field(data, 'language')
+    }
+    
+    if not any([criteria['title'], criteria['description'], criteria['conclusions']]):
+        raise ValueError('At least one field is required for search')
+    
+    try:
+        criteria['page'] = int(data.get('page', 1))
+    except (TypeError, ValueError):
+        criteria['page'] = 0
+    if criteria['page'] < 1:
+        raise ValueError('page must be a positive integer')
+    return criteria
+
+def search_proposal_repositories(criteria):
+    """
+    Search repositories matching a proposal.
+    
+    Args:
+        criteria: Output of parse_search_request
+        
+    Returns:
+        Response body with 'success', 'repositories' and paging details
+        
+    Raises:
+        ValueError: If the proposal yields no search terms
+        GitHubAPIError: If the search fails
+    """
+    results = get_search_service().search_proposal(
+        criteria['title'], criteria['description'], criteria['conclusions'], criteria['language'],
+        page=criteria['page'], per_page=10, fields=SEARCH_RESULT_FIELDS
+    )
+    
+    repositories = []
+    for repo in results['items']:
+        repo_info = {
+            'name': repo['name'],
+            'full_name': repo['full_name'],
+            'description': repo['description'] or 'No description available',
+            'language': repo['language'],
+            'stars': repo['stargazers_count'],
+            'forks': repo['forks_count'],
+            'issues': repo['open_issues_count'],
+            'url': repo['html_url'],
+            'updated_at': repo['updated_at'],
+            'topics': repo['topics'] or []
+        }
+        repositories.append(repo_info)
+    
+    return {
+        'success': True,
+        'repositories': repositories,
+        'search_query': results['query'],
+        'total_count': results['total_count'],
+        'page': results['page'],
+        'has_more': results['has_more'],
+        'source': results['source']
+    }
+
 @app.route('/api/search-repositories', methods=['POST'])
 def search_repositories():
     """Search GitHub repositories based on proposal content."""
     try:
-        data = request.get_json()
-        
-        # Extract search criteria from proposal
-        title = data.get('title', '').strip()
-        description = data.get('description', '').strip()
-        conclusions = data.get('conclusions', '').strip()
-        language = data.get('language', '').strip()
-        
-        if not any([title, description, conclusions]):
-            return jsonify({'error': 'At least one field is required for search'}), 400
-        
-        # Build search query
-        search_terms = []
-        if title:
-            search_terms.extend(title.split()[:3])  # Take first 3 words from title
-        if description:
-            search_terms.extend(description.split()[:5])  # Take first 5 words from description
-        if conclusions:
-            # Extract key terms from conclusions
-            conclusion_words = conclusions.replace('\n', ' ').replace(';', ' ').split()
-            search_terms.extend(conclusion_words[:3])
-        
-        # Remove common words and duplicates
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'}
-        search_terms = list(set([term.lower().strip('.,!?;:') for term in search_terms if len(term) > 2 and term.lower() not in stop_words]))
-        
-        if not search_terms:
-            return jsonify({'error': 'No valid search terms found in proposal'}), 400
-        
-        # Construct GitHub search API query
-        query = ' '.join(search_terms[:5])  # Limit to 5 terms
-        if language:
-            query += f' language:{language}'
-        
-        # Add additional filters for better results
-        query += ' stars:>10 forks:>2'  # Only repos with some community engagement
-        
-        # Search GitHub repositories
-        github_api = GitHubAPI()
-        search_url = f"{github_api.base_url}/search/repositories"
-        
-        params = {
-            'q': query,
-            'sort': 'stars',
-            'order': 'desc',
-            'per_page': 10
-        }
-        
-        headers = {}
-        if github_api.api_key and github_api.api_key != "your_api_key_here":
-            headers['Authorization'] = f'token {github_api.api_key}'
-        headers['Accept'] = 'application/vnd.github.v3+json'
-        
-        response = requests.get(search_url, params=params, headers=headers, timeout=30)
+        try:
+            results = search_proposal_repositories(parse_search_request(request.get_json()))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        if response.status_code == 200:
-            search_results = response.json()
-            repositories = []
-            
-            for repo in search_results.get('items', [])[:10]:  # Limit to top 10 results
-                repo_info = {
-                    'name': repo['name'],
-                    'full_name': repo['full_name'],
-                    'description': repo['description'] or 'No description available',
-                    'language': repo['language'],
-                    'stars': repo['stargazers_count'],
-                    'forks': repo['forks_count'],
-                    'issues': repo['open_issues_count'],
-                    'url': repo['html_url'],
-                    'updated_at': repo['updated_at'],
-                    'topics': repo.get('topics', [])
-                }
-                repositories.append(repo_info)
-            
-            return jsonify({
-                'success': True,
-                'repositories': repositories,
-                'search_query': query,
-                'total_count': min(search_results.get('total_count', 0), 1000)  # GitHub limits results
-            })
+        return jsonify(results)
         
-        elif response.status_code == 403:
-            return jsonify({'error': 'GitHub API rate limit exceeded. Please try again later.'}), 429
-        else:
-            return jsonify({'error': f'GitHub search failed with status {response.status_code}'}), 400
-            
+    except GitHubRateLimitError as e:
+        return jsonify({'error': str(e)}), 429
+    except GitHubCircuitOpenError as e:
+        return jsonify({'error': str(e)}), 503
+    except GitHubAPIError as e:
+        return jsonify({'error': str(e)}), 400
     except requests.exceptions.RequestException as e:
         return jsonify({'error': f'Network error during search: {str(e)}'}), 500
     except Exception as e:
         return jsonify({'error': f'Unexpected error during search: {str(e)}'}), 500
 
+def run_generate_job(payload, progress):
+    """Job handler: generate a proposal on a worker thread (in its own event loop)."""
+    return asyncio.run(build_proposal(payload['proposal'], payload['repo_name'], progress))
+
+def run_search_job(payload, progress):
+    """Job handler: search repositories on a worker thread."""
+    progress(0.1, 'searching repositories')
+    return search_proposal_repositories(payload)
+
+# Work that can be run in the background through /api/jobs
+JOB_HANDLERS = {
+    'generate-proposal': run_generate_job,
+    'search-repositories': run_search_job
+}
+
+def get_proposal_job_queue():
+    """Get the shared job queue with this app's handlers registered."""
+    queue = get_job_queue()
+    for kind, handler in JOB_HANDLERS.items():
+        queue.register(kind, handler)
+    return queue
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """
+    Run a proposal generation or repository search in the background.
+    
+    The body names the job ``kind`` ('generate-proposal' or
+    'search-repositories') and carries the usual request body of that endpoint
+    as ``payload``. Answers 202 with the job id and a status URL to poll, or 429
+    with Retry-After when the queue is full.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    kind = data.get('kind', '')
+    payload = data.get('payload', {})
+    
+    if not isinstance(kind, str) or kind not in JOB_HANDLERS:
+        return jsonify({'error': f"Unknown job kind '{kind}'; expected one of: {', '.join(JOB_HANDLERS)}"}), 400
+    if not isinstance(payload, dict):
+        return jsonify({'error': 'payload must be a JSON object'}), 400
+    
+    # Validate up front so bad input fails now rather than in the job
+    try:
+        if kind == 'generate-proposal':
+            proposal, repo_name = parse_proposal_request(payload)
+            payload = {'proposal': proposal, 'repo_name': repo_name}
+        else:
+            payload = parse_search_request(payload)
+    except (TypeError, AttributeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        job = get_proposal_job_queue().submit(kind, payload)
+    except JobQueueFull as e:
+        response = jsonify({'error': str(e)})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 429
+    
+    status_url = url_for('get_job', job_id=job['id'])
+    response = jsonify({'job_id': job['id'], 'status': job['status'], 'status_url': status_url})
+    response.headers['Location'] = status_url
+    return response, 202
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """Get the status, progress and (once finished) result or error of a job."""
+    job = get_proposal_job_queue().get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found or expired'}), 404
+    response = jsonify(job_status(job))
+    response.cache_control.no_store = True
+    return response
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
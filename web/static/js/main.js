@@ -1,11 +1,17 @@
 // GitHub Proposal Generator - Frontend JavaScript
 
+// Same rule as validate_github_repo_name on the server
+const REPO_NAME_PATTERN = /^[a-zA-Z0-9._-]+\/[a-zA-Z0-9._-]+$/;
+const PREFETCH_DELAY_MS = 300;
+
 class ProposalGenerator {
   constructor() {
     this.currentStep = 1;
     this.maxSteps = 2;
     this.selectedRepository = null;
     this.searchResults = [];
+    this.prefetched = new Set();
+    this.prefetchTimer = null;
     this.init();
   }
 
@@ -227,6 +233,10 @@ class ProposalGenerator {
             ${topicsHtml}
         `;
 
+    // Warm the server cache while the user is looking at a repository
+    card.addEventListener('mouseenter', () => this.schedulePrefetch(repo.full_name));
+    card.addEventListener('mouseleave', () => clearTimeout(this.prefetchTimer));
+
     // Add click handler
     card.addEventListener('click', (e) => {
       // Don't trigger if clicking the external link
@@ -249,6 +259,8 @@ class ProposalGenerator {
 
     // Store selected repository
     this.selectedRepository = repo;
+    clearTimeout(this.prefetchTimer);
+    this.prefetchRepository(repo.full_name);
 
     // Display selected repository info
     this.displaySelectedRepository(repo);
@@ -257,6 +269,30 @@ class ProposalGenerator {
     document.getElementById('generateProposal').disabled = false;
   }
 
+  schedulePrefetch(fullName) {
+    clearTimeout(this.prefetchTimer);
+    this.prefetchTimer = setTimeout(() => this.prefetchRepository(fullName), PREFETCH_DELAY_MS);
+  }
+
+  prefetchRepository(fullName) {
+    if (!fullName || !REPO_NAME_PATTERN.test(fullName) || this.prefetched.has(fullName)) return;
+    this.prefetched.add(fullName);
+
+    // Fire and forget: the server answers at once and fetches in the background
+    fetch('/api/prefetch-repo', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ repo_name: fullName })
+    }).then(response => response.json()).then(data => {
+      // Let a later hover retry prefetches the server had no room for
+      if (data.status === 'skipped') this.prefetched.delete(fullName);
+    }).catch(() => {
+      this.prefetched.delete(fullName);
+    });
+  }
+
   displaySelectedRepository(repo) {
     document.getElementById('selectedRepoName').textContent = repo.full_name;
     document.getElementById('selectedRepoDescription').textContent = repo.description;
@@ -341,22 +377,10 @@ class ProposalGenerator {
     this.showLoading('Generating your proposal...');
 
     try {
-      const response = await fetch('/api/generate-proposal', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify(formData)
-      });
-
-      const data = await response.json();
-
-      if (response.ok && data.success) {
-        this.displayProposal(data.proposal, data.metadata);
-        this.updateProgressIndicator(3); // Move to step 3 (completed)
-        this.showToast('Proposal generated successfully!', 'success');
+      if (window.ReadableStream && window.TextDecoder) {
+        await this.generateProposalStream(formData);
       } else {
-        this.showToast(data.error || 'Failed to generate proposal', 'error');
+        await this.generateProposalJson(formData);
       }
     } catch (error) {
       console.error('Generation error:', error);
@@ -366,6 +390,84 @@ class ProposalGenerator {
     }
   }
 
+  async generateProposalJson(formData) {
+    const response = await fetch('/api/generate-proposal', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify(formData)
+    });
+
+    const data = await response.json();
+
+    if (response.ok && data.success) {
+      this.displayProposal(data.proposal, data.metadata);
+      this.updateProgressIndicator(3); // Move to step 3 (completed)
+      this.showToast('Proposal generated successfully!', 'success');
+    } else {
+      this.showToast(data.error || 'Failed to generate proposal', 'error');
+    }
+  }
+
+  async generateProposalStream(formData) {
+    const response = await fetch('/api/generate-proposal/stream', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Accept': 'text/event-stream'
+      },
+      body: JSON.stringify(formData)
+    });
+
+    const contentType = response.headers.get('Content-Type') || '';
+    if (!response.ok || !contentType.includes('text/event-stream') || !response.body) {
+      const data = await response.json();
+      this.showToast(data.error || 'Failed to generate proposal', 'error');
+      return;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let content = '';
+
+    // Render each section as soon as it arrives
+    const handleEvent = (event, data) => {
+      if (event === 'section') {
+        content += data.text;
+        this.displayProposal(content, null);
+        this.hideLoading();
+      } else if (event === 'done') {
+        this.displayProposal(content, data);
+        this.updateProgressIndicator(3); // Move to step 3 (completed)
+        this.showToast('Proposal generated successfully!', 'success');
+      } else if (event === 'error') {
+        this.showToast(data.error || 'Failed to generate proposal', 'error');
+      }
+    };
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const message = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        let event = 'message';
+        let data = '';
+        message.split('\n').forEach(line => {
+          if (line.startsWith('event: ')) event = line.slice(7);
+          else if (line.startsWith('data: ')) data += line.slice(6);
+        });
+        if (data) handleEvent(event, JSON.parse(data));
+      }
+    }
+  }
+
   displayProposal(proposalContent, metadata) {
     // Format proposal content for better display
     const proposalElement = document.getElementById('proposalContent');
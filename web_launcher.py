@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """
 Web launcher for GitHub Proposal Generator
+
+By default the Flask development server is started and a browser is opened.
+With --production (or --workers/--threads) the app is served by gunicorn,
+or by waitress where gunicorn is unavailable (e.g. on Windows).
 """
 
+import argparse
 import sys
 import os
 import webbrowser
@@ -13,35 +18,206 @@ from threading import Timer
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.join(current_dir, 'src'))
 
-def open_browser():
+from config.settings import (
+    WEB_HOST, WEB_PORT, WEB_SERVER, WEB_WORKERS, WEB_THREADS, WEB_TIMEOUT, WEB_GRACEFUL_TIMEOUT
+)
+
+
+def default_workers():
+    """Worker processes for the CPU count, following gunicorn's (2 x CPUs) + 1 guideline."""
+    return (os.cpu_count() or 1) * 2 + 1
+
+
+def create_parser():
+    """Create command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Launch the GitHub Proposal Generator web interface",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python web_launcher.py
+  python web_launcher.py --production
+  python web_launcher.py --workers 4 --threads 8 --port 8000
+        """
+    )
+    parser.add_argument('--host', default=WEB_HOST, help=f'Interface to bind (default: {WEB_HOST})')
+    parser.add_argument('--port', type=int, default=WEB_PORT, help=f'Port to bind (default: {WEB_PORT})')
+    parser.add_argument(
+        '--production',
+        action='store_true',
+        help='Serve with a production WSGI server instead of the development server'
+    )
+    parser.add_argument(
+        '--server',
+        choices=['auto', 'gunicorn', 'waitress'],
+        default=WEB_SERVER,
+        help='Production server; auto prefers gunicorn and falls back to waitress'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Worker processes (default: 2 x CPU count + 1; implies --production)'
+    )
+    parser.add_argument(
+        '--threads',
+        type=int,
+        help=f'Threads per worker (default: {WEB_THREADS}; implies --production)'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=int,
+        default=WEB_TIMEOUT,
+        help=f'Seconds before a silent worker is restarted (default: {WEB_TIMEOUT})'
+    )
+    parser.add_argument(
+        '--graceful-timeout',
+        type=int,
+        default=WEB_GRACEFUL_TIMEOUT,
+        help=f'Seconds workers get to finish requests on reload or stop (default: {WEB_GRACEFUL_TIMEOUT})'
+    )
+    parser.add_argument('--no-browser', action='store_true', help='Do not open a browser')
+    return parser
+
+
+def resolve_server(preferred):
+    """
+    Pick the production server to use.
+
+    Args:
+        preferred: 'gunicorn', 'waitress' or 'auto'
+
+    Returns:
+        Name of an importable server
+
+    Raises:
+        ImportError: If the requested (or, for auto, any) server is not installed
+    """
+    candidates = ['gunicorn', 'waitress'] if preferred == 'auto' else [preferred]
+    for name in candidates:
+        try:
+            __import__(name)
+            return name
+        except ImportError:
+            continue
+    raise ImportError(f"No production server available (tried: {', '.join(candidates)})")
+
+
+def gunicorn_options(args):
+    """Build gunicorn settings from parsed arguments."""
+    workers = args.workers or WEB_WORKERS or default_workers()
+    threads = args.threads or WEB_THREADS
+    return {
+        'bind': f'{args.host}:{args.port}',
+        'workers': workers,
+        'threads': threads,
+        'worker_class': 'gthread' if threads > 1 else 'sync',
+        # Import the app once in the master so workers fork with it loaded
+        'preload_app': True,
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'keepalive': 5,
+        'accesslog': '-',
+        'post_fork': _post_fork
+    }
+
+
+def _post_fork(server, worker):
+    """Give each worker its own GitHub client rather than one inherited from the master."""
+    from services.github_api import reset_github_api
+    reset_github_api()
+
+
+def run_gunicorn(app, options):
+    """
+    Serve the app with gunicorn.
+
+    SIGHUP restarts workers gracefully, but as the app is preloaded they keep the
+    code the master loaded; SIGUSR2 starts a new master running the current code.
+    """
+    from gunicorn.app.base import BaseApplication
+
+    class ProposalApplication(BaseApplication):
+        def __init__(self, application, settings):
+            self.application = application
+            self.settings = settings
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.settings.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    print(f"🔄 Restart workers: kill -HUP {os.getpid()} (same code)")
+    print(f"🆕 Load new code: kill -USR2 {os.getpid()}, then kill -TERM {os.getpid()}")
+    ProposalApplication(app, options).run()
+
+
+def run_waitress(app, args):
+    """Serve the app with waitress (single process, multi-threaded)."""
+    from waitress import serve
+    threads = (args.workers or 1) * (args.threads or WEB_THREADS)
+    if args.workers and args.workers > 1:
+        print(f"ℹ️  waitress runs a single process; using {threads} threads instead of {args.workers} workers")
+    serve(app, host=args.host, port=args.port, threads=threads, channel_timeout=args.timeout)
+
+
+def open_browser(port=WEB_PORT):
     """Open browser after a short delay."""
-    webbrowser.open('http://localhost:5000')
+    webbrowser.open(f'http://localhost:{port}')
+
+
+def run_production(app, args):
+    """Serve the app with a production WSGI server."""
+    server = resolve_server(args.server)
+    print(f"🏭 Production mode: {server}")
+    print(f"📡 Server running at: http://{args.host}:{args.port}")
+    print("=" * 60)
+    if server == 'gunicorn':
+        options = gunicorn_options(args)
+        print(f"👷 {options['workers']} workers x {options['threads']} threads (app preloaded)")
+        run_gunicorn(app, options)
+    else:
+        run_waitress(app, args)
+
 
 def main():
     """Main web launcher function."""
+    args = create_parser().parse_args()
+    production = args.production or args.workers is not None or args.threads is not None
+
     print("🚀 Starting GitHub Proposal Generator Web Interface...")
     print("=" * 60)
-    
+
     try:
         # Import and run the Flask app
         from web.app import app
-        
-        # Open browser after 2 seconds
-        timer = Timer(2.0, open_browser)
-        timer.start()
-        
-        print("🌐 Web interface will open in your browser automatically")
-        print("📡 Server running at: http://localhost:5000")
+
+        if production:
+            run_production(app, args)
+            return
+
+        if not args.no_browser:
+            # Open browser after 2 seconds
+            timer = Timer(2.0, open_browser, args=(args.port,))
+            timer.start()
+            print("🌐 Web interface will open in your browser automatically")
+
+        print(f"📡 Server running at: http://localhost:{args.port}")
         print("⏹️  Press Ctrl+C to stop the server")
+        print("💡 Use --production for multi-worker serving")
         print("=" * 60)
-        
+
         # Start the Flask development server
-        app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
-        
+        app.run(debug=False, host=args.host, port=args.port, use_reloader=False)
+
     except ImportError as e:
-        print(f"❌ Error importing Flask modules: {e}")
+        print(f"❌ Error importing server modules: {e}")
         print("💡 Please install the required dependencies:")
         print("   pip install -r requirements.txt")
+        if production:
+            print("   pip install gunicorn   (or: pip install waitress on Windows)")
         sys.exit(1)
     except KeyboardInterrupt:
         print("\n\n👋 Web server stopped by user.")